@@ -0,0 +1,439 @@
+# benchmarks/api_calls.py
+"""
+End-to-end benchmark of the public client methods against the local mock API.
+
+Starts `damoov_admin.testing` in its own process, then runs every scenario in a
+fresh interpreter so peak RSS is per scenario. Each scenario reports throughput
+(calls/s), p50/p99 latency of one call, upstream requests per call (catches paging,
+refresh and retry regressions), peak traced memory and memory blocks retained
+per call, and the process's peak RSS. Scenarios cover sequential calls, the bulk
+helpers and the asyncio clients; the one tagged [401] has its access token
+invalidated every tenth call, those tagged [faults] run with injected 429s and 503s.
+
+Every scenario also checks correctness: each call must return data, not an error
+body, and the upstream requests must add up exactly. Each endpoint gets the
+scenario's expected requests per call, plus one retry per injected fault. Every 401
+causes exactly one token refresh, and no call logs in again. A scenario failing a
+check is reported as FAILED and the benchmark exits with status 1.
+
+    python benchmarks/api_calls.py [--calls 200] [--latency-ms 2] [--concurrency 16]
+                                   [--only trips] [--json results.json]
+"""
+import argparse
+import asyncio
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+START, END = '2024-01-01', '2024-01-14'
+LONG_END = '2024-03-31'
+
+# Runs each scenario is measured with in the memory pass, which tracemalloc slows down
+MEMORY_RUNS = 5
+
+
+# Scenarios: name -> (mode, calls covered by one run, mock settings, factory, expected upstream
+# requests per call by endpoint). A factory takes the context and returns a function running
+# one call (or one batch).
+
+def _sequential(method, *args, **kwargs):
+    def factory(ctx):
+        target = getattr(ctx.client(method.split('.')[0]), method.split('.')[1])
+        return lambda i: target(*(arg(i) if callable(arg) else arg for arg in args), **kwargs)
+    return factory
+
+
+def _user(i):
+    return f'user{i % 50}'
+
+
+def _trip_ids(ctx):
+    listing = ctx.client('trips').get_list_trips('user0', START, LONG_END)
+    return [trip['Id'] for trip in listing.trips]
+
+
+def _trip_details(ctx):
+    trip_ids = _trip_ids(ctx)
+    trips = ctx.client('trips')
+    return lambda i: trips.get_trip_details(trip_ids[i % len(trip_ids)], 'user0', include_waypoints=True,
+                                            include_events=True)
+
+
+def _iter_trips(ctx):
+    trips = ctx.client('trips')
+    return lambda i: sum(1 for _ in trips.iter_trips(_user(i), START, LONG_END))
+
+
+def _statistics_bulk(ctx):
+    stats = ctx.client('statistics')
+    users = [_user(i) for i in range(ctx.batch)]
+    return lambda i: stats.bulk('user_daily_statistics', users, START, END, max_workers=ctx.concurrency)
+
+
+def _trip_details_many(ctx):
+    trip_ids = _trip_ids(ctx)[:ctx.batch]
+    trips = ctx.client('trips')
+    return lambda i: list(trips.get_trip_details_many(trip_ids, 'user0', include_waypoints=True,
+                                                      max_workers=ctx.concurrency))
+
+
+def _async(method, *args, **kwargs):
+    def factory(ctx):
+        target = getattr(ctx.async_client(method.split('.')[0]), method.split('.')[1])
+        return lambda i: target(*(arg(i) if callable(arg) else arg for arg in args), **kwargs)
+    return factory
+
+
+def _async_statistics_bulk(ctx):
+    stats = ctx.async_client('statistics')
+    users = [_user(i) for i in range(ctx.batch)]
+    return lambda i: stats.bulk('user_daily_statistics', users, START, END, max_workers=ctx.concurrency)
+
+
+def _expiring(factory, every=10):
+    """Invalidates the mock's access tokens before every `every`-th call, so that call gets one 401."""
+    def wrapped(ctx):
+        call = factory(ctx)
+
+        def run(i):
+            if i % every == every - 1:
+                control(ctx.url, 'expire', {})
+                ctx.expiries += 1
+            return call(i)
+        return run
+    return wrapped
+
+
+FAULTS = {'throttle_rate': 0.05, 'error_rate': 0.05}
+
+# Upstream requests one call needs: 14 days fit one window, 90 days take 7, and the
+# mock's 2 trips a day fit one page per window
+ONE_STATISTICS = {'statistics': 1}
+WINDOWED_STATISTICS = {'statistics': 7}
+
+SCENARIOS = {
+    'statistics.user_daily_statistics': ('sequential', 1, {}, _sequential('statistics.user_daily_statistics', _user, START, END), ONE_STATISTICS),
+    'statistics.user_daily_statistics 90d': ('sequential', 1, {}, _sequential('statistics.user_daily_statistics', _user, START, LONG_END), WINDOWED_STATISTICS),
+    'statistics.user_daily_safetyscore': ('sequential', 1, {}, _sequential('statistics.user_daily_safetyscore', _user, START, END), ONE_STATISTICS),
+    'statistics.user_daily_ecoscore': ('sequential', 1, {}, _sequential('statistics.user_daily_ecoscore', _user, START, END), ONE_STATISTICS),
+    'statistics.user_accumulated_statistics': ('sequential', 1, {}, _sequential('statistics.user_accumulated_statistics', _user, START, END), ONE_STATISTICS),
+    'statistics.user_accumulated_safetyscore': ('sequential', 1, {}, _sequential('statistics.user_accumulated_safetyscore', _user, START, END), ONE_STATISTICS),
+    'statistics.user_accumulated_ecoscore': ('sequential', 1, {}, _sequential('statistics.user_accumulated_ecoscore', _user, START, END), ONE_STATISTICS),
+    'statistics.entity_daily_statistics': ('sequential', 1, {}, _sequential('statistics.entity_daily_statistics', START, END, company_id='c1'), ONE_STATISTICS),
+    'statistics.entity_accumulated_statistics': ('sequential', 1, {}, _sequential('statistics.entity_accumulated_statistics', START, END, company_id='c1'), ONE_STATISTICS),
+    'statistics.entity_safety_score': ('sequential', 1, {}, _sequential('statistics.entity_safety_score', START, END, company_id='c1'), ONE_STATISTICS),
+    'statistics.entity_accumulated_ecoscore': ('sequential', 1, {}, _sequential('statistics.entity_accumulated_ecoscore', START, END, company_id='c1'), ONE_STATISTICS),
+    'statistics.lastupdates': ('sequential', 1, {}, _sequential('statistics.lastupdates', _user), ONE_STATISTICS),
+    'statistics.uniquetags': ('sequential', 1, {}, _sequential('statistics.uniquetags', _user, START, END), ONE_STATISTICS),
+    'trips.get_list_trips': ('sequential', 1, {}, _sequential('trips.get_list_trips', _user, START, END), {'trips': 1}),
+    'trips.get_list_trips 90d': ('sequential', 1, {}, _sequential('trips.get_list_trips', _user, START, LONG_END), {'trips': 7}),
+    'trips.iter_trips 90d': ('sequential', 1, {}, _iter_trips, {'trips': 7}),
+    'trips.get_trip_details': ('sequential', 1, {}, _trip_details, {'trip_details': 1}),
+    'users.create_user': ('sequential', 1, {}, _sequential('users.create_user', 'instance', 'key', FirstName='Bench'), {'users': 1}),
+    'users.update_user': ('sequential', 1, {}, _sequential('users.update_user', _user, FirstName='Bench'), {'users': 1}),
+    'users.delete_user': ('sequential', 1, {}, _sequential('users.delete_user', _user), {'users': 1}),
+    'engagement.get_user_leaderboard': ('sequential', 1, {}, _sequential('engagement.get_user_leaderboard', _user), {'leaderboard': 1}),
+    'engagement.get_general_leaderboard': ('sequential', 1, {}, _sequential('engagement.get_general_leaderboard', _user), {'leaderboard': 1}),
+    'statistics.user_daily_statistics [401]': ('sequential', 1, {}, _expiring(_sequential('statistics.user_daily_statistics', _user, START, END)), ONE_STATISTICS),
+    'trips.get_list_trips 90d [faults]': ('sequential', 1, FAULTS, _sequential('trips.get_list_trips', _user, START, LONG_END), {'trips': 7}),
+    'statistics.bulk': ('bulk', 'batch', {}, _statistics_bulk, ONE_STATISTICS),
+    'trips.get_trip_details_many': ('bulk', 'batch', {}, _trip_details_many, {'trip_details': 1}),
+    'statistics.bulk [faults]': ('bulk', 'batch', FAULTS, _statistics_bulk, ONE_STATISTICS),
+    'async statistics.user_daily_statistics': ('async', 1, {}, _async('statistics.user_daily_statistics', _user, START, END), ONE_STATISTICS),
+    'async trips.get_list_trips 90d': ('async', 1, {}, _async('trips.get_list_trips', _user, START, LONG_END), {'trips': 7}),
+    'async engagement.get_general_leaderboard': ('async', 1, {}, _async('engagement.get_general_leaderboard', _user), {'leaderboard': 1}),
+    'async statistics.bulk': ('async-bulk', 'batch', {}, _async_statistics_bulk, ONE_STATISTICS),
+}
+
+
+# Mock settings restored before each scenario, so a fault scenario cannot leak into the next
+BASELINE_SETTINGS = {'error_rate': 0.0, 'throttle_rate': 0.0, 'unauthorized_rate': 0.0}
+
+
+class Context:
+    """Clients for one scenario, all pointed at the mock API."""
+
+    def __init__(self, url, concurrency, batch, faults):
+        from damoov_admin.auth import TelematicsAuth
+        from damoov_admin.retry import RetryPolicy
+
+        self.url = url
+        self.concurrency = concurrency
+        self.batch = batch
+        # Token invalidations by the [401] scenario, each expected to cost one 401 and one refresh
+        self.expiries = 0
+        # Short backoff so fault scenarios measure the SDK, not the sleeps
+        self.retry_policy = RetryPolicy(backoff=0.005, max_backoff=0.05) if faults else None
+        self.auth = TelematicsAuth('bench@example.com', 'secret', pool_maxsize=concurrency,
+                                   retry_policy=self.retry_policy)
+        self.auth.throttle_retries = 10 if faults else self.auth.throttle_retries
+        self.async_auth = None
+        self._clients = {}
+
+    def client(self, name):
+        if name not in self._clients:
+            from damoov_admin import Engagement, Statistics, Trips, Users
+            cls = {'statistics': Statistics, 'trips': Trips, 'users': Users, 'engagement': Engagement}[name]
+            self._clients[name] = cls(self.auth)
+        return self._clients[name]
+
+    def async_client(self, name):
+        from damoov_admin.aio import AsyncEngagement, AsyncStatistics, AsyncTelematicsAuth, AsyncTrips, AsyncUsers
+
+        if self.async_auth is None:
+            self.async_auth = AsyncTelematicsAuth('bench@example.com', 'secret', limit=self.concurrency,
+                                                  retry_policy=self.retry_policy)
+        key = 'async ' + name
+        if key not in self._clients:
+            cls = {'statistics': AsyncStatistics, 'trips': AsyncTrips, 'users': AsyncUsers,
+                   'engagement': AsyncEngagement}[name]
+            self._clients[key] = cls(self.async_auth)
+        return self._clients[key]
+
+
+def control(url, name, payload=None):
+    data = json.dumps(payload).encode() if payload is not None else None
+    request = urllib.request.Request(f'{url}/_mock/{name}', data=data, method='POST' if data is not None else 'GET',
+                                     headers={'Content-Type': 'application/json'})
+    with urllib.request.urlopen(request) as response:
+        return json.loads(response.read())
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))]
+
+
+def run_child(args):
+    """Runs one scenario in this process and prints its results as JSON."""
+    from damoov_admin.testing import patch_urls
+
+    mode, per_run, settings, factory, expected = SCENARIOS[args.child]
+    per_run = args.batch if per_run == 'batch' else per_run
+    runs = max(1, args.calls // per_run)
+    with patch_urls(args.url):
+        ctx = Context(args.url, args.concurrency, args.batch, faults=bool(settings))
+        control(args.url, 'config', BASELINE_SETTINGS)
+        call = factory(ctx)
+        if mode.startswith('async'):
+            result = asyncio.run(_measure_async(ctx, call, mode, runs, args, settings))
+        else:
+            result = _measure(ctx, call, mode, runs, args, settings)
+        ctx.auth.transport.close()
+    check_requests(result.pop('counts'), result.pop('statuses'), expected, runs * per_run, ctx.expiries)
+    result.update(scenario=args.child, mode=mode, calls=runs * per_run,
+                  calls_per_s=runs * per_run / result.pop('elapsed'),
+                  peak_rss_mib=_peak_rss_mib())
+    result['requests_per_call'] = result.pop('requests') / (runs * per_run)
+    result['peak_kib_per_call'] /= per_run
+    result['blocks_per_call'] /= per_run
+    print(json.dumps(result))
+
+
+def _measure(ctx, call, mode, runs, args, settings):
+    # Warm-up logs in and opens the pooled connections outside the timed part
+    for i in range(min(3, runs)):
+        check_result(call(i))
+    control(args.url, 'config', settings)
+    ctx.expiries = 0
+    before = control(args.url, 'stats')
+    latencies = []
+    started = time.perf_counter()
+    for i in range(runs):
+        sent = time.perf_counter()
+        result = call(i)
+        latencies.append(time.perf_counter() - sent)
+        check_result(result)
+    elapsed = time.perf_counter() - started
+    counts, statuses = _stats_since(args.url, before)
+    control(args.url, 'config', BASELINE_SETTINGS)
+
+    peaks, blocks = [], []
+    tracemalloc.start()
+    for i in range(MEMORY_RUNS):
+        blocks_before = sys.getallocatedblocks()
+        traced_before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        result = call(i)
+        peaks.append(tracemalloc.get_traced_memory()[1] - traced_before)
+        blocks.append(sys.getallocatedblocks() - blocks_before)
+        del result
+    tracemalloc.stop()
+    return _summary(latencies, elapsed, counts, statuses, peaks, blocks)
+
+
+async def _measure_async(ctx, call, mode, runs, args, settings):
+    try:
+        for i in range(min(3, runs)):
+            check_result(await call(i))
+        control(args.url, 'config', settings)
+        ctx.expiries = 0
+        before = control(args.url, 'stats')
+        latencies = []
+
+        async def timed(i):
+            sent = time.perf_counter()
+            result = await call(i)
+            latencies.append(time.perf_counter() - sent)
+            check_result(result)
+
+        started = time.perf_counter()
+        if mode == 'async-bulk':
+            for i in range(runs):
+                await timed(i)
+        else:
+            # `concurrency` calls in flight at a time, like the sync bulk helpers' workers
+            semaphore = asyncio.Semaphore(args.concurrency)
+
+            async def bounded(i):
+                async with semaphore:
+                    await timed(i)
+            await asyncio.gather(*(bounded(i) for i in range(runs)))
+        elapsed = time.perf_counter() - started
+        counts, statuses = _stats_since(args.url, before)
+        control(args.url, 'config', BASELINE_SETTINGS)
+
+        peaks, blocks = [], []
+        tracemalloc.start()
+        for i in range(MEMORY_RUNS):
+            blocks_before = sys.getallocatedblocks()
+            traced_before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            result = await call(i)
+            peaks.append(tracemalloc.get_traced_memory()[1] - traced_before)
+            blocks.append(sys.getallocatedblocks() - blocks_before)
+            del result
+        tracemalloc.stop()
+        return _summary(latencies, elapsed, counts, statuses, peaks, blocks)
+    finally:
+        await ctx.async_auth.close()
+
+
+def _stats_since(url, before):
+    """Requests per endpoint and responses per status code served since the `before` stats."""
+    after = control(url, 'stats')
+    return ({key: value - before['counts'].get(key, 0) for key, value in after['counts'].items()},
+            {key: value - before['statuses'].get(key, 0) for key, value in after['statuses'].items()})
+
+
+def check_result(result):
+    """Fails unless one call's result holds data: no error bodies, no failed bulk entries."""
+    from damoov_admin.utility import is_error_data
+
+    if isinstance(result, int):
+        # iter_trips scenario: the number of trips streamed
+        assert result > 0, "no trips streamed"
+        return
+    if isinstance(result, dict):
+        result = list(result.values())
+    if isinstance(result, list):
+        for entry in result:
+            assert entry.ok, f"bulk call failed for {entry.key}: {entry.error}"
+        return
+    assert not is_error_data(result.data), f"error response: {result.data}"
+
+
+def check_requests(counts, statuses, expected, calls, expiries):
+    """
+    Fails unless the upstream requests add up: per endpoint, the expected requests per
+    call plus one retry per fault it answered; one refresh per 401, each 401 caused by
+    a token invalidation, and no new logins.
+    """
+    retried = sum(statuses.get(status, 0) for status in ('401', '429', '503'))
+    served = sum(counts.get(endpoint, 0) for endpoint in expected)
+    wanted = sum(expected.values()) * calls + retried
+    assert served == wanted, f"expected {wanted} requests to {', '.join(expected)}, got {served}: {counts}"
+    assert statuses.get('401', 0) == expiries, f"expected {expiries} 401 responses, got {statuses}"
+    assert counts.get('refresh', 0) == expiries, f"expected {expiries} token refreshes, got {counts}"
+    assert counts.get('login', 0) == 0, f"expected no logins, got {counts}"
+    unexpected = set(counts) - set(expected) - {'refresh', 'login'}
+    assert not any(counts[endpoint] for endpoint in unexpected), f"unexpected requests: {counts}"
+
+
+def _summary(latencies, elapsed, counts, statuses, peaks, blocks):
+    return {
+        'elapsed': elapsed,
+        'p50_ms': statistics.median(latencies) * 1000,
+        'p99_ms': percentile(latencies, 99) * 1000,
+        'requests': sum(counts.values()),
+        'counts': counts,
+        'statuses': statuses,
+        'peak_kib_per_call': statistics.median(peaks) / 1024,
+        'blocks_per_call': statistics.median(blocks),
+    }
+
+
+def _peak_rss_mib():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+
+
+def start_mock(args):
+    command = [sys.executable, '-m', 'damoov_admin.testing', '--port', '0',
+               '--latency', str(args.latency_ms / 1000), '--waypoints', str(args.waypoints)]
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    server = subprocess.Popen(command, env=env, stdout=subprocess.PIPE, text=True)
+    return server, server.stdout.readline().strip()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--calls', type=int, default=200, help="calls measured per scenario")
+    parser.add_argument('--latency-ms', type=float, default=2.0, help="latency the mock adds to every response")
+    parser.add_argument('--waypoints', type=int, default=1000, help="waypoints per trip detail")
+    parser.add_argument('--concurrency', type=int, default=16, help="workers / connections for bulk and async scenarios")
+    parser.add_argument('--batch', type=int, default=50, help="users or trips per bulk call")
+    parser.add_argument('--only', default='', help="run the scenarios whose name contains this text")
+    parser.add_argument('--json', help="also write the results to this file")
+    parser.add_argument('--url', help=argparse.SUPPRESS)
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args)
+        return 0
+
+    server, url = start_mock(args)
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    results = []
+    failures = []
+    try:
+        print(f"{'scenario':<44}{'calls/s':>9}{'p50 ms':>9}{'p99 ms':>9}{'req/call':>10}"
+              f"{'KiB/call':>10}{'blocks':>8}{'RSS MiB':>9}")
+        for name in SCENARIOS:
+            if args.only not in name:
+                continue
+            command = [sys.executable, os.path.abspath(__file__), '--child', name, '--url', url,
+                       '--calls', str(args.calls), '--concurrency', str(args.concurrency),
+                       '--batch', str(args.batch), '--latency-ms', str(args.latency_ms)]
+            child = subprocess.run(command, env=env, capture_output=True, text=True)
+            if child.returncode != 0:
+                failures.append(name)
+                print(f"{name:<44}FAILED\n{child.stderr}")
+                continue
+            result = json.loads(child.stdout.strip().splitlines()[-1])
+            results.append(result)
+            print(f"{name:<44}{result['calls_per_s']:9.0f}{result['p50_ms']:9.2f}{result['p99_ms']:9.2f}"
+                  f"{result['requests_per_call']:10.2f}{result['peak_kib_per_call']:10.1f}"
+                  f"{result['blocks_per_call']:8.0f}{result['peak_rss_mib']:9.1f}")
+    finally:
+        server.terminate()
+        server.wait()
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,75 @@
+# benchmarks/import_time.py
+"""
+Cold-start benchmark for the package.
+
+Runs each scenario in fresh interpreters, subtracts the time of a bare interpreter
+start and reports the median. Exits with status 1 if `import damoov_admin` takes
+longer than the budget, or if it imports requests or sentry_sdk eagerly.
+
+    python benchmarks/import_time.py [--runs 15] [--budget-ms 20]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = {
+    'import damoov_admin': "import damoov_admin",
+    'first client access': "import damoov_admin; damoov_admin.Statistics",
+    'construct TelematicsAuth': (
+        "import damoov_admin.auth as a; a.TelematicsAuth('bench@example.com', 'x')"
+    ),
+}
+
+EAGER_CHECK = (
+    "import sys, damoov_admin; "
+    "print(','.join(m for m in ('requests', 'sentry_sdk', 'aiohttp') if m in sys.modules))"
+)
+
+
+def run(code):
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    started = time.perf_counter()
+    subprocess.run([sys.executable, '-c', code], check=True, env=env)
+    return time.perf_counter() - started
+
+
+def median_ms(code, runs):
+    run(code)  # Warm the OS file cache and the bytecode cache
+    return statistics.median(run(code) for _ in range(runs)) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=15)
+    parser.add_argument('--budget-ms', type=float, default=20.0,
+                        help="maximum median cost of 'import damoov_admin' over a bare interpreter")
+    args = parser.parse_args()
+
+    baseline = median_ms('pass', args.runs)
+    print(f"{'bare interpreter':<28}{baseline:8.1f} ms")
+    results = {}
+    for name, code in SCENARIOS.items():
+        results[name] = median_ms(code, args.runs) - baseline
+        print(f"{name:<28}{results[name]:+8.1f} ms")
+
+    failures = []
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    eager = subprocess.run([sys.executable, '-c', EAGER_CHECK], check=True, env=env,
+                           capture_output=True, text=True).stdout.strip()
+    if eager:
+        failures.append(f"'import damoov_admin' eagerly imported: {eager}")
+    if results['import damoov_admin'] > args.budget_ms:
+        failures.append(f"'import damoov_admin' took {results['import damoov_admin']:.1f} ms, budget {args.budget_ms:.1f} ms")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
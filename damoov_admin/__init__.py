@@ -1,7 +1,31 @@
 # damoov_admin/__init__.py
-from . import auth
-from .statistics import Statistics
-from .core import TelematicsCore
-from .trips import Trips
-from .users import Users
-from .engagement import Engagement
+import importlib
+
+# Public names and the submodule each one lives in. Submodules (and requests with
+# them) are imported on first access, so `import damoov_admin` stays cheap.
+_LAZY_ATTRIBUTES = {
+    'Statistics': 'statistics',
+    'TelematicsCore': 'core',
+    'Trips': 'trips',
+    'Users': 'users',
+    'Engagement': 'engagement',
+}
+_SUBMODULES = ('auth', 'core', 'engagement', 'statistics', 'trips', 'users', 'utility')
+
+__all__ = list(_SUBMODULES) + list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(f'.{_LAZY_ATTRIBUTES[name]}', __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Later lookups find the attribute directly and skip this function
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,7 @@
+# damoov_admin/aio/__init__.py
+from .auth import AsyncTelematicsAuth, AsyncResponse
+from .transport import AsyncTransport
+from .statistics import AsyncStatistics
+from .trips import AsyncTrips
+from .users import AsyncUsers
+from .engagement import AsyncEngagement
@@ -0,0 +1,288 @@
+# aio/auth.py
+
+import asyncio
+import time
+
+import aiohttp
+from requests.exceptions import HTTPError
+
+from ..auth import BaseAuth, _bearer_token
+from ..utility import handle_response
+from ..deadline import Deadline, DeadlineExceeded
+from .transport import AsyncResponse, AsyncTransport
+
+
+class AsyncTelematicsAuth(BaseAuth):
+    """
+    asyncio counterpart of `TelematicsAuth`.
+
+    All requests go through one `AsyncTransport` (a pooled `aiohttp.ClientSession`).
+    `limit` caps the total number of open connections and `limit_per_host` the
+    connections per API host (0 means no per-host cap); requests beyond the cap wait
+    for a free connection instead of failing. Pass `transport=` for per-host limits.
+    """
+
+    def __init__(self, email, password, limit=100, limit_per_host=0, cache=None, instrumentation=None, rate_limiter=None,
+                 retry_policy=None, circuit_breaker=None, transport=None, hedge_policy=None, metrics=None,
+                 single_flight=None):
+        self._lock = None
+        self.transport = transport if transport is not None else AsyncTransport(limit, limit_per_host)
+        self.limit = self.transport.limit
+        self.limit_per_host = self.transport.limit_per_host
+        super().__init__(email, password, cache, instrumentation, rate_limiter, retry_policy, circuit_breaker,
+                         hedge_policy, metrics, single_flight)
+
+    @property
+    def lock(self):
+        # Created lazily so it binds to the event loop that first uses it
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    @property
+    def session(self):
+        return self.transport.session
+
+    async def close(self):
+        await self.transport.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def _send(self, method, url, headers=None, json=None, data=None, params=None, deadline=None, hedge=False):
+        kwargs = {'headers': headers, 'json': json, 'data': data, 'params': params, 'timeout': self._timeout(deadline),
+                  'total': deadline.remaining() if deadline is not None else None}
+        if not hedge:
+            return await self.transport.request(method, url, **kwargs)
+        policy = self.hedge_policy
+        delay = policy.delay_for(url)
+        if delay is None:
+            return await self._timed_send(method, url, kwargs)
+        first = asyncio.ensure_future(self._timed_send(method, url, kwargs))
+        done, _ = await asyncio.wait({first}, timeout=delay)
+        if done or not self._acquire_hedge():
+            return await first
+        second = asyncio.ensure_future(self._timed_send(method, url, kwargs))
+        pending = {first, second}
+        error = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is second:
+                            policy.record_win()
+                        return task.result()
+                    error = error or task.exception()
+            raise error
+        finally:
+            # Cancelling the slower copy closes its connection, which frees the hedge's slot
+            for task in pending:
+                task.cancel()
+            policy.finish_hedge()
+
+    async def _timed_send(self, method, url, kwargs):
+        sent_at = time.monotonic()
+        response = await self.transport.request(method, url, **kwargs)
+        if response.status_code < 400:
+            self.hedge_policy.record(url, time.monotonic() - sent_at)
+        return response
+
+    async def _acquire_rate_limit(self, deadline=None):
+        while True:
+            delay = self.rate_limiter.reserve()
+            if delay <= 0:
+                return
+            if deadline is not None and delay >= deadline.remaining():
+                raise DeadlineExceeded(f"Deadline of {deadline.seconds}s exceeded waiting for the rate limiter")
+            await asyncio.sleep(delay)
+
+    async def login(self, deadline=None):
+        self._record_renewal('login')
+        payload = self._login_payload()
+        headers = {'accept': 'application/json', 'content-type': 'application/json'}
+        try:
+            response = await self._send('POST', self.LOGIN_ENDPOINT, json=payload, headers=headers, deadline=deadline)
+            response.raise_for_status()
+            await self._set_tokens(response.json())
+        except HTTPError as http_err:
+            print(f'HTTP error occurred: {http_err}')  # Or handle it in some other way
+            handle_response(response)
+            return response
+
+    async def refresh(self, deadline=None):
+        if not self.refresh_token:
+            await self.login(deadline)
+            return
+
+        self._record_renewal('refresh')
+        payload = self._refresh_payload()
+        headers = {'accept': 'application/json', 'content-type': 'application/json'}
+        try:
+            response = await self._send('POST', self.REFRESH_ENDPOINT, json=payload, headers=headers, deadline=deadline)
+            if response.status_code == 401:
+                await self.login(deadline)
+                return
+            response.raise_for_status()
+            await self._set_tokens(response.json())
+        except HTTPError as http_err:
+            print(f'HTTP error occurred: {http_err}')  # Or handle it in some other way
+            handle_response(response)
+            return response
+
+    async def _set_tokens(self, body):
+        self._take_tokens(body)
+        # Saving takes the token file lock, which another process may hold for a whole
+        # login round-trip, so wait for it on a worker thread instead of the event loop
+        await asyncio.get_running_loop().run_in_executor(None, self._save_tokens)
+
+    async def get_access_token(self):
+        # Hot path: a loaded token that is not about to expire needs no lock
+        if self.access_token and not self._expires_soon():
+            return self.access_token
+
+        async with self.lock:
+            # If the access token isn't available, try loading it
+            if not self.access_token:
+                self._load_tokens()
+
+            # If it still isn't available, then call login to get a fresh token
+            if not self.access_token:
+                await self.login()
+            # Refresh ahead of expiry, unless another task did while we waited for the lock
+            elif self._expires_soon():
+                generation = self.token_generation
+                # Another process may already have stored fresh tokens
+                if not self._load_tokens(fresh=True):
+                    await self.refresh()
+                self._refresh_failed(generation)
+
+            return self.access_token
+
+    async def handle_401(self, generation=None, deadline=None):
+        """Refreshes the tokens after a 401, unless they changed since `generation`."""
+        async with self.lock:
+            if generation is not None and generation != self.token_generation:
+                return
+            # Another process may already have stored fresh tokens
+            if not self._load_tokens(fresh=True):
+                await self.refresh(deadline)
+
+    async def _request_with_retry(self, method, url, headers=None, json=None, data=None, params=None, cacheable=False,
+                                  authenticate=True, deadline=None):
+        if not self._coalesces(method, cacheable):
+            return await self._perform_request(method, url, headers, json, data, params, cacheable, authenticate,
+                                               deadline)
+        deadline = Deadline.of(deadline)
+        key = self._flight_key(method, url, headers, json if json is not None else data, params)
+        return await self.single_flight.do_async(
+            key, lambda: self._perform_request(method, url, headers, json, data, params, cacheable, authenticate,
+                                               deadline), deadline)
+
+    async def _perform_request(self, method, url, headers=None, json=None, data=None, params=None, cacheable=False,
+                               authenticate=True, deadline=None):
+        payload = json if json is not None else data
+        deadline = Deadline.of(deadline)
+        started = self._start_request()
+        metrics = self.metrics
+        tracked = metrics.start(method, url) if metrics is not None else None
+        cache_key, cached = self._cache_lookup(method, url, payload) if cacheable else (None, None)
+        if cached is not None:
+            self._record_request(started, method, url, cached, cached=True)
+            if tracked is not None:
+                metrics.finish(tracked, cached, cached=True)
+            return cached
+        response = None
+        retries = 0
+        error = None
+        try:
+            generation = self.token_generation
+            idempotent = cacheable or self.retry_policy.is_idempotent(method)
+            hedge = self._hedgeable(method, url, cacheable)
+            refreshed = False
+            throttled = 0
+            failures = 0
+            while True:
+                self._before_send(url)
+                if self.rate_limiter is not None:
+                    await self._acquire_rate_limit(deadline)
+                sent_at = time.monotonic()
+                try:
+                    response = await self._send(method, url, headers=headers, json=json, data=data, params=params,
+                                                deadline=deadline, hedge=hedge)
+                except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                    self._after_send(url, ok=False)
+                    failures += 1
+                    delay = self._retry_delay(failures, idempotent, connect_failed=isinstance(exc, aiohttp.ClientConnectorError))
+                    if delay is None:
+                        raise
+                    if tracked is not None:
+                        metrics.retry(tracked, 'connection')
+                    await asyncio.sleep(self._check_wait(delay, deadline))
+                    retries += 1
+                    continue
+                self._after_send(url, ok=response.status_code < 500)
+                if response.status_code == 401 and authenticate and not refreshed:
+                    # Skip the refresh if the request went out with a token that has since been replaced
+                    if _bearer_token(headers) in (None, self.access_token):
+                        await self.handle_401(generation, deadline)
+                    headers = headers.copy() if headers else {}
+                    headers['authorization'] = f'Bearer {await self.get_access_token()}'
+                    refreshed = True
+                    if tracked is not None:
+                        metrics.retry(tracked, 'unauthorized')
+                elif response.status_code == 429 and throttled < self.throttle_retries:
+                    throttled += 1
+                    if tracked is not None:
+                        metrics.retry(tracked, 'throttled')
+                    await asyncio.sleep(self._check_wait(self._throttle_delay(response, throttled, sent_at), deadline))
+                else:
+                    delay = self._retry_delay(failures + 1, idempotent, status=response.status_code)
+                    if delay is None:
+                        if response.status_code != 429:
+                            self._rate_limit_success(time.monotonic() - sent_at)
+                        break
+                    failures += 1
+                    if tracked is not None:
+                        metrics.retry(tracked, 'status')
+                    await asyncio.sleep(self._check_wait(delay, deadline))
+                retries += 1
+            response.raise_for_status()
+            self._cache_store(cache_key, url, payload, response)
+            return response
+        except HTTPError as http_err:
+            print(f'HTTP error occurred: {http_err}')  # Or handle it in some other way
+            handle_response(response)
+            return response
+        except Exception as exc:
+            error = exc
+            raise
+        finally:
+            self._record_request(started, method, url, response, retries, error=error)
+            if tracked is not None:
+                metrics.finish(tracked, response, error, payload, retries + 1)
+
+    async def get_with_retry(self, url, headers=None, params=None, authenticate=True, deadline=None):
+        """Performs a GET request and retries once if a 401 status is encountered."""
+        return await self._request_with_retry('GET', url, headers=headers, params=params,
+                                              cacheable=params is None and authenticate, authenticate=authenticate,
+                                              deadline=deadline)
+
+    async def post_with_retry(self, url, headers=None, json=None, data=None, cacheable=False, deadline=None):
+        """
+        Performs a POST request and retries once if a 401 status is encountered.
+        Pass `cacheable=True` for read-only POSTs whose response may be served from the cache.
+        """
+        return await self._request_with_retry('POST', url, headers=headers, json=json, data=data, cacheable=cacheable,
+                                              deadline=deadline)
+
+    async def put_with_retry(self, url, headers=None, json=None, data=None, deadline=None):
+        """Performs a PUT request and retries once if a 401 status is encountered."""
+        return await self._request_with_retry('PUT', url, headers=headers, json=json, data=data, deadline=deadline)
+
+    async def delete_with_retry(self, url, headers=None, json=None, data=None, deadline=None):
+        """Performs a DELETE request and retries once if a 401 status is encountered."""
+        return await self._request_with_retry('DELETE', url, headers=headers, json=json, data=data, deadline=deadline)
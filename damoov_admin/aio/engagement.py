@@ -0,0 +1,44 @@
+# aio/engagement.py
+from requests.exceptions import HTTPError
+
+from ..codec import decode
+from ..engagement import Engagement, EngagementResponse
+from ..utility import handle_response
+from .auth import AsyncTelematicsAuth
+
+
+class AsyncEngagement(Engagement):
+    """asyncio variant of `Engagement`; leaderboard calls share the auth client's connection pool."""
+
+    def __init__(self, auth_client: AsyncTelematicsAuth):
+        self.auth_client = auth_client
+
+    async def _get_headers(self):
+        return {
+            'accept': 'application/json',
+            'authorization': f'Bearer {await self.auth_client.get_access_token()}'
+        }
+
+    async def get_user_leaderboard(self, user_id, deadline=None):
+        return await self._get_leaderboard(*self._user_leaderboard_request(user_id), deadline=deadline)
+
+    async def get_general_leaderboard(self, user_id, leaders_count=5, round_users_count=2, ratingtype=1, deadline=None):
+        return await self._get_leaderboard(*self._general_leaderboard_request(user_id, leaders_count, round_users_count, ratingtype),
+                                           deadline=deadline)
+
+    async def _get_leaderboard(self, url, headers, params=None, deadline=None):
+        try:
+            response = await self.auth_client.get_with_retry(url, headers=headers, params=params, authenticate=False,
+                                                             deadline=deadline)
+
+            response.raise_for_status()
+            return EngagementResponse(decode(response))
+        except HTTPError as http_err:
+            print(f'HTTP error occurred: {http_err}')
+            e_response = handle_response(response, EngagementResponse)
+            return e_response
+
+
+def DamoovAuth(email, password):
+    auth_client = AsyncTelematicsAuth(email, password)
+    return AsyncEngagement(auth_client)
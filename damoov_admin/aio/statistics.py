@@ -0,0 +1,122 @@
+# aio/statistics.py
+import asyncio
+from requests.exceptions import HTTPError
+
+from ..bulk import aiter_bulk
+from ..codec import decode
+from ..deadline import Deadline
+from ..statistics import Statistics, StatisticsResponse, _check_statistics
+from ..utility import handle_response, split_date_range
+from .auth import AsyncTelematicsAuth
+
+
+class AsyncStatistics(Statistics):
+    """
+    asyncio variant of `Statistics`.
+
+    Every public method is a coroutine with the signature of its `Statistics`
+    counterpart and resolves to the same `StatisticsResponse`. Both classes build
+    their URLs with the same private helpers.
+    """
+
+    def __init__(self, auth_client: AsyncTelematicsAuth):
+        self.auth_client = auth_client
+
+    async def _get_headers(self):
+        return {
+            'accept': 'application/json',
+            'authorization': f'Bearer {await self.auth_client.get_access_token()}'
+        }
+
+    async def _get_statistics(self, url, deadline=None):
+        try:
+            response = await self.auth_client.get_with_retry(url, headers=await self._get_headers(), deadline=deadline)
+            return StatisticsResponse(decode(response))
+        except HTTPError as http_err:
+            print(f'HTTP error occurred: {http_err}')  # Or handle it in some other way
+            e_response = handle_response(response, StatisticsResponse)
+            return e_response
+
+    async def _get_entity_statistics(self, url, deadline=None):
+        return await self._get_statistics(url, deadline)
+
+    async def _get_daily_statistics(self, build_url, start_date, end_date, fetch=None, deadline=None):
+        fetch = fetch or self._get_statistics
+        deadline = Deadline.of(deadline)
+        urls = [build_url(start, end) for start, end, _, _ in split_date_range(start_date, end_date)]
+        responses = await asyncio.gather(*[fetch(url, deadline) for url in urls])
+        if len(responses) == 1:
+            return responses[0]
+        return StatisticsResponse.merge(responses)
+
+    async def user_daily_statistics(self, user_id, start_date, end_date, tag=None, deadline=None):
+        return await self._get_daily_statistics(self._user_url('Statistics/daily', user_id, tag), start_date, end_date, deadline=deadline)
+
+    async def user_daily_ecoscore(self, user_id, start_date, end_date, deadline=None):
+        return await self._get_daily_statistics(self._user_url('Scores/eco/daily', user_id), start_date, end_date, deadline=deadline)
+
+    async def user_daily_safetyscore(self, user_id, start_date, end_date, tag=None, deadline=None):
+        return await self._get_daily_statistics(self._user_url('Scores/safety/daily', user_id, tag), start_date, end_date, deadline=deadline)
+
+    async def user_accumulated_statistics(self, user_id, start_date, end_date, tag=None, deadline=None):
+        return await self._get_statistics(self._user_url('Statistics', user_id, tag)(start_date, end_date), deadline)
+
+    async def user_accumulated_ecoscore(self, user_id, start_date, end_date, deadline=None):
+        return await self._get_statistics(self._user_url('Scores/eco', user_id)(start_date, end_date), deadline)
+
+    async def user_accumulated_safetyscore(self, user_id, start_date, end_date, tag=None, deadline=None):
+        return await self._get_statistics(self._user_url('Scores/safety', user_id, tag)(start_date, end_date), deadline)
+
+    async def entity_accumulated_ecoscore(self, start_date, end_date, tag=None, instance_id=None, app_id=None, company_id=None, deadline=None):
+        build_url = self._entity_url('Scores/eco/consolidated', tag, instance_id, app_id, company_id)
+        return await self._get_entity_statistics(build_url(start_date, end_date), deadline)
+
+    async def entity_daily_ecoscore(self, start_date, end_date, tag=None, instance_id=None, app_id=None, company_id=None, deadline=None):
+        build_url = self._entity_url('Scores/eco/consolidated/daily', tag, instance_id, app_id, company_id)
+        return await self._get_daily_statistics(build_url, start_date, end_date, self._get_entity_statistics, deadline=deadline)
+
+    async def entity_daily_statistics(self, start_date, end_date, tag=None, instance_id=None, app_id=None, company_id=None, deadline=None):
+        build_url = self._entity_url('Statistics/consolidated/daily', tag, instance_id, app_id, company_id)
+        return await self._get_daily_statistics(build_url, start_date, end_date, self._get_entity_statistics, deadline=deadline)
+
+    async def entity_safety_score(self, start_date, end_date, tag=None, instance_id=None, app_id=None, company_id=None, deadline=None):
+        return await self._get_entity_statistics(
+            self._entity_score_url(start_date, end_date, tag, instance_id, app_id, company_id), deadline)
+
+    async def entity_accumulated_statistics(self, start_date, end_date, tag=None, instance_id=None, app_id=None, company_id=None, deadline=None):
+        build_url = self._entity_url('Statistics/consolidated', tag, instance_id, app_id, company_id)
+        return await self._get_entity_statistics(build_url(start_date, end_date), deadline)
+
+    async def entity_daily_safetyscore(self, start_date, end_date, tag=None, instance_id=None, app_id=None, company_id=None, deadline=None):
+        build_url = self._entity_url('Scores/safety/consolidated/daily', tag, instance_id, app_id, company_id)
+        return await self._get_daily_statistics(build_url, start_date, end_date, self._get_entity_statistics, deadline=deadline)
+
+    async def lastupdates(self, user_id, deadline=None):
+        return await self._get_statistics(self._lastupdates_url(user_id), deadline)
+
+    async def uniquetags(self, user_id, start_date, end_date, deadline=None):
+        return await self._get_statistics(self._user_url('Statistics/UniqueTags', user_id)(start_date, end_date), deadline)
+
+    def bulk_iter(self, method, user_ids, *args, max_workers=None, **kwargs):
+        """
+        Async iterator yielding a `BulkResult` per user as its call completes, with at
+        most `max_workers` calls in flight (defaults to the auth client's `limit`).
+        """
+        func = self._resolve_user_method(method)
+        max_workers = max_workers or self.auth_client.limit
+        return self._iter_bulk(lambda user_id: func(user_id, *args, **kwargs), user_ids, max_workers)
+
+    async def _iter_bulk(self, func, user_ids, max_workers):
+        async for result in aiter_bulk(func, user_ids, max_workers):
+            yield _check_statistics(result)
+
+    async def bulk(self, method, user_ids, *args, max_workers=None, **kwargs):
+        results = {}
+        async for result in self.bulk_iter(method, user_ids, *args, max_workers=max_workers, **kwargs):
+            results[result.key] = result
+        return {user_id: results[user_id] for user_id in dict.fromkeys(user_ids)}
+
+
+def DamoovAuth(email, password):
+    auth_client = AsyncTelematicsAuth(email, password)
+    return AsyncStatistics(auth_client)
@@ -0,0 +1,135 @@
+# aio/transport.py
+import asyncio
+from urllib.parse import urlsplit
+
+import aiohttp
+from requests.exceptions import HTTPError
+
+from .. import codec
+
+
+class AsyncResponse:
+    """Fully-read aiohttp response exposing the parts of `requests.Response` the SDK relies on."""
+
+    def __init__(self, status_code, reason, url, headers, content):
+        self.status_code = status_code
+        self.reason = reason
+        self.url = url
+        self.headers = headers
+        self.content = content
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self):
+        return codec.loads(self.content)
+
+    def raise_for_status(self):
+        if 400 <= self.status_code < 500:
+            raise HTTPError(f'{self.status_code} Client Error: {self.reason} for url: {self.url}', response=self)
+        if 500 <= self.status_code < 600:
+            raise HTTPError(f'{self.status_code} Server Error: {self.reason} for url: {self.url}', response=self)
+
+    def __bool__(self):
+        # Same truthiness as requests.Response, which handle_response depends on
+        return self.ok
+
+
+class AsyncTransport:
+    """
+    asyncio counterpart of `Transport`: one pooled `aiohttp.ClientSession`, created on
+    first use inside the running event loop.
+
+    `limit` caps the total number of open connections and `limit_per_host` the
+    connections per host (0 means no per-host cap). `host_limits` sets the cap for
+    individual hosts, e.g. {'leaderboard.telematicssdk.com': 4}. Requests beyond a cap
+    wait for a free connection. Connections are kept alive and responses are
+    requested compressed unless `compress=False`. `timeout` is the default
+    (connect, read) timeout in seconds, or one number for both. `stats()` matches
+    `Transport.stats()`.
+    """
+
+    def __init__(self, limit=100, limit_per_host=0, host_limits=None, compress=True, timeout=(5, 60)):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.host_limits = dict(host_limits or {})
+        self.compress = compress
+        self.timeout = timeout
+        self._session = None
+        self._semaphores = {}
+        self._stats = {}
+
+    @property
+    def session(self):
+        if self._session is None or self._session.closed:
+            trace_config = aiohttp.TraceConfig()
+            trace_config.on_request_start.append(self._on_request_start)
+            trace_config.on_connection_create_end.append(self._on_connection_create_end)
+            connector = aiohttp.TCPConnector(limit=self.limit, limit_per_host=self.limit_per_host)
+            headers = None if self.compress else {'Accept-Encoding': 'identity'}
+            self._session = aiohttp.ClientSession(connector=connector, headers=headers, trace_configs=[trace_config])
+        return self._session
+
+    async def request(self, method, url, headers=None, json=None, data=None, params=None, timeout=None, total=None):
+        """
+        `timeout` is (connect, read) in seconds, or one number for both as with requests;
+        `total` bounds the whole request, body included.
+        """
+        timeout = timeout if timeout is not None else self.timeout
+        connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+        kwargs = {'headers': headers, 'timeout': aiohttp.ClientTimeout(total=total, sock_connect=connect, sock_read=read)}
+        # aiohttp rejects json= and data= being passed together, even as None
+        if json is not None:
+            kwargs['json'] = json
+        elif data is not None:
+            kwargs['data'] = data
+        if params is not None:
+            kwargs['params'] = params
+
+        host = urlsplit(url).hostname
+        semaphore = self._semaphore(host)
+        if semaphore is None:
+            return await self._request(method, url, host, kwargs)
+        async with semaphore:
+            return await self._request(method, url, host, kwargs)
+
+    async def _request(self, method, url, host, kwargs):
+        async with self.session.request(method, url, trace_request_ctx={'host': host}, **kwargs) as response:
+            content = await response.read()
+            return AsyncResponse(response.status, response.reason, str(response.url), response.headers, content)
+
+    def _semaphore(self, host):
+        if host not in self.host_limits:
+            return None
+        if host not in self._semaphores:
+            self._semaphores[host] = asyncio.Semaphore(self.host_limits[host])
+        return self._semaphores[host]
+
+    def _host_stats(self, trace_config_ctx):
+        host = (trace_config_ctx.trace_request_ctx or {}).get('host')
+        return self._stats.setdefault(host, {'requests': 0, 'connections': 0})
+
+    async def _on_request_start(self, session, trace_config_ctx, params):
+        self._host_stats(trace_config_ctx)['requests'] += 1
+
+    async def _on_connection_create_end(self, session, trace_config_ctx, params):
+        self._host_stats(trace_config_ctx)['connections'] += 1
+
+    def stats(self):
+        hosts = {}
+        for host, entry in self._stats.items():
+            entry = dict(entry)
+            entry['reused'] = max(0, entry['requests'] - entry['connections'])
+            entry['reuse_rate'] = entry['reused'] / entry['requests'] if entry['requests'] else 0.0
+            hosts[host] = entry
+        return hosts
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
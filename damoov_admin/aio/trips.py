@@ -0,0 +1,261 @@
+# aio/trips.py
+import asyncio
+from requests.exceptions import HTTPError
+
+from ..bulk import aiter_bulk, aread_ahead_iter
+from ..codec import decode
+from ..deadline import Deadline
+from ..trips import (Trips, TripsResponse, LazyTrip, _WindowBoundaryFilter, _total_pages, _join_pages, _check_trip_details,
+                     _check_unit_system, _include_flags, _listed_parts, _make_lazy, _prefetch_groups)
+from ..utility import handle_response
+from .auth import AsyncTelematicsAuth
+
+
+class AsyncTrips(Trips):
+    """
+    asyncio variant of `Trips`.
+
+    Every public method is a coroutine (or an async iterator, for `iter_trips` and
+    `get_trip_details_many`) with the signature of its `Trips` counterpart. Both
+    classes build their request bodies with the same private helpers.
+    """
+
+    def __init__(self, auth_client: AsyncTelematicsAuth):
+        self.auth_client = auth_client
+
+    async def _get_headers(self):
+        return {
+            'accept': 'application/json',
+            'authorization': f'Bearer {await self.auth_client.get_access_token()}'
+        }
+
+    async def get_list_trips(self, user_id,
+                             start_date=None, end_date=None,
+                             start_date_timestamp_sec=None, end_date_timestamp_sec=None,
+                             include_details=False, include_statistics=False,
+                             include_scores=False, include_related=False,
+                             tags_included=None, tags_included_operator=None,
+                             tags_excluded=None, tags_excluded_operator=None,
+                             locale="EN", unit_system="Si",
+                             vehicles=None, sort_by="StartDateUtc_Desc",
+                             limit=None, page_concurrency=None, deadline=None, lazy=False):
+        url, payloads = self._build_list_payloads(
+            user_id, start_date, end_date, start_date_timestamp_sec, end_date_timestamp_sec,
+            include_details, include_statistics, include_scores, include_related,
+            tags_included, tags_included_operator, tags_excluded, tags_excluded_operator,
+            locale, unit_system, vehicles, sort_by)
+
+        deadline = Deadline.of(deadline)
+        if len(payloads) == 1:
+            response = await self._fetch_trip_details(url, payloads[0], limit, page_concurrency, deadline)
+        else:
+            response = await self._fetch_trip_windows(url, payloads, limit, page_concurrency, deadline)
+        if not lazy:
+            return response
+        loaded = _listed_parts(include_details, include_statistics, include_scores)
+        return _make_lazy(response, AsyncLazyTrip, self, user_id, loaded, payloads[0]["Locale"], payloads[0]["UnitSystem"])
+
+    async def iter_trips(self, user_id,
+                         start_date=None, end_date=None,
+                         start_date_timestamp_sec=None, end_date_timestamp_sec=None,
+                         include_details=False, include_statistics=False,
+                         include_scores=False, include_related=False,
+                         tags_included=None, tags_included_operator=None,
+                         tags_excluded=None, tags_excluded_operator=None,
+                         locale="EN", unit_system="Si",
+                         vehicles=None, sort_by="StartDateUtc_Desc",
+                         page_size=50, read_ahead=0, deadline=None):
+        """Async iterator over a user's trips; see `Trips.iter_trips`."""
+        url, payloads = self._build_list_payloads(
+            user_id, start_date, end_date, start_date_timestamp_sec, end_date_timestamp_sec,
+            include_details, include_statistics, include_scores, include_related,
+            tags_included, tags_included_operator, tags_excluded, tags_excluded_operator,
+            locale, unit_system, vehicles, sort_by)
+        async for trip in self._iter_trips(url, payloads, page_size, read_ahead, Deadline.of(deadline)):
+            yield trip
+
+    async def get_trip_details(self, trip_id, user_id,
+                               include_details=False, include_statistics=False,
+                               include_scores=False, include_waypoints=False,
+                               include_events=False, include_related=True,
+                               locale="EN", unit_system="Si", deadline=None, compact_waypoints=False):
+        url, payload = self._build_details_payload(trip_id, user_id, include_details, include_statistics, include_scores,
+                                                   include_waypoints, include_events, include_related, locale, unit_system)
+        return await self._post_trip(url, payload, Deadline.of(deadline), compact_waypoints)
+
+    async def get_trip_details_many(self, trip_ids, user_id,
+                                    include_details=False, include_statistics=False,
+                                    include_scores=False, include_waypoints=False,
+                                    include_events=False, include_related=True,
+                                    locale="EN", unit_system="Si", max_workers=None, deadline=None,
+                                    compact_waypoints=False):
+        """
+        Async iterator yielding a `BulkResult` per trip as its details arrive, with at
+        most `max_workers` requests in flight (defaults to the auth client's `limit`).
+        """
+        unit_system = _check_unit_system(unit_system)
+        deadline = Deadline.of(deadline)
+
+        async def fetch(trip_id):
+            return await self.get_trip_details(trip_id, user_id, include_details, include_statistics, include_scores,
+                                               include_waypoints, include_events, include_related, locale, unit_system,
+                                               deadline=deadline, compact_waypoints=compact_waypoints)
+
+        async for result in aiter_bulk(fetch, trip_ids, max_workers or self.auth_client.limit):
+            yield _check_trip_details(result)
+
+    async def prefetch(self, trips, *parts, max_workers=None, deadline=None, compact_waypoints=False):
+        return await self._prefetch(_prefetch_groups(trips, parts), max_workers, Deadline.of(deadline), compact_waypoints)
+
+    async def _post_trip(self, url, payload, deadline=None, compact_waypoints=False):
+        try:
+            response = await self.auth_client.post_with_retry(url, headers=await self._get_headers(), json=payload, cacheable=True, deadline=deadline)
+            data = handle_response(response)
+            if data is not None:
+                return TripsResponse(data, compact_waypoints)
+            return None
+        except HTTPError as http_err:
+            print(f'HTTP error occurred: {http_err}')  # Or handle it in some other way
+            e_response = handle_response(response, TripsResponse)
+            return e_response
+
+    async def _fetch_trip_details(self, url, payload, limit=None, page_concurrency=None, deadline=None):
+        try:
+            if limit:
+                payload["Paging"] = {"Count": limit, "IncludePagingInfo": False}
+                response = await self.auth_client.post_with_retry(url, headers=await self._get_headers(), json=payload, cacheable=True, deadline=deadline)
+                data = handle_response(response)
+                if data is not None:
+                    return TripsResponse(data)
+                return None
+
+            if page_concurrency and page_concurrency > 1:
+                return await self._fetch_pages_concurrently(url, payload, page_concurrency, deadline=deadline)
+
+            # Handle pagination if limit is not set
+            payload["Paging"] = {"Count": 50, "IncludePagingInfo": True}
+            all_trips = []
+            current_page = 1
+
+            while True:
+                payload["Paging"]["Page"] = current_page
+                response = await self.auth_client.post_with_retry(url, headers=await self._get_headers(), json=payload, cacheable=True, deadline=deadline)
+                response.raise_for_status()  # Will raise an error for 4xx and 5xx responses.
+                trips_response = TripsResponse(decode(response))
+
+                all_trips.extend(trips_response.trips)
+
+                # Additional check: if the fetched trips are less than 50 (page size) or there's no next page, break
+                if len(trips_response.trips) < 50 or not trips_response.paging_info.get('HasNextPage'):
+                    break
+
+                current_page += 1
+
+            trips_response.data['Result']['Trips'] = all_trips
+            return trips_response
+
+        except HTTPError as http_err:
+            print(f'HTTP error occurred: {http_err}')  # Or handle it in some other way
+            e_response = handle_response(response, TripsResponse)
+            return e_response
+
+    async def _fetch_pages_concurrently(self, url, payload, page_concurrency, page_size=50, deadline=None):
+        try:
+            first_page = await self._fetch_trip_page(url, payload, 1, page_size, deadline)
+            total_pages = _total_pages(first_page.paging_info, page_size)
+            pages = [first_page]
+            if total_pages is None:
+                # Page count not reported; walk the remaining pages one by one
+                if len(first_page.trips) == page_size and first_page.paging_info.get('HasNextPage'):
+                    async for page in self._iter_pages(url, [payload], page_size, first_page=2, deadline=deadline):
+                        if page is not None:
+                            pages.append(page)
+            else:
+                semaphore = asyncio.Semaphore(page_concurrency)
+
+                async def fetch(page):
+                    async with semaphore:
+                        return await self._fetch_trip_page(url, payload, page, page_size, deadline)
+
+                pages.extend(await asyncio.gather(*[fetch(page) for page in range(2, total_pages + 1)]))
+
+            return _join_pages(pages)
+
+        except HTTPError as http_err:
+            print(f'HTTP error occurred: {http_err}')  # Or handle it in some other way
+            e_response = handle_response(http_err.response, TripsResponse)
+            return e_response
+
+    async def _fetch_trip_page(self, url, payload, page, page_size, deadline=None):
+        payload = dict(payload)
+        payload["Paging"] = {"Count": page_size, "IncludePagingInfo": True, "Page": page}
+        response = await self.auth_client.post_with_retry(url, headers=await self._get_headers(), json=payload, cacheable=True, deadline=deadline)
+        response.raise_for_status()
+        return TripsResponse(decode(response))
+
+    async def _iter_pages(self, url, payloads, page_size, first_page=1, deadline=None):
+        for payload in payloads:
+            page = first_page
+            while True:
+                trips_response = await self._fetch_trip_page(url, payload, page, page_size, deadline)
+                yield trips_response
+
+                if len(trips_response.trips) < page_size or not trips_response.paging_info.get('HasNextPage'):
+                    break
+                page += 1
+            # Marks the end of a date window
+            yield None
+
+    async def _iter_trips(self, url, payloads, page_size, read_ahead, deadline=None):
+        pages = self._iter_pages(url, payloads, page_size, deadline=deadline)
+        if read_ahead:
+            pages = aread_ahead_iter(pages, read_ahead)
+
+        boundary_filter = _WindowBoundaryFilter(enabled=len(payloads) > 1)
+        async for trips_response in pages:
+            for trip in boundary_filter.filter(trips_response):
+                yield trip
+
+    async def _prefetch(self, groups, max_workers=None, deadline=None, compact_waypoints=False):
+        failed = []
+        for (user_id, locale, unit_system, parts), handles in groups.items():
+            async for result in self.get_trip_details_many(list(handles), user_id, locale=locale, unit_system=unit_system,
+                                                           max_workers=max_workers, deadline=deadline,
+                                                           compact_waypoints=compact_waypoints, **_include_flags(parts)):
+                if result.ok:
+                    for handle in handles[result.key]:
+                        handle._apply(result.response, parts)
+                else:
+                    failed.append(result)
+        return failed
+
+    async def _fetch_trip_windows(self, url, payloads, limit=None, page_concurrency=None, deadline=None):
+        responses = await asyncio.gather(*[self._fetch_trip_details(url, payload, limit, page_concurrency, deadline) for payload in payloads])
+        return TripsResponse.merge(responses, limit)
+
+
+class AsyncLazyTrip(LazyTrip):
+    """
+    `LazyTrip` for `AsyncTrips`. Properties cannot await, so load what you read first
+    with `await trip.hydrate(...)` or `await trips_client.prefetch(...)`; reading a part
+    that is not loaded raises `RuntimeError`.
+    """
+
+    def _part(self, part, default):
+        if part not in self._loaded:
+            raise RuntimeError(f"'{part}' of trip {self.id} is not loaded; await trip.hydrate('{part}') first")
+        return super()._part(part, default)
+
+    async def hydrate(self, *parts, compact_waypoints=False):
+        missing = self._missing(parts)
+        if missing:
+            response = await self._trips.get_trip_details(self.id, self.user_id, locale=self.locale,
+                                                          unit_system=self.unit_system,
+                                                          compact_waypoints=compact_waypoints, **_include_flags(missing))
+            self._apply(response, missing)
+        return self
+
+
+def DamoovAuth(email, password):
+    auth_client = AsyncTelematicsAuth(email, password)
+    return AsyncTrips(auth_client)
@@ -0,0 +1,108 @@
+# aio/users.py
+import json
+from requests.exceptions import HTTPError
+
+from ..users import Users, UsersResponse
+from ..utility import handle_response
+from .auth import AsyncTelematicsAuth
+
+
+class AsyncUsers(Users):
+    """asyncio variant of `Users`; each method returns the same `UsersResponse` as its sync counterpart."""
+
+    def __init__(self, auth_client: AsyncTelematicsAuth):
+        self.auth_client = auth_client
+
+    async def _get_headers(self):
+        return {
+            'accept': 'application/json',
+            'authorization': f'Bearer {await self.auth_client.get_access_token()}'
+        }
+
+    async def create_user(self,
+                          instanceid,
+                          instancekey,
+                          FirstName=None,
+                          LastName=None,
+                          Nickname=None,
+                          Phone=None,
+                          Email=None,
+                          ClientId=None,
+                          CreateAccessToken=False,
+                          deadline=None
+                          ):
+
+        # Parameter validation
+        if not instanceid or not instancekey:
+            raise ValueError("Both `instanceid` and `instancekey` must be provided.")
+
+        headers = {
+            'InstanceId': instanceid,
+            'InstanceKey': instancekey,
+            'accept': 'application/json',
+            'content-type': 'application/json'
+        }
+
+        payload = self._build_user_payload(ClientId, FirstName, LastName, Nickname, Phone, Email)
+        payload["CreateAccessToken"] = CreateAccessToken
+
+        url = f"{self.BASE_URL}/registration/create"
+        try:
+            response = await self.auth_client.post_with_retry(url, headers=headers, data=json.dumps(payload), deadline=deadline)
+
+            processed_response = handle_response(response)
+            return UsersResponse(processed_response)
+
+        except HTTPError as http_err:
+            print(f'HTTP error occurred: {http_err}')  # Or handle it in some other way
+            handle_response(response)
+            return response
+
+    async def update_user(self,
+                          userid,
+                          ClientId=None,
+                          FirstName=None,
+                          LastName=None,
+                          Nickname=None,
+                          Phone=None,
+                          Email=None,
+                          deadline=None
+                          ):
+
+        headers = {
+            'UserDeviceToken': userid,
+            'authorization': f'Bearer {await self.auth_client.get_access_token()}',
+            'accept': 'application/json',
+            'content-type': 'application/json'
+        }
+
+        payload = self._build_user_payload(ClientId, FirstName, LastName, Nickname, Phone, Email)
+
+        url = f"{self.BASE_URL}/Management/users"
+        try:
+            response = await self.auth_client.put_with_retry(url, headers=headers, data=json.dumps(payload), deadline=deadline)
+            return UsersResponse(response)
+        except HTTPError as http_err:
+            print(f'HTTP error occurred: {http_err}')  # Or handle it in some other way
+            handle_response(response)
+            return response
+
+    async def delete_user(self, userid, deadline=None):
+        headers = {
+            'accept': 'application/json',
+            'Authorization': f'Bearer {await self.auth_client.get_access_token()}'
+        }
+
+        url = f"{self.BASE_URL}/Management/users/{userid}"
+        try:
+            response = await self.auth_client.delete_with_retry(url, headers=headers, deadline=deadline)
+            return UsersResponse(response)
+        except HTTPError as http_err:
+            print(f'HTTP error occurred: {http_err}')  # Or handle it in some other way
+            handle_response(response)
+            return response
+
+
+def DamoovAuth(email, password):
+    auth_client = AsyncTelematicsAuth(email, password)
+    return AsyncUsers(auth_client)
@@ -0,0 +1,240 @@
+# analytics.py
+import numpy as np
+
+from .waypoints import Waypoints
+
+# Mean Earth radius in kilometres
+EARTH_RADIUS_KM = 6371.0088
+
+
+class Track:
+    """
+    A trip's waypoints as NumPy arrays: `time` in seconds since 1970-01-01, `lat` and
+    `lon` in degrees and `speed` as reported by the API (km/h for the Si unit system),
+    or None when the waypoints carry no speed.
+    """
+
+    __slots__ = ('time', 'lat', 'lon', 'speed')
+
+    def __init__(self, time, lat, lon, speed=None):
+        self.time = time
+        self.lat = lat
+        self.lon = lon
+        self.speed = speed
+
+    def __len__(self):
+        return len(self.lat)
+
+    def __repr__(self):
+        return f"Track({len(self)} points)"
+
+    def take(self, indices):
+        """The points at `indices` (an index array, boolean mask or slice)."""
+        return Track(self.time[indices], self.lat[indices], self.lon[indices],
+                     self.speed[indices] if self.speed is not None else None)
+
+    @property
+    def duration(self):
+        return float(self.time[-1] - self.time[0]) if len(self) > 1 else 0.0
+
+
+def track(waypoints, time_field=None, lat_field='Latitude', lon_field='Longitude', speed_field='Speed'):
+    """
+    Builds a `Track` from `Waypoints`, a list of waypoint dicts, or a `TripsResponse`
+    with waypoints. The time field defaults to the first field holding ISO
+    timestamps; pass `time_field` for another one, e.g. an epoch seconds field.
+    Arrays taken from `Waypoints` share its memory where possible.
+    """
+    if isinstance(waypoints, Track):
+        return waypoints
+    if hasattr(waypoints, 'waypoints') and not isinstance(waypoints, (list, Waypoints)):
+        waypoints = waypoints.waypoints
+    if not isinstance(waypoints, Waypoints):
+        waypoints = Waypoints.from_dicts([point for point in waypoints if isinstance(point, dict)])
+    if not waypoints:
+        empty = np.empty(0)
+        return Track(empty, empty, empty)
+    fields = waypoints.fields
+    if time_field is None:
+        if not waypoints.date_fields:
+            raise ValueError("No timestamp field found in the waypoints; pass time_field.")
+        time_field = waypoints.date_fields[0]
+    time = waypoints.to_numpy(time_field)
+    if time.dtype.kind == 'M':
+        time = time.astype('datetime64[us]').astype(np.int64) / 1e6
+    else:
+        time = time.astype(np.float64, copy=False)
+    speed = waypoints.to_numpy(speed_field).astype(np.float64, copy=False) if speed_field in fields else None
+    return Track(time, waypoints.to_numpy(lat_field).astype(np.float64, copy=False),
+                 waypoints.to_numpy(lon_field).astype(np.float64, copy=False), speed)
+
+
+def haversine(lat1, lon1, lat2, lon2):
+    """Great-circle distance in kilometres between points given in degrees; works element-wise on arrays."""
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(value, dtype=np.float64)) for value in (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def segment_distances(trip):
+    """Distance in kilometres between each pair of consecutive points (one fewer than the points)."""
+    trip = track(trip)
+    return haversine(trip.lat[:-1], trip.lon[:-1], trip.lat[1:], trip.lon[1:])
+
+
+def distance(trip):
+    """Length of the trip in kilometres."""
+    return float(segment_distances(trip).sum())
+
+
+def derived_speeds(trip):
+    """Speed in km/h between consecutive points, computed from their positions and times."""
+    trip = track(trip)
+    seconds = np.diff(trip.time)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        speeds = segment_distances(trip) / seconds * 3600.0
+    speeds[~np.isfinite(speeds)] = 0.0
+    return speeds
+
+
+def bounding_box(trip):
+    """(min_lat, min_lon, max_lat, max_lon) of the trip."""
+    trip = track(trip)
+    return float(np.nanmin(trip.lat)), float(np.nanmin(trip.lon)), float(np.nanmax(trip.lat)), float(np.nanmax(trip.lon))
+
+
+def resample(trip, interval=1.0):
+    """
+    The trip at fixed `interval` seconds, with position and speed linearly
+    interpolated between the surrounding points.
+    """
+    trip = track(trip)
+    if len(trip) < 2:
+        return trip
+    order = np.argsort(trip.time, kind='stable')
+    time = trip.time[order]
+    grid = np.arange(time[0], time[-1] + interval / 2, interval)
+    speed = np.interp(grid, time, trip.speed[order]) if trip.speed is not None else None
+    return Track(grid, np.interp(grid, time, trip.lat[order]), np.interp(grid, time, trip.lon[order]), speed)
+
+
+def segments(mask, time, min_duration=0.0):
+    """
+    Runs of consecutive points where `mask` is true and which last at least
+    `min_duration` seconds, as a list of (start_index, end_index) pairs (end inclusive).
+    """
+    mask = np.asarray(mask, dtype=bool)
+    if not mask.any():
+        return []
+    edges = np.diff(np.concatenate(([0], mask.view(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1) - 1
+    keep = time[ends] - time[starts] >= min_duration
+    return list(zip(starts[keep].tolist(), ends[keep].tolist()))
+
+
+def speeding_segments(trip, limit, min_duration=5.0):
+    """Stretches of at least `min_duration` seconds driven above `limit` (in the waypoints' speed unit)."""
+    trip = track(trip)
+    return segments(_speeds(trip) > limit, trip.time, min_duration)
+
+
+def idle_segments(trip, max_speed=2.0, min_duration=60.0):
+    """Stretches of at least `min_duration` seconds at or below `max_speed`, e.g. waiting with the engine on."""
+    trip = track(trip)
+    return segments(_speeds(trip) <= max_speed, trip.time, min_duration)
+
+
+def _speeds(trip):
+    if trip.speed is not None:
+        return trip.speed
+    # Without a speed field, use the speed of the interval that starts at each point
+    derived = derived_speeds(trip)
+    return np.append(derived, derived[-1] if len(derived) else 0.0)
+
+
+def simplify(trip, tolerance=0.01):
+    """
+    Douglas–Peucker simplification: the indices of the points to keep so that no
+    dropped point is more than `tolerance` kilometres from the simplified line.
+    Use `track(...).take(indices)` or `waypoints[...]` to get the points.
+    """
+    trip = track(trip)
+    n = len(trip)
+    if n < 3:
+        return np.arange(n)
+    # Local equirectangular projection to kilometres is accurate enough at trip scale
+    lat0 = np.radians(np.nanmean(trip.lat))
+    x = np.radians(trip.lon) * np.cos(lat0) * EARTH_RADIUS_KM
+    y = np.radians(trip.lat) * EARTH_RADIUS_KM
+
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        dx, dy = x[end] - x[start], y[end] - y[start]
+        px, py = x[start + 1:end] - x[start], y[start + 1:end] - y[start]
+        length = np.hypot(dx, dy)
+        if length == 0:
+            distances = np.hypot(px, py)
+        else:
+            distances = np.abs(dx * py - dy * px) / length
+        i = int(np.argmax(distances))
+        if distances[i] > tolerance:
+            split = start + 1 + i
+            keep[split] = True
+            stack.append((start, split))
+            stack.append((split, end))
+    return np.flatnonzero(keep)
+
+
+def summarize(trips, speed_limit=None, idle_speed=2.0):
+    """
+    Summaries of many trips in one vectorized pass: every trip's points are
+    concatenated and each measure is reduced per trip. `trips` holds anything
+    `track()` accepts. Returns a dict of arrays with one entry per trip:
+    distance_km, duration_s, max_speed, mean_speed, idle_s, min_lat, min_lon,
+    max_lat, max_lon, and speeding_s when `speed_limit` is given. Time is counted
+    as idle or speeding by the speed at the start of each interval.
+    """
+    tracks = [track(trip) for trip in trips]
+    count = len(tracks)
+    lengths = np.array([len(t) for t in tracks], dtype=np.intp)
+    summary = {name: np.full(count, np.nan) for name in
+               ('distance_km', 'duration_s', 'max_speed', 'mean_speed', 'idle_s', 'min_lat', 'min_lon', 'max_lat', 'max_lon')}
+    if speed_limit is not None:
+        summary['speeding_s'] = np.full(count, np.nan)
+    present = np.flatnonzero(lengths > 0)
+    if not len(present):
+        return summary
+
+    tracks = [tracks[i] for i in present]
+    lengths = lengths[present]
+    offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    time = np.concatenate([t.time for t in tracks])
+    lat = np.concatenate([t.lat for t in tracks])
+    lon = np.concatenate([t.lon for t in tracks])
+    speed = np.concatenate([_speeds(t) for t in tracks])
+
+    # Interval i runs from point i to i + 1; intervals crossing into the next trip are zeroed
+    seconds = np.append(np.diff(time), 0.0)
+    kilometres = np.append(haversine(lat[:-1], lon[:-1], lat[1:], lon[1:]), 0.0)
+    last = offsets + lengths - 1
+    seconds[last] = 0.0
+    kilometres[last] = 0.0
+
+    summary['distance_km'][present] = np.add.reduceat(kilometres, offsets)
+    summary['duration_s'][present] = time[last] - time[offsets]
+    summary['max_speed'][present] = np.maximum.reduceat(speed, offsets)
+    summary['mean_speed'][present] = np.add.reduceat(speed, offsets) / lengths
+    summary['idle_s'][present] = np.add.reduceat(np.where(speed <= idle_speed, seconds, 0.0), offsets)
+    if speed_limit is not None:
+        summary['speeding_s'][present] = np.add.reduceat(np.where(speed > speed_limit, seconds, 0.0), offsets)
+    summary['min_lat'][present] = np.minimum.reduceat(lat, offsets)
+    summary['min_lon'][present] = np.minimum.reduceat(lon, offsets)
+    summary['max_lat'][present] = np.maximum.reduceat(lat, offsets)
+    summary['max_lon'][present] = np.maximum.reduceat(lon, offsets)
+    return summary
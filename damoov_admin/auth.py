@@ -1,185 +1,615 @@
 # auth.py
 
+import logging
 import requests
 import threading
 import json
 import os
 import hashlib
-from requests.exceptions import HTTPError
+import base64
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from functools import cached_property
+from urllib.parse import urlencode
+from requests.exceptions import HTTPError, ConnectionError, ConnectTimeout, Timeout, ChunkedEncodingError
+from urllib3.exceptions import NewConnectionError
 from .utility import handle_response
+from .tokens import TokenStore
+from .instrumentation import RequestEvent
+from .ratelimit import parse_retry_after
+from .retry import RetryPolicy
+from .transport import Transport
+from .deadline import Deadline, DeadlineExceeded
+from .cache import ResponseCache
 
-class TelematicsAuth:
+logger = logging.getLogger(__name__)
+
+
+class BaseAuth:
     BASE_URL = "https://user.telematicssdk.com/v1/Auth"
     LOGIN_ENDPOINT = f"{BASE_URL}/Login"
     REFRESH_ENDPOINT = f"{BASE_URL}/RefreshToken"
-    TOKENS_FILE = os.path.join(os.path.expanduser("~"), '.damoov-config', 'token.json')
+    TOKENS_DIR = os.path.join(os.path.expanduser("~"), '.damoov-config')
 
 
-    def __init__(self, email, password):
+    # Seconds before the access token's expiry at which it is refreshed proactively
+    refresh_margin = 60
+    # Times a request answered with 429 is sent again before the error is returned
+    throttle_retries = 3
+
+    def __init__(self, email, password, cache=None, instrumentation=None, rate_limiter=None, retry_policy=None,
+                 circuit_breaker=None, hedge_policy=None, metrics=None, single_flight=None):
         self.email = email
         self.password = password
-        self.lock = threading.Lock()
-        self.session = requests.Session()
+
+        # Optional ResponseCache shared by every module built on this client
+        self.cache = cache
+        # Optional Instrumentation that receives a RequestEvent for sampled requests
+        self.instrumentation = instrumentation
+        # Optional RateLimiter shared by every module built on this client
+        self.rate_limiter = rate_limiter
+        # Backoff for transient failures, and an optional per-host CircuitBreaker
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.circuit_breaker = circuit_breaker
+        # Optional HedgePolicy; slow idempotent reads are then sent a second time
+        self.hedge_policy = hedge_policy
+        # Optional MetricsRegistry recording latency, statuses and retries per endpoint
+        self.metrics = metrics
+        # Optional SingleFlight; identical reads in flight at the same time then share one request
+        self.single_flight = single_flight
         
+        # Loaded from the token file on the first get_access_token(), not here
         self.access_token = None
         self.refresh_token = None
-        
+
+        # Expiry decoded from the access token, and a counter bumped whenever the tokens change
+        self.token_expires_at = None
+        self.token_generation = 0
+        self._refresh_retry_at = 0
+
+    @cached_property
+    def email_hash(self):
         # Use a hash of the email to generate a unique filename
-        self.email_hash = hashlib.md5(email.encode('utf-8')).hexdigest()
-        self.TOKENS_FILE = os.path.join(
-            os.path.expanduser("~"), 
-            '.damoov-config', 
-            f'token_{self.email_hash}.json'
-        )
+        return hashlib.md5(self.email.encode('utf-8')).hexdigest()
 
-        self._load_tokens()
+    @cached_property
+    def TOKENS_FILE(self):
+        return os.path.join(self.TOKENS_DIR, f'token_{self.email_hash}.json')
 
-    def _ensure_directory_exists(self):
-        # Ensure the .damoov directory exists
-        directory = os.path.dirname(self.TOKENS_FILE)
-        if not os.path.exists(directory):
-            os.makedirs(directory)
+    @cached_property
+    def token_store(self):
+        # Shared with every other client (and process) using the same credentials
+        return TokenStore.for_path(self.TOKENS_FILE)
 
     def _save_tokens(self):
-        # Before saving, ensure the directory exists
-        self._ensure_directory_exists()
-        with open(self.TOKENS_FILE, 'w') as f:
-            json.dump({
-                "access_token": self.access_token,
-                "refresh_token": self.refresh_token
-            }, f)
-
-    def _load_tokens(self):
-        if os.path.exists(self.TOKENS_FILE):
-            with open(self.TOKENS_FILE, 'r') as f:
-                tokens = json.load(f)
-                self.access_token = tokens.get("access_token")
-                self.refresh_token = tokens.get("refresh_token")
-
-
-    def login(self):
-        payload = {
+        self.token_store.write({
+            "access_token": self.access_token,
+            "refresh_token": self.refresh_token
+        })
+
+    def _load_tokens(self, fresh=False):
+        """Takes the stored tokens if they differ from ours; returns True if they did."""
+        tokens = self.token_store.read(fresh=fresh)
+        access_token = tokens.get("access_token")
+        if not access_token or access_token == self.access_token:
+            return False
+        self.access_token = access_token
+        self.refresh_token = tokens.get("refresh_token")
+        self.token_expires_at = decode_jwt_expiry(self.access_token)
+        self.token_generation += 1
+        return True
+
+    def _login_payload(self):
+        return {
             "LoginFields": f'{{"email":"{self.email}"}}',
             "Password": self.password
         }
+
+    def _refresh_payload(self):
+        return {
+            "AccessToken": self.access_token,
+            "RefreshToken": self.refresh_token
+        }
+
+    def _set_tokens(self, body):
+        """Stores the tokens from a Login/RefreshToken response body and persists them."""
+        self._take_tokens(body)
+        self._save_tokens()
+
+    def _take_tokens(self, body):
+        tokens = body.get('Result', {})
+        self.access_token = tokens.get('AccessToken', {}).get('Token')
+        self.refresh_token = tokens.get('RefreshToken')
+        self.token_expires_at = decode_jwt_expiry(self.access_token)
+        self.token_generation += 1
+
+    def _expires_soon(self):
+        now = time.time()
+        return (self.token_expires_at is not None
+                and now >= self.token_expires_at - self.refresh_margin
+                and now >= self._refresh_retry_at)
+
+    def _refresh_failed(self, generation):
+        """After a proactive refresh that did not produce new tokens, wait a bit before trying again."""
+        if self.token_generation == generation:
+            self._refresh_retry_at = time.time() + 15
+
+    def _cache_lookup(self, method, url, payload=None):
+        """Returns the cache key (None when caching is off) and the cached response, if any."""
+        if self.cache is None:
+            return None, None
+        key = self.cache.make_key(method, url, payload, identity=self.email_hash)
+        return key, self.cache.get(key)
+
+    def _cache_store(self, key, url, payload, response):
+        if key is not None and response.status_code == 200:
+            self.cache.set(key, response, self.cache.ttl_for(url, payload))
+
+    def _rate_limit_success(self, latency):
+        if self.rate_limiter is not None:
+            self.rate_limiter.on_success(latency)
+
+    def _throttle_delay(self, response, attempt, sent_at=None):
+        """Seconds to wait before resending a request that got a 429: Retry-After, else 1, 2, 4... capped at 30."""
+        retry_after = parse_retry_after(response.headers.get('Retry-After'))
+        if self.rate_limiter is not None:
+            self.rate_limiter.on_throttle(retry_after, sent_at)
+        return retry_after if retry_after is not None else min(2 ** (attempt - 1), 30)
+
+    def _retry_delay(self, attempt, idempotent, status=None, connect_failed=False):
+        """
+        Backoff before sending a request again after its `attempt`-th failure, or None if
+        it should not be retried. Pass the response `status`, or `connect_failed` for errors.
+        """
+        policy = self.retry_policy
+        if attempt > policy.max_retries:
+            return None
+        if status is not None:
+            if not (idempotent and status in policy.statuses):
+                return None
+        elif not (idempotent or connect_failed):
+            return None
+        return policy.delay(attempt)
+
+    def _timeout(self, deadline):
+        """Transport timeout for one attempt, shortened to what is left of `deadline`."""
+        if deadline is None:
+            return self.transport.timeout
+        return deadline.cap(self.transport.timeout)
+
+    @staticmethod
+    def _check_wait(delay, deadline):
+        """Returns `delay`, or raises `DeadlineExceeded` if waiting that long would pass the deadline."""
+        if deadline is not None:
+            deadline.check(delay)
+        return delay
+
+    def _before_send(self, url):
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.before_request(url)
+
+    def _after_send(self, url, ok):
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record(url, ok)
+
+    def _hedgeable(self, method, url, cacheable):
+        # Only reads are hedged: GETs and POSTs marked cacheable
+        policy = self.hedge_policy
+        return policy is not None and (method == 'GET' or cacheable) and policy.applies_to(url)
+
+    def _acquire_hedge(self):
+        if not self.hedge_policy.acquire_hedge():
+            return False
+        if self.rate_limiter is not None and self.rate_limiter.reserve() > 0:
+            # A hedge is never worth waiting for the rate limiter
+            self.hedge_policy.release_hedge()
+            return False
+        return True
+
+    def _coalesces(self, method, cacheable):
+        return self.single_flight is not None and (method == 'GET' or cacheable)
+
+    def _flight_key(self, method, url, headers, payload, params):
+        # The token is left out since it changes on refresh; the credentials behind it are not
+        headers = sorted((key.lower(), str(value)) for key, value in (headers or {}).items()
+                         if key.lower() != 'authorization')
+        if params:
+            url = f"{url}{'&' if '?' in url else '?'}{urlencode(params)}"
+        return ResponseCache.make_key(method, url, payload, identity=(self.email_hash, tuple(headers)))
+
+    def _record_renewal(self, kind):
+        if self.metrics is not None:
+            self.metrics.token_renewal(kind)
+
+    def _start_request(self):
+        """Start time of a request that was sampled for instrumentation, else None."""
+        if self.instrumentation is None or not self.instrumentation.sample():
+            return None
+        return time.perf_counter()
+
+    def _record_request(self, started, method, url, response=None, retries=0, cached=False, error=None):
+        if started is None:
+            return
+        self.instrumentation.emit(RequestEvent(
+            method,
+            url,
+            status=getattr(response, 'status_code', None),
+            latency=time.perf_counter() - started,
+            bytes=len(getattr(response, 'content', None) or b''),
+            retries=retries,
+            cached=cached,
+            error=error,
+        ))
+
+
+class TelematicsAuth(BaseAuth):
+
+    def __init__(self, email, password, pool_maxsize=10, cache=None, auto_refresh=False, instrumentation=None,
+                 rate_limiter=None, retry_policy=None, circuit_breaker=None, transport=None, hedge_policy=None,
+                 metrics=None, single_flight=None):
+        self.lock = threading.Lock()
+        self._auto_refresh = False
+        self._auto_refresh_failures = 0
+        self._refresh_timer = None
+
+        # Connections kept alive per host; size it to the number of threads sharing this client
+        self.transport = transport if transport is not None else Transport(pool_maxsize)
+        self.session = self.transport.session
+        self.pool_maxsize = self.transport.pool_maxsize
+
+        super().__init__(email, password, cache, instrumentation, rate_limiter, retry_policy, circuit_breaker,
+                         hedge_policy, metrics, single_flight)
+        # Runs both copies of a hedged request; threads are only started once hedging kicks in.
+        # A copy is only submitted while a worker is free, so no copy waits in the queue.
+        self._hedge_executor = None
+        if hedge_policy is not None:
+            self._hedge_executor = ThreadPoolExecutor(max_workers=2 * self.pool_maxsize,
+                                                      thread_name_prefix='damoov-hedge')
+            self._hedge_workers = threading.BoundedSemaphore(2 * self.pool_maxsize)
+
+        if auto_refresh:
+            self.start_auto_refresh()
+
+
+    def login(self, deadline=None):
+        self._record_renewal('login')
+        payload = self._login_payload()
         headers = {'accept': 'application/json', 'content-type': 'application/json'}
         try:
-            response = self.session.post(self.LOGIN_ENDPOINT, json=payload, headers=headers)  # Use session
+            response = self.transport.request('POST', self.LOGIN_ENDPOINT, json=payload, headers=headers,
+                                              timeout=self._timeout(deadline))
             response.raise_for_status()
-            tokens = response.json().get('Result', {})
-            self.access_token = tokens.get('AccessToken', {}).get('Token')
-            self.refresh_token = tokens.get('RefreshToken')
-            self._save_tokens()
+            self._set_tokens(response.json())
         except HTTPError as http_err:
             print(f'HTTP error occurred: {http_err}')  # Or handle it in some other way
             handle_response(response)
             return response
 
-    def refresh(self):
+    def refresh(self, deadline=None):
         if not self.refresh_token:
-            self.login()
+            self.login(deadline)
             return
 
-        payload = {
-            "AccessToken": self.access_token,
-            "RefreshToken": self.refresh_token
-        }
+        self._record_renewal('refresh')
+        payload = self._refresh_payload()
         headers = {'accept': 'application/json', 'content-type': 'application/json'}
         try:
-            response = self.session.post(self.REFRESH_ENDPOINT, json=payload, headers=headers)  # Use session
+            response = self.transport.request('POST', self.REFRESH_ENDPOINT, json=payload, headers=headers,
+                                              timeout=self._timeout(deadline))
             if response.status_code == 401:
-                self.login()
+                self.login(deadline)
                 return
             response.raise_for_status()
-            tokens = response.json().get('Result', {})
-            self.access_token = tokens.get('AccessToken', {}).get('Token')
-            self.refresh_token = tokens.get('RefreshToken')
-            self._save_tokens()
+            self._set_tokens(response.json())
         except HTTPError as http_err:
             print(f'HTTP error occurred: {http_err}')  # Or handle it in some other way
             handle_response(response)
             return response
 
     def get_access_token(self):
+        # Hot path: a loaded token that is not about to expire needs no lock
+        if self.access_token and not self._expires_soon():
+            return self.access_token
+
         with self.lock:
-            if not hasattr(self, 'access_token'):
-                self.access_token = None
-            
             # If the access token isn't available, try loading it
             if not self.access_token:
                 self._load_tokens()
             
             # If it still isn't available, then call login to get a fresh token
             if not self.access_token:
-                self.login()
+                self._renew_tokens(login=True)
+            # Refresh ahead of expiry, unless another thread did while we waited for the lock
+            elif self._expires_soon():
+                generation = self.token_generation
+                self._renew_tokens()
+                self._refresh_failed(generation)
             
             return self.access_token
 
 
-    def handle_401(self):
+    def handle_401(self, generation=None, deadline=None):
+        """
+        Refreshes the tokens after a 401. Pass the `token_generation` the failed request
+        was sent with: if the tokens have changed since, another thread already refreshed
+        them and this call returns without a second refresh.
+        """
         with self.lock:
-            self.refresh()
-            
-    def get_with_retry(self, url, headers=None):
-        """Performs a GET request and retries once if a 401 status is encountered."""
-        try:
-            response = self.session.get(url, headers=headers)
-            if response.status_code == 401:
-                self.handle_401()
-                updated_headers = headers.copy() if headers else {}
-                updated_headers['authorization'] = f'Bearer {self.get_access_token()}'
-                response = self.session.get(url, headers=updated_headers)
-            response.raise_for_status()
-            return response
-        except HTTPError as http_err:
-            print(f'HTTP error occurred: {http_err}')  # Or handle it in some other way
-            handle_response(response)
-            return response
-    
-    def post_with_retry(self, url, headers=None, json=None, data=None):
-        """Performs a POST request and retries once if a 401 status is encountered."""
+            if generation is not None and generation != self.token_generation:
+                return
+            self._renew_tokens(deadline=deadline)
+
+    def _renew_tokens(self, login=False, deadline=None):
+        """
+        Logs in or refreshes while holding the token file lock, so only one process
+        renews the shared tokens. If another process stored new tokens while we waited
+        for the lock, those are used instead.
+        """
+        with self.token_store.locked():
+            if self._load_tokens(fresh=True):
+                return
+            if login:
+                self.login(deadline)
+            else:
+                self.refresh(deadline)
+
+    def start_auto_refresh(self):
+        """Refreshes the tokens on a background timer shortly before each one expires."""
+        with self.lock:
+            self._auto_refresh = True
+        self._schedule_auto_refresh()
+
+    def stop_auto_refresh(self):
+        with self.lock:
+            self._auto_refresh = False
+            if self._refresh_timer is not None:
+                self._refresh_timer.cancel()
+                self._refresh_timer = None
+
+    def _schedule_auto_refresh(self):
+        with self.lock:
+            if not self._auto_refresh:
+                return
+            if self._refresh_timer is not None:
+                self._refresh_timer.cancel()
+            # Without a known expiry, check again after the margin has passed
+            delay = self.refresh_margin
+            if self.token_expires_at is not None:
+                delay = self.token_expires_at - self.refresh_margin - time.time()
+            # After a failed refresh, wait out the backoff instead of retrying every second
+            delay = max(delay, self._refresh_retry_at - time.time(), 1)
+            self._refresh_timer = threading.Timer(delay, self._auto_refresh_tick)
+            self._refresh_timer.daemon = True
+            self._refresh_timer.start()
+
+    def _auto_refresh_tick(self):
         try:
-            response = self.session.post(url, headers=headers, json=json, data=data)
-            if response.status_code == 401:
-                self.handle_401()
-                updated_headers = headers.copy() if headers else {}
-                updated_headers['authorization'] = f'Bearer {self.get_access_token()}'
-                response = self.session.post(url, headers=updated_headers, json=json, data=data)
-            response.raise_for_status()
-            return response
-        except HTTPError as http_err:
-            print(f'HTTP error occurred: {http_err}')  # Or handle it in some other way
-            handle_response(response)
-            return response
+            self.get_access_token()
+            self._auto_refresh_failures = 0
+        except Exception as exc:
+            # Back off 15s, 30s, ... up to 5 minutes; only the first failure in a row is a warning
+            self._auto_refresh_failures += 1
+            backoff = min(15 * 2 ** (self._auto_refresh_failures - 1), 300)
+            self._refresh_retry_at = time.time() + backoff
+            log = logger.warning if self._auto_refresh_failures == 1 else logger.debug
+            log('Background token refresh failed (%d in a row), retrying in %ds: %r',
+                self._auto_refresh_failures, backoff, exc)
+        finally:
+            self._schedule_auto_refresh()
 
-    def put_with_retry(self, url, headers=None, json=None, data=None):
-        """Performs a PUT request and retries once if a 401 status is encountered."""
+    def _request_with_retry(self, method, url, headers=None, json=None, data=None, params=None, cacheable=False,
+                            authenticate=True, deadline=None):
+        if not self._coalesces(method, cacheable):
+            return self._perform_request(method, url, headers, json, data, params, cacheable, authenticate, deadline)
+        deadline = Deadline.of(deadline)
+        key = self._flight_key(method, url, headers, json if json is not None else data, params)
+        return self.single_flight.do(key, lambda: self._perform_request(method, url, headers, json, data, params,
+                                                                        cacheable, authenticate, deadline), deadline)
+
+    def _perform_request(self, method, url, headers=None, json=None, data=None, params=None, cacheable=False,
+                         authenticate=True, deadline=None):
+        payload = json if json is not None else data
+        deadline = Deadline.of(deadline)
+        started = self._start_request()
+        metrics = self.metrics
+        tracked = metrics.start(method, url) if metrics is not None else None
+        cache_key, cached = self._cache_lookup(method, url, payload) if cacheable else (None, None)
+        if cached is not None:
+            self._record_request(started, method, url, cached, cached=True)
+            if tracked is not None:
+                metrics.finish(tracked, cached, cached=True)
+            return cached
+        response = None
+        retries = 0
+        error = None
         try:
-            response = self.session.put(url, headers=headers, json=json, data=data)
-            if response.status_code == 401:
-                self.handle_401()
-                updated_headers = headers.copy() if headers else {}
-                updated_headers['authorization'] = f'Bearer {self.get_access_token()}'
-                response = self.session.post(url, headers=updated_headers, json=json, data=data)
+            generation = self.token_generation
+            idempotent = cacheable or self.retry_policy.is_idempotent(method)
+            hedge = self._hedgeable(method, url, cacheable)
+            refreshed = False
+            throttled = 0
+            failures = 0
+            while True:
+                self._before_send(url)
+                if self.rate_limiter is not None:
+                    if not self.rate_limiter.acquire(deadline.remaining() if deadline is not None else None):
+                        raise DeadlineExceeded(f"Deadline of {deadline.seconds}s exceeded waiting for the rate limiter")
+                timeout = self._timeout(deadline)
+                sent_at = time.monotonic()
+                try:
+                    response = self._send(method, url, hedge, headers=headers, params=params, json=json, data=data,
+                                          timeout=timeout)
+                except (ConnectionError, Timeout, ChunkedEncodingError) as exc:
+                    self._after_send(url, ok=False)
+                    failures += 1
+                    delay = self._retry_delay(failures, idempotent, connect_failed=_connect_failed(exc))
+                    if delay is None:
+                        raise
+                    if tracked is not None:
+                        metrics.retry(tracked, 'connection')
+                    time.sleep(self._check_wait(delay, deadline))
+                    retries += 1
+                    continue
+                self._after_send(url, ok=response.status_code < 500)
+                if response.status_code == 401 and authenticate and not refreshed:
+                    # Skip the refresh if the request went out with a token that has since been replaced
+                    if _bearer_token(headers) in (None, self.access_token):
+                        self.handle_401(generation, deadline)
+                    headers = headers.copy() if headers else {}
+                    headers['authorization'] = f'Bearer {self.get_access_token()}'
+                    refreshed = True
+                    if tracked is not None:
+                        metrics.retry(tracked, 'unauthorized')
+                elif response.status_code == 429 and throttled < self.throttle_retries:
+                    throttled += 1
+                    if tracked is not None:
+                        metrics.retry(tracked, 'throttled')
+                    time.sleep(self._check_wait(self._throttle_delay(response, throttled, sent_at), deadline))
+                else:
+                    delay = self._retry_delay(failures + 1, idempotent, status=response.status_code)
+                    if delay is None:
+                        if response.status_code != 429:
+                            self._rate_limit_success(time.monotonic() - sent_at)
+                        break
+                    failures += 1
+                    if tracked is not None:
+                        metrics.retry(tracked, 'status')
+                    time.sleep(self._check_wait(delay, deadline))
+                retries += 1
             response.raise_for_status()
+            self._cache_store(cache_key, url, payload, response)
             return response
         except HTTPError as http_err:
             print(f'HTTP error occurred: {http_err}')  # Or handle it in some other way
             handle_response(response)
             return response
+        except Exception as exc:
+            error = exc
+            raise
+        finally:
+            self._record_request(started, method, url, response, retries, error=error)
+            if tracked is not None:
+                metrics.finish(tracked, response, error, payload, retries + 1)
+            
+    def _send(self, method, url, hedge=False, **kwargs):
+        if not hedge:
+            return self.transport.request(method, url, **kwargs)
+        policy = self.hedge_policy
+        delay = policy.delay_for(url)
+        # Without latency samples, or with every worker busy, the request is sent unhedged on
+        # the caller's thread: time spent queued would count toward the hedge delay
+        if delay is None or not self._hedge_workers.acquire(blocking=False):
+            return self._timed_send(method, url, kwargs)
+        first = self._submit_copy(method, url, kwargs)
+        done, _ = wait([first], timeout=delay)
+        if done or not self._hedge_workers.acquire(blocking=False):
+            return first.result()
+        if not self._acquire_hedge():
+            self._hedge_workers.release()
+            return first.result()
+        second = self._submit_copy(method, url, kwargs)
+        pending = {first, second}
+        winner = None
+        error = None
+        while pending and winner is None:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    winner = winner or future
+                else:
+                    error = error or future.exception()
+        self._settle_hedge((first, second), winner)
+        if winner is None:
+            raise error
+        if winner is second:
+            policy.record_win()
+        return winner.result()
+
+    def _settle_hedge(self, futures, winner):
+        """
+        A running request cannot be cancelled, so the slower copy is left to finish in
+        the background. Its response is closed when it does, and the hedge keeps its
+        `max_in_flight` slot until then.
+        """
+        remaining = [len(futures)]
+        lock = threading.Lock()
+
+        def settle(future):
+            if future is not winner and future.exception() is None:
+                close = getattr(future.result(), 'close', None)
+                if close is not None:
+                    close()
+            with lock:
+                remaining[0] -= 1
+                last = remaining[0] == 0
+            if last:
+                self.hedge_policy.finish_hedge()
+
+        for future in futures:
+            future.add_done_callback(settle)
+
+    def _submit_copy(self, method, url, kwargs):
+        """Runs one copy on a hedge worker taken from `_hedge_workers`, which it frees when done."""
+        future = self._hedge_executor.submit(self._timed_send, method, url, kwargs)
+        future.add_done_callback(lambda _: self._hedge_workers.release())
+        return future
+
+    def _timed_send(self, method, url, kwargs):
+        sent_at = time.monotonic()
+        response = self.transport.request(method, url, **kwargs)
+        if response.status_code < 400:
+            self.hedge_policy.record(url, time.monotonic() - sent_at)
+        return response
+
+    def get_with_retry(self, url, headers=None, params=None, authenticate=True, deadline=None):
+        """
+        Performs a GET request and retries once if a 401 status is encountered.
+        Pass `authenticate=False` for endpoints that do not take the admin token (a 401
+        is then returned as is, and the response is not cached). `deadline` (seconds or a
+        `Deadline`) bounds every attempt, retry and token refresh together.
+        """
+        return self._request_with_retry('GET', url, headers=headers, params=params,
+                                        cacheable=params is None and authenticate, authenticate=authenticate,
+                                        deadline=deadline)
     
-    def delete_with_retry(self, url, headers=None, json=None, data=None):
+    def post_with_retry(self, url, headers=None, json=None, data=None, cacheable=False, deadline=None):
+        """
+        Performs a POST request and retries once if a 401 status is encountered.
+        Pass `cacheable=True` for read-only POSTs whose response may be served from the cache.
+        """
+        return self._request_with_retry('POST', url, headers=headers, json=json, data=data, cacheable=cacheable,
+                                        deadline=deadline)
+
+    def put_with_retry(self, url, headers=None, json=None, data=None, deadline=None):
         """Performs a PUT request and retries once if a 401 status is encountered."""
-        try:
-            response = self.session.delete(url, headers=headers, json=json, data=data)
-            if response.status_code == 401:
-                self.handle_401()
-                updated_headers = headers.copy() if headers else {}
-                updated_headers['authorization'] = f'Bearer {self.get_access_token()}'
-                response = self.session.post(url, headers=updated_headers, json=json, data=data)
-            response.raise_for_status()
-            return response
-        except HTTPError as http_err:
-            print(f'HTTP error occurred: {http_err}')  # Or handle it in some other way
-            handle_response(response)
-            return response
\ No newline at end of file
+        return self._request_with_retry('PUT', url, headers=headers, json=json, data=data, deadline=deadline)
+    
+    def delete_with_retry(self, url, headers=None, json=None, data=None, deadline=None):
+        """Performs a DELETE request and retries once if a 401 status is encountered."""
+        return self._request_with_retry('DELETE', url, headers=headers, json=json, data=data, deadline=deadline)
+
+
+def decode_jwt_expiry(token):
+    """Returns the `exp` claim of a JWT as a Unix timestamp, or None if it cannot be read."""
+    try:
+        claims = token.split('.')[1]
+        claims += '=' * (-len(claims) % 4)
+        exp = json.loads(base64.urlsafe_b64decode(claims)).get('exp')
+        return float(exp) if exp is not None else None
+    except (AttributeError, IndexError, ValueError, TypeError):
+        return None
+
+
+def _connect_failed(error):
+    """True if the connection could not be opened, so the request was never sent."""
+    if isinstance(error, ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], 'reason', None) if error.args else None
+    return isinstance(reason, NewConnectionError)
+
+
+def _bearer_token(headers):
+    for key, value in (headers or {}).items():
+        if key.lower() == 'authorization' and isinstance(value, str) and value.startswith('Bearer '):
+            return value[len('Bearer '):]
+    return None
@@ -0,0 +1,175 @@
+# bulk.py
+import asyncio
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+_EXHAUSTED = object()
+
+# Marks the threads of iter_bulk pools, so calls made on them do not start pools of their own
+_worker = threading.local()
+
+
+class BulkResult:
+    """Outcome of one call in a bulk run: either a response or the exception it raised."""
+
+    def __init__(self, key, response=None, error=None):
+        self.key = key
+        self.response = response
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        if self.ok:
+            return f"BulkResult({self.key!r}, response={type(self.response).__name__})"
+        return f"BulkResult({self.key!r}, error={self.error!r})"
+
+
+def _unique(keys):
+    # Preserve the caller's order while dropping duplicate keys
+    return list(dict.fromkeys(keys))
+
+
+def in_bulk_worker():
+    """True on a worker thread of `iter_bulk`."""
+    return getattr(_worker, 'active', False)
+
+
+def _mark_worker():
+    _worker.active = True
+
+
+def iter_bulk(func, keys, max_workers=8):
+    """
+    Calls `func(key)` for every key on a pool of `max_workers` threads and yields a
+    `BulkResult` per key as soon as it completes. At most `max_workers * 2` calls are
+    queued at any time, so large key lists do not build up a backlog of futures.
+    An exception raised for one key is captured in its result instead of aborting the run.
+    Code running in `func` can check `in_bulk_worker()` to avoid nesting another pool.
+    """
+    keys = iter(_unique(keys))
+    executor = ThreadPoolExecutor(max_workers=max_workers, initializer=_mark_worker)
+    pending = {}
+    try:
+        for key in keys:
+            pending[executor.submit(func, key)] = key
+            if len(pending) >= max_workers * 2:
+                break
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                key = pending.pop(future)
+                error = future.exception()
+                if error is None:
+                    yield BulkResult(key, response=future.result())
+                else:
+                    yield BulkResult(key, error=error)
+
+                next_key = next(keys, _EXHAUSTED)
+                if next_key is not _EXHAUSTED:
+                    pending[executor.submit(func, next_key)] = next_key
+    finally:
+        # Also runs when the caller stops iterating early
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+async def aiter_bulk(func, keys, max_workers=100):
+    """
+    asyncio counterpart of `iter_bulk`: awaits `func(key)` for every key with at most
+    `max_workers` calls in flight and yields a `BulkResult` per key as it completes.
+    """
+    keys = iter(_unique(keys))
+    pending = {}
+
+    def schedule():
+        for key in keys:
+            pending[asyncio.ensure_future(func(key))] = key
+            if len(pending) >= max_workers:
+                return
+
+    schedule()
+    try:
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                key = pending.pop(task)
+                error = task.exception()
+                if error is None:
+                    yield BulkResult(key, response=task.result())
+                else:
+                    yield BulkResult(key, error=error)
+            schedule()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def read_ahead_iter(iterable, size):
+    """
+    Consumes `iterable` on a background thread, keeping up to `size` items buffered
+    ahead of the caller. Exceptions raised while producing are re-raised to the caller
+    in order; abandoning the iterator stops the background thread.
+    """
+    buffer = queue.Queue(maxsize=size)
+    stop = threading.Event()
+
+    def put(entry):
+        while not stop.is_set():
+            try:
+                buffer.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put((item, None)):
+                    return
+        except Exception as error:
+            put((None, error))
+            return
+        put((_EXHAUSTED, None))
+
+    threading.Thread(target=produce, daemon=True).start()
+    try:
+        while True:
+            item, error = buffer.get()
+            if error is not None:
+                raise error
+            if item is _EXHAUSTED:
+                return
+            yield item
+    finally:
+        stop.set()
+
+
+async def aread_ahead_iter(aiterable, size):
+    """asyncio counterpart of `read_ahead_iter`, producing on a background task."""
+    buffer = asyncio.Queue(maxsize=size)
+
+    async def produce():
+        try:
+            async for item in aiterable:
+                await buffer.put((item, None))
+        except Exception as error:
+            await buffer.put((None, error))
+            return
+        await buffer.put((_EXHAUSTED, None))
+
+    task = asyncio.ensure_future(produce())
+    try:
+        while True:
+            item, error = await buffer.get()
+            if error is not None:
+                raise error
+            if item is _EXHAUSTED:
+                return
+            yield item
+    finally:
+        task.cancel()
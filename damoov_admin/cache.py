@@ -0,0 +1,114 @@
+# cache.py
+import datetime
+import json
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlsplit, parse_qsl, urlencode
+
+
+class ResponseCache:
+    """
+    Size-bounded LRU cache for successful read responses.
+
+    Entries expire after `ttl` seconds. `endpoint_ttls` overrides that per endpoint:
+    it maps a piece of the URL path (e.g. 'Statistics/dates') to a TTL, and the
+    longest matching piece wins. Requests whose end date is before yesterday (UTC)
+    cover days that are closed in every timezone, so they are kept for at least
+    `closed_ttl` seconds. Once `maxsize` entries are stored, the least recently
+    used entry is evicted.
+
+    Pass an instance to `TelematicsAuth(..., cache=ResponseCache())` to enable it
+    for every module built on that auth client.
+    """
+
+    def __init__(self, maxsize=1024, ttl=60, endpoint_ttls=None, closed_ttl=6 * 3600, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.endpoint_ttls = dict(endpoint_ttls or {})
+        self.closed_ttl = closed_ttl
+        self.clock = clock
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(method, url, payload=None, identity=None):
+        """Builds a key that does not depend on the order of query parameters or payload fields."""
+        parts = urlsplit(url)
+        query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+        body = json.dumps(payload, sort_keys=True, default=str) if payload is not None else ''
+        return f"{identity}|{method}|{parts.netloc}{parts.path}?{query}|{body}"
+
+    def ttl_for(self, url, payload=None):
+        path = urlsplit(url).path
+        matches = [piece for piece in self.endpoint_ttls if piece in path]
+        ttl = self.endpoint_ttls[max(matches, key=len)] if matches else self.ttl
+
+        end_date = _end_date(url, payload)
+        today = datetime.datetime.now(datetime.timezone.utc).date()
+        if end_date is not None and end_date < today - datetime.timedelta(days=1):
+            ttl = max(ttl, self.closed_ttl)
+        return ttl
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > self.clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def set(self, key, value, ttl=None):
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (self.clock() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def _end_date(url, payload=None):
+    """End of the requested period from the query string or a Trips payload, if any."""
+    value = dict(parse_qsl(urlsplit(url).query)).get('EndDate')
+    if value is None and isinstance(payload, dict):
+        value = payload.get('EndDate')
+        if value is None and payload.get('EndDateTimestampSec'):
+            return datetime.datetime.fromtimestamp(int(payload['EndDateTimestampSec']), datetime.timezone.utc).date()
+    if not value:
+        return None
+    try:
+        return datetime.date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
@@ -0,0 +1,72 @@
+# codec.py
+import json
+
+# Tried in this order when no backend has been chosen
+BACKENDS = ('orjson', 'msgspec', 'json')
+
+_backend = None
+_loads = None
+
+
+def use_backend(backend=None):
+    """
+    Chooses how response bodies are decoded: 'orjson', 'msgspec', 'json', or any
+    callable taking bytes and returning the decoded object. None picks the first
+    installed backend in `BACKENDS`. Returns the name of the backend in use.
+    """
+    global _backend, _loads
+    if callable(backend):
+        _backend, _loads = getattr(backend, '__name__', 'custom'), backend
+        return _backend
+    for name in ([backend] if backend else BACKENDS):
+        try:
+            loads = _load(name)
+        except ImportError:
+            if backend:
+                raise
+            continue
+        _backend, _loads = name, loads
+        return name
+
+
+def backend():
+    if _loads is None:
+        use_backend()
+    return _backend
+
+
+def _load(name):
+    if name == 'orjson':
+        import orjson
+        return orjson.loads
+    if name == 'msgspec':
+        import msgspec
+        decoder = msgspec.json.Decoder()
+
+        def loads(data):
+            try:
+                return decoder.decode(data)
+            except msgspec.DecodeError as exc:
+                # Callers expect ValueError, like json.loads raises
+                raise ValueError(str(exc)) from exc
+        return loads
+    if name == 'json':
+        return json.loads
+    raise ValueError(f"Unknown JSON backend '{name}'. Choose one of: {', '.join(BACKENDS)}.")
+
+
+def loads(data):
+    if _loads is None:
+        use_backend()
+    return _loads(data)
+
+
+def decode(response):
+    """Decodes the JSON body of a `requests.Response` or `AsyncResponse`."""
+    if _loads is None:
+        use_backend()
+    try:
+        return _loads(response.content)
+    except ValueError:
+        # Bodies that are not UTF-8 JSON get the response's own decoding and error
+        return response.json()
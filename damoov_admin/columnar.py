@@ -0,0 +1,118 @@
+# columnar.py
+import warnings
+from datetime import datetime, timezone
+
+import numpy as np
+
+
+def rows_to_columns(rows):
+    """
+    Turns a list of row dicts into a dict of column name -> NumPy array.
+
+    Fields ending in 'Date' become datetime64[ms] arrays (NaT where missing), numeric
+    and boolean fields become float64 arrays (NaN where missing), and anything else
+    is kept in an object array. Columns are ordered as the fields first appear.
+    """
+    names = {}
+    for row in rows:
+        for name in row:
+            names[name] = None
+    return {name: _column(name, [row.get(name) for row in rows]) for name in names}
+
+
+def columns_to_records(columns):
+    """Packs columns of equal length into one NumPy structured array with a field per column."""
+    if not columns:
+        return np.empty(0, dtype=[])
+    return np.rec.fromarrays(list(columns.values()), names=list(columns))
+
+
+def _column(name, values):
+    present = [value for value in values if value is not None]
+    if present and name.endswith('Date') and all(isinstance(value, str) for value in present):
+        dates = _dates(values)
+        if dates is not None:
+            return dates
+    if all(isinstance(value, (int, float)) for value in present):
+        return np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+def _dates(values):
+    try:
+        with warnings.catch_warnings():
+            # NumPy only warns about timezone suffixes; handle them below instead
+            warnings.simplefilter('error')
+            return np.array(values, dtype='datetime64[ms]')
+    except (ValueError, Warning):
+        pass
+    try:
+        return np.array([None if value is None else _utc(value) for value in values], dtype='datetime64[ms]')
+    except ValueError:
+        return None
+
+
+def _utc(value):
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+class ColumnTable:
+    """
+    Rows of many users' responses in one set of columns.
+
+    `columns` maps field name -> array as in `rows_to_columns`. `users` holds each
+    user_id once and `user_index[i]` is the position in `users` of row i, so per-user
+    aggregates are vectorized: `table.sum('MileageKm')[k]` is the mileage of
+    `table.users[k]`.
+    """
+
+    def __init__(self, columns, users, user_index):
+        self.columns = columns
+        self.users = users
+        self.user_index = user_index
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def __contains__(self, name):
+        return name in self.columns
+
+    def __len__(self):
+        return len(self.user_index)
+
+    def sum(self, name):
+        """Per-user sum of a numeric column, ignoring missing values."""
+        values = self.columns[name]
+        present = ~np.isnan(values)
+        return np.bincount(self.user_index[present], weights=values[present], minlength=len(self.users))
+
+    def count(self, name):
+        """Per-user number of rows where a numeric column is present."""
+        present = ~np.isnan(self.columns[name])
+        return np.bincount(self.user_index[present], minlength=len(self.users))
+
+    def mean(self, name):
+        """Per-user mean of a numeric column; NaN for users without values."""
+        counts = self.count(name)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return self.sum(name) / counts
+
+    @classmethod
+    def from_rows(cls, rows_by_user):
+        """`rows_by_user` is an iterable of (user_id, list of row dicts)."""
+        users = []
+        rows = []
+        index = []
+        for user_id, user_rows in rows_by_user:
+            position = len(users)
+            users.append(user_id)
+            rows.extend(user_rows)
+            index.extend([position] * len(user_rows))
+        user_array = np.empty(len(users), dtype=object)
+        user_array[:] = users
+        return cls(rows_to_columns(rows), user_array, np.array(index, dtype=np.intp))
@@ -0,0 +1,44 @@
+# deadline.py
+import time
+
+from requests.exceptions import Timeout
+
+
+class Deadline:
+    """
+    Point in time by which a whole operation must finish: every attempt, retry wait,
+    token refresh and page it involves. Create it once per call and pass the same
+    instance down, so nested requests share what is left of the budget.
+    """
+
+    def __init__(self, seconds, clock=time.monotonic):
+        self.seconds = seconds
+        self.clock = clock
+        self.expires_at = clock() + seconds
+
+    @classmethod
+    def of(cls, value):
+        """Accepts None, a `Deadline`, or a number of seconds from now."""
+        if value is None or isinstance(value, Deadline):
+            return value
+        return cls(value)
+
+    def remaining(self):
+        return max(0.0, self.expires_at - self.clock())
+
+    def check(self, wait=0):
+        """Raises `DeadlineExceeded` unless more than `wait` seconds are left."""
+        if self.expires_at - self.clock() <= wait:
+            raise DeadlineExceeded(f"Deadline of {self.seconds}s exceeded")
+
+    def cap(self, timeout):
+        """Shortens a requests-style timeout (seconds or (connect, read)) to the time left."""
+        self.check()
+        remaining = self.remaining()
+        if isinstance(timeout, tuple):
+            return tuple(remaining if t is None else min(t, remaining) for t in timeout)
+        return remaining if timeout is None else min(timeout, remaining)
+
+
+class DeadlineExceeded(Timeout):
+    """Raised when an operation runs out of time before it could complete."""
@@ -1,10 +1,12 @@
 # engagement.py
 import requests
 from datetime import datetime, timedelta
+from functools import cached_property
 
 from .auth import TelematicsAuth
 from .core import TelematicsCore
 from .utility import handle_response, adjust_date_range
+from .codec import decode
 from requests.exceptions import HTTPError
 import json
 
@@ -23,12 +25,25 @@ class BaseEngament:
             'accept': 'application/json',
             'authorization': f'Bearer {self.auth_client.get_access_token()}'
         }
+
+    def _get_leaderboard(self, url, headers, params=None, deadline=None):
+        try:
+            # Leaderboard calls are identified by the device token, not the admin token
+            response = self.auth_client.get_with_retry(url, headers=headers, params=params, authenticate=False,
+                                                       deadline=deadline)
+
+            response.raise_for_status()
+            return EngagementResponse(decode(response))
+        except HTTPError as http_err:
+            print(f'HTTP error occurred: {http_err}')
+            e_response = handle_response(response, EngagementResponse) # Pass EngagementResponse as an argument
+            return e_response
         
 class EngagementModule:
     def __init__(self, core: TelematicsCore):
         self.core = core  # Renamed self.code to self.core for clarity
         
-    @property
+    @cached_property
     def Engagement(self):
         return Engagement(self.core.auth_client)
 
@@ -53,7 +68,16 @@ class EngagementResponse:
 
 class Engagement(BaseEngament):
 
-    def get_user_leaderboard(self, user_id):
+    def get_user_leaderboard(self, user_id, deadline=None):
+        return self._get_leaderboard(*self._user_leaderboard_request(user_id), deadline=deadline)
+
+    def get_general_leaderboard(self, user_id, leaders_count=5, round_users_count=2, ratingtype=1, deadline=None):
+        return self._get_leaderboard(*self._general_leaderboard_request(user_id, leaders_count, round_users_count, ratingtype),
+                                     deadline=deadline)
+
+    # Request building, shared with the asyncio client
+
+    def _user_leaderboard_request(self, user_id):
         headers = {
             'Devicetoken': user_id,
             'accept': 'application/json',
@@ -63,21 +87,9 @@ class Engagement(BaseEngament):
         # print(url)
         # print(headers)
         
-        try:
-            response = requests.get(url, headers=headers)
-            # print(response.status_code)
-            # print(response.text)
-
-            response.raise_for_status()
-            return EngagementResponse(response.json())
-        except HTTPError as http_err:
-            print(f'HTTP error occurred: {http_err}')
-            e_response = handle_response(response, EngagementResponse) # Pass EngagementResponse as an argument
-            return e_response
-
-
+        return url, headers
 
-    def get_general_leaderboard(self, user_id, leaders_count=5, round_users_count=2, ratingtype=1):
+    def _general_leaderboard_request(self, user_id, leaders_count, round_users_count, ratingtype):
         
         headers = {
             'DeviceToken': user_id,
@@ -94,15 +106,7 @@ class Engagement(BaseEngament):
 
         # Add the provided parameter to the URL
 
-        try:
-            response=requests.get(url, headers=headers, params=params)
-
-            response.raise_for_status()
-            return EngagementResponse(response.json())
-        except HTTPError as http_err:
-            print(f'HTTP error occurred: {http_err}')
-            e_response = handle_response(response, EngagementResponse) # Pass EngagementResponse as an argument
-            return e_response
+        return url, headers, params
 
 
 
@@ -0,0 +1,217 @@
+# fleet_sync.py
+import datetime
+import sqlite3
+import threading
+
+from .auth import TelematicsAuth
+from .bulk import iter_bulk
+from .statistics import Statistics
+from .trips import Trips
+from .utility import is_error_data
+
+
+class WatermarkStore:
+    """
+    SQLite table holding, per user, the LatestTripDate and LatestScoringDate that
+    were last synced. Use ':memory:' for a throwaway store.
+
+    The store may be used from any thread: the connection is shared and every
+    read and write holds a lock.
+    """
+
+    def __init__(self, path):
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS watermarks ("
+                " user_id TEXT PRIMARY KEY,"
+                " latest_trip_date TEXT,"
+                " latest_scoring_date TEXT,"
+                " synced_at TEXT)"
+            )
+            self.connection.commit()
+
+    def get(self, user_id):
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT latest_trip_date, latest_scoring_date FROM watermarks WHERE user_id = ?", (user_id,)
+            ).fetchone()
+        return row if row else (None, None)
+
+    def get_many(self, user_ids):
+        return {user_id: self.get(user_id) for user_id in user_ids}
+
+    def set(self, user_id, latest_trip_date, latest_scoring_date):
+        with self._lock:
+            self.connection.execute(
+                "INSERT INTO watermarks (user_id, latest_trip_date, latest_scoring_date, synced_at) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT(user_id) DO UPDATE SET latest_trip_date = excluded.latest_trip_date,"
+                " latest_scoring_date = excluded.latest_scoring_date, synced_at = excluded.synced_at",
+                (user_id, latest_trip_date, latest_scoring_date, datetime.datetime.now(datetime.timezone.utc).isoformat()),
+            )
+            self.connection.commit()
+
+    def close(self):
+        with self._lock:
+            self.connection.close()
+
+
+class SyncUpdate:
+    """New data for one user, plus the watermarks it will advance to once processed."""
+
+    def __init__(self, user_id, latest_trip_date=None, latest_scoring_date=None):
+        self.user_id = user_id
+        self.latest_trip_date = latest_trip_date
+        self.latest_scoring_date = latest_scoring_date
+
+        # Date windows that were refetched, as (start_date, end_date), or None if unchanged
+        self.trips_window = None
+        self.scores_window = None
+
+        self.statistics = None
+        self.trips = None
+        self.safety_scores = None
+        self.eco_scores = None
+        self.error = None
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    @property
+    def changed(self):
+        return self.trips_window is not None or self.scores_window is not None
+
+    def __repr__(self):
+        return f"SyncUpdate({self.user_id!r}, trips_window={self.trips_window}, scores_window={self.scores_window}, error={self.error!r})"
+
+
+class FleetSync:
+    """
+    Incremental sync of daily statistics, scores and trips for a fleet of users.
+
+    Each run calls `Statistics.lastupdates` for every user concurrently and compares
+    LatestTripDate/LatestScoringDate with the watermarks from the previous run. Only
+    users with newer data are refetched, and only from their last watermark's day
+    onwards. Users synced for the first time get the last `initial_days` days.
+
+    `fetch` selects what is refetched: 'statistics' (daily statistics) and 'trips'
+    follow LatestTripDate, 'safety' and 'eco' (daily scores) follow LatestScoringDate.
+    `trip_options` are passed to `Trips.get_list_trips`.
+    """
+
+    FETCH_ALL = ('statistics', 'trips', 'safety', 'eco')
+
+    def __init__(self, auth_client: TelematicsAuth, store, fetch=FETCH_ALL, initial_days=14, trip_options=None, max_workers=None):
+        self.auth_client = auth_client
+        self.store = store if isinstance(store, WatermarkStore) else WatermarkStore(store)
+        self.fetch = tuple(fetch)
+        self.initial_days = initial_days
+        self.trip_options = dict(trip_options or {})
+        self.max_workers = max_workers or auth_client.pool_maxsize
+
+        self.statistics = Statistics(auth_client)
+        self.trips = Trips(auth_client)
+        self.report = {}
+
+    def run(self, user_ids):
+        """
+        Yields a `SyncUpdate` for every user with new data, or whose sync failed, as
+        soon as it is ready. A user's watermark advances when the caller asks for the
+        next update, so data that was not processed is fetched again on the next run.
+        """
+        watermarks = self.store.get_many(dict.fromkeys(user_ids))
+        self.report = {'checked': 0, 'changed': 0, 'unchanged': 0, 'failed': 0}
+
+        def sync_user(user_id):
+            return self._sync_user(user_id, *watermarks[user_id])
+
+        for result in iter_bulk(sync_user, watermarks, self.max_workers):
+            self.report['checked'] += 1
+            update = result.response if result.ok else SyncUpdate(result.key)
+            if not result.ok:
+                update.error = result.error
+
+            if not update.ok:
+                self.report['failed'] += 1
+                yield update
+            elif update.changed:
+                self.report['changed'] += 1
+                yield update
+                self._advance(update, *watermarks[update.user_id])
+            else:
+                self.report['unchanged'] += 1
+
+    def _advance(self, update, trip_watermark, scoring_watermark):
+        self.store.set(
+            update.user_id,
+            update.latest_trip_date if update.trips_window else trip_watermark,
+            update.latest_scoring_date if update.scores_window else scoring_watermark,
+        )
+
+    def _sync_user(self, user_id, trip_watermark, scoring_watermark):
+        dates = self.statistics.lastupdates(user_id)
+        if is_error_data(dates.data):
+            raise SyncError(f"lastupdates failed for {user_id}: {dates.title or dates.data}")
+
+        update = SyncUpdate(user_id, dates.latest_trip_date, dates.latest_scoring_date)
+        update.trips_window = self._window(trip_watermark, update.latest_trip_date)
+        update.scores_window = self._window(scoring_watermark, update.latest_scoring_date)
+
+        if update.trips_window:
+            start_date, end_date = update.trips_window
+            if 'statistics' in self.fetch:
+                update.statistics = self._check(self.statistics.user_daily_statistics(user_id, start_date, end_date))
+            if 'trips' in self.fetch:
+                update.trips = self._check(self.trips.get_list_trips(user_id, start_date, end_date, **self.trip_options))
+
+        if update.scores_window:
+            start_date, end_date = update.scores_window
+            if 'safety' in self.fetch:
+                update.safety_scores = self._check(self.statistics.user_daily_safetyscore(user_id, start_date, end_date))
+            if 'eco' in self.fetch:
+                update.eco_scores = self._check(self.statistics.user_daily_ecoscore(user_id, start_date, end_date))
+
+        return update
+
+    def _window(self, watermark, latest):
+        """Days to refetch, from the watermark's day through the day after `latest`; None if nothing changed."""
+        latest_date = _to_datetime(latest)
+        if latest_date is None:
+            return None
+
+        watermark_date = _to_datetime(watermark)
+        if watermark_date is None:
+            start = latest_date - datetime.timedelta(days=self.initial_days)
+        elif latest_date > watermark_date:
+            # Start on the watermark's own day, which may have gained data after it was synced
+            start = watermark_date
+        else:
+            return None
+
+        end = latest_date + datetime.timedelta(days=1)
+        return start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d')
+
+    @staticmethod
+    def _check(response):
+        if response is None or is_error_data(response.data):
+            raise SyncError(f"Request failed: {getattr(response, 'data', response)}")
+        return response
+
+
+class SyncError(Exception):
+    pass
+
+
+def _to_datetime(value):
+    if not value:
+        return None
+    try:
+        parsed = datetime.datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    # Watermarks are compared as naive UTC
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return parsed
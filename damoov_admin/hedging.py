@@ -0,0 +1,98 @@
+# hedging.py
+import threading
+from collections import deque
+
+from .instrumentation import endpoint_name
+
+
+class HedgePolicy:
+    """
+    Opt-in hedging for idempotent reads.
+
+    The latencies of the last `window` successful responses are kept per endpoint.
+    Once an endpoint has `min_samples` of them, a request that has not been answered
+    within the `percentile` of those latencies is sent a second time. Whichever copy
+    answers first is used. `budget` caps hedges at that fraction of the requests
+    eligible for hedging, so a slow API does not get twice the load, and
+    `max_in_flight` caps the hedged requests whose slower copy is still running:
+    that copy keeps its connection until it finishes. `endpoints`
+    limits hedging to URLs containing one of the given path pieces, e.g.
+    ('/Scores/safety?', '/Leaderboard/user'); by default every idempotent read is eligible.
+
+    Pass an instance to `TelematicsAuth(..., hedge_policy=HedgePolicy())`.
+    """
+
+    def __init__(self, percentile=95, budget=0.05, min_samples=20, window=200, min_delay=0.005, endpoints=None,
+                 max_in_flight=8):
+        self.percentile = percentile
+        self.budget = budget
+        self.max_in_flight = max_in_flight
+        self.min_samples = min_samples
+        self.window = window
+        self.min_delay = min_delay
+        self.endpoints = tuple(endpoints) if endpoints else None
+
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.in_flight = 0
+
+        self._latencies = {}
+        self._lock = threading.Lock()
+
+    def applies_to(self, url):
+        return self.endpoints is None or any(piece in url for piece in self.endpoints)
+
+    def delay_for(self, url):
+        """Seconds after which to hedge a request to `url`, or None while too few latencies are known."""
+        key = endpoint_name(url)
+        with self._lock:
+            self.requests += 1
+            samples = self._latencies.get(key)
+            if samples is None or len(samples) < self.min_samples:
+                return None
+            ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(len(ordered) * self.percentile / 100))
+        return max(self.min_delay, ordered[index])
+
+    def acquire_hedge(self):
+        """Takes one hedge from the budget; False if the budget or `max_in_flight` is used up."""
+        with self._lock:
+            if self.hedges + 1 > self.budget * self.requests or self.in_flight >= self.max_in_flight:
+                return False
+            self.hedges += 1
+            self.in_flight += 1
+            return True
+
+    def release_hedge(self):
+        """Returns a hedge taken with `acquire_hedge` that was not sent after all."""
+        with self._lock:
+            self.hedges -= 1
+            self.in_flight -= 1
+
+    def finish_hedge(self):
+        """Frees the `max_in_flight` slot of a hedge once both of its copies are done."""
+        with self._lock:
+            self.in_flight -= 1
+
+    def record(self, url, latency):
+        key = endpoint_name(url)
+        with self._lock:
+            samples = self._latencies.get(key)
+            if samples is None:
+                samples = self._latencies[key] = deque(maxlen=self.window)
+            samples.append(latency)
+
+    def record_win(self):
+        with self._lock:
+            self.hedge_wins += 1
+
+    def stats(self):
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'hedges': self.hedges,
+                'hedge_wins': self.hedge_wins,
+                'in_flight': self.in_flight,
+                'hedge_rate': self.hedges / self.requests if self.requests else 0.0,
+            }
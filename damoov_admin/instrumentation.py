@@ -0,0 +1,105 @@
+# instrumentation.py
+import random
+import re
+import threading
+from urllib.parse import urlsplit
+
+# Path segments that identify a record rather than an endpoint (GUIDs, numbers, hex ids)
+_ID_SEGMENT = re.compile(r'^(?:[0-9a-fA-F-]{16,}|\d+)$')
+
+
+class RequestEvent:
+    """Everything recorded about one API call made through `*_with_retry`."""
+
+    __slots__ = ('method', 'url', 'endpoint', 'status', 'latency', 'bytes', 'retries', 'cached', 'error')
+
+    def __init__(self, method, url, status=None, latency=0.0, bytes=0, retries=0, cached=False, error=None):
+        self.method = method
+        self.url = url
+        self.endpoint = endpoint_name(url)
+        self.status = status
+        # Seconds from the first attempt until the final response, including 401 retries
+        self.latency = latency
+        # Size of the final response body
+        self.bytes = bytes
+        self.retries = retries
+        self.cached = cached
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error is None and self.status is not None and self.status < 400
+
+    def __repr__(self):
+        return (f"RequestEvent({self.method} {self.endpoint}, status={self.status}, "
+                f"latency={self.latency:.3f}, bytes={self.bytes}, retries={self.retries}, cached={self.cached})")
+
+
+class Instrumentation:
+    """
+    Calls every hook with a `RequestEvent` for a sample of the requests made by an
+    auth client. Each request is sampled with probability `sample_rate` when it
+    starts; requests that are not sampled are not timed at all.
+
+    Pass an instance to `TelematicsAuth(..., instrumentation=...)`. Without one,
+    nothing is recorded. A hook that raises is ignored so it never breaks a request.
+    """
+
+    def __init__(self, hooks=(), sample_rate=1.0, rng=random.random):
+        self.hooks = list(hooks)
+        self.sample_rate = sample_rate
+        self.rng = rng
+        self.hook_errors = 0
+        self._lock = threading.Lock()
+
+    def add_hook(self, hook):
+        with self._lock:
+            self.hooks = self.hooks + [hook]
+        return hook
+
+    def remove_hook(self, hook):
+        with self._lock:
+            self.hooks = [h for h in self.hooks if h is not hook]
+
+    def sample(self):
+        if not self.hooks or self.sample_rate <= 0:
+            return False
+        return self.sample_rate >= 1 or self.rng() < self.sample_rate
+
+    def emit(self, event):
+        for hook in self.hooks:
+            try:
+                hook(event)
+            except Exception:
+                self.hook_errors += 1
+
+
+def endpoint_name(url):
+    """URL path with record ids replaced by '{id}', e.g. '/trips/get/admin/v1/{id}'."""
+    path = urlsplit(url).path
+    return '/'.join('{id}' if _ID_SEGMENT.match(segment) else segment for segment in path.split('/'))
+
+
+def sentry_breadcrumbs(event):
+    """
+    Hook that adds each sampled request as a Sentry breadcrumb. The application
+    initialises Sentry itself; this hook does nothing when Sentry is not installed.
+    """
+    try:
+        import sentry_sdk
+    except ImportError:
+        return
+    sentry_sdk.add_breadcrumb(
+        type='http',
+        category='damoov_admin',
+        level='info' if event.ok else 'warning',
+        data={
+            'method': event.method,
+            'url': event.endpoint,
+            'status_code': event.status,
+            'latency': event.latency,
+            'bytes': event.bytes,
+            'retries': event.retries,
+            'cached': event.cached,
+        },
+    )
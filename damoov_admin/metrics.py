@@ -0,0 +1,255 @@
+# metrics.py
+import bisect
+import json
+import threading
+import time
+
+from .instrumentation import endpoint_name
+
+# Upper bounds in seconds of the request latency histogram buckets
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Why a request was sent again
+RETRY_REASONS = ('unauthorized', 'throttled', 'status', 'connection')
+
+
+class _Series:
+    """Latency histogram and byte counters of one (endpoint, method)."""
+
+    __slots__ = ('buckets', 'sum', 'count', 'sent', 'received')
+
+    def __init__(self, size):
+        self.buckets = [0] * size
+        self.sum = 0.0
+        self.count = 0
+        self.sent = 0
+        self.received = 0
+
+
+class MetricsRegistry:
+    """
+    Per-endpoint request metrics collected by an auth client.
+
+    Pass an instance to `TelematicsAuth(..., metrics=...)` (or the async client).
+    It then records, per endpoint (the URL path with record ids replaced by '{id}')
+    and method:
+
+    - a histogram of latency from the first attempt to the final response,
+      retries, backoff and token refreshes included (`buckets` in seconds)
+    - final responses by status code ('error' when an exception was raised)
+    - retries by reason: 'unauthorized', 'throttled', 'status' or 'connection'
+    - bytes sent (request bodies, every attempt) and received (final responses)
+    - requests in flight and cache hits
+
+    Logins and token refreshes are counted too. `prometheus()` renders everything
+    in the Prometheus text format, `snapshot()` as a dict, and `start_reporting()`
+    passes a snapshot to a callback every `interval` seconds. Without a registry,
+    or with `enabled = False`, requests skip all of this.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, prefix='damoov', clock=time.perf_counter):
+        self.buckets = tuple(sorted(buckets))
+        self.prefix = prefix
+        self.clock = clock
+        self.enabled = True
+        self._series = {}
+        self._statuses = {}
+        self._retries = {}
+        self._in_flight = {}
+        self._cache_hits = {}
+        self._renewals = {}
+        self._lock = threading.Lock()
+        self._report_timer = None
+        self._reporting = None
+
+    # Recording, called by the auth client
+
+    def start(self, method, url):
+        """Marks a request as in flight; returns the handle the other calls take, or None when disabled."""
+        if not self.enabled:
+            return None
+        endpoint = endpoint_name(url)
+        with self._lock:
+            self._in_flight[endpoint] = self._in_flight.get(endpoint, 0) + 1
+        return endpoint, method, self.clock()
+
+    def retry(self, request, reason):
+        if request is None:
+            return
+        key = (request[0], reason)
+        with self._lock:
+            self._retries[key] = self._retries.get(key, 0) + 1
+
+    def finish(self, request, response=None, error=None, body=None, attempts=1, cached=False):
+        """Records the outcome of a request started with `start()`."""
+        if request is None:
+            return
+        endpoint, method, started = request
+        latency = self.clock() - started
+        if cached:
+            with self._lock:
+                self._in_flight[endpoint] -= 1
+                self._cache_hits[endpoint] = self._cache_hits.get(endpoint, 0) + 1
+            return
+        status = str(response.status_code) if error is None and response is not None else 'error'
+        sent = _body_size(body) * attempts if body is not None else 0
+        received = len(getattr(response, 'content', None) or b'') if response is not None else 0
+        index = bisect.bisect_left(self.buckets, latency)
+        key = (endpoint, method)
+        with self._lock:
+            self._in_flight[endpoint] -= 1
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _Series(len(self.buckets) + 1)
+            series.buckets[index] += 1
+            series.sum += latency
+            series.count += 1
+            series.sent += sent
+            series.received += received
+            status_key = (endpoint, method, status)
+            self._statuses[status_key] = self._statuses.get(status_key, 0) + 1
+
+    def token_renewal(self, kind):
+        """Counts a 'login' or 'refresh' of the access token."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._renewals[kind] = self._renewals.get(kind, 0) + 1
+
+    # Export
+
+    def snapshot(self):
+        """All metrics as plain, JSON-serializable data; histogram buckets are cumulative."""
+        with self._lock:
+            series = [(key, list(s.buckets), s.sum, s.count, s.sent, s.received) for key, s in self._series.items()]
+            statuses = dict(self._statuses)
+            retries = dict(self._retries)
+            in_flight = dict(self._in_flight)
+            cache_hits = dict(self._cache_hits)
+            renewals = dict(self._renewals)
+        latency = []
+        for (endpoint, method), buckets, total, count, sent, received in series:
+            cumulative = 0
+            bounds = {}
+            for bound, value in zip(self.buckets + (float('inf'),), buckets):
+                cumulative += value
+                bounds[_format_bound(bound)] = cumulative
+            latency.append({'endpoint': endpoint, 'method': method, 'buckets': bounds, 'sum': total,
+                            'count': count, 'bytes_sent': sent, 'bytes_received': received})
+        return {
+            'latency': latency,
+            'responses': [{'endpoint': endpoint, 'method': method, 'status': status, 'count': count}
+                          for (endpoint, method, status), count in statuses.items()],
+            'retries': [{'endpoint': endpoint, 'reason': reason, 'count': count}
+                        for (endpoint, reason), count in retries.items()],
+            'in_flight': in_flight,
+            'cache_hits': cache_hits,
+            'token_renewals': renewals,
+        }
+
+    def prometheus(self):
+        """The metrics in the Prometheus text exposition format, e.g. to serve from a /metrics endpoint."""
+        snapshot = self.snapshot()
+        p = self.prefix
+        lines = []
+
+        def family(name, kind, help_text, samples):
+            lines.append(f'# HELP {p}_{name} {help_text}')
+            lines.append(f'# TYPE {p}_{name} {kind}')
+            lines.extend(samples)
+
+        family('request_duration_seconds', 'histogram',
+               'Time from the first attempt to the final response, retries included.',
+               [line for entry in snapshot['latency'] for line in _histogram_lines(f'{p}_request_duration_seconds', entry)])
+        family('responses_total', 'counter', 'Final responses by status code.',
+               [_sample(f'{p}_responses_total', entry['count'], endpoint=entry['endpoint'], method=entry['method'],
+                        status=entry['status']) for entry in snapshot['responses']])
+        family('retries_total', 'counter', 'Requests sent again, by reason.',
+               [_sample(f'{p}_retries_total', entry['count'], endpoint=entry['endpoint'], reason=entry['reason'])
+                for entry in snapshot['retries']])
+        family('sent_bytes_total', 'counter', 'Request body bytes sent, every attempt included.',
+               [_sample(f'{p}_sent_bytes_total', entry['bytes_sent'], endpoint=entry['endpoint'], method=entry['method'])
+                for entry in snapshot['latency']])
+        family('received_bytes_total', 'counter', 'Response body bytes received for final responses.',
+               [_sample(f'{p}_received_bytes_total', entry['bytes_received'], endpoint=entry['endpoint'],
+                        method=entry['method']) for entry in snapshot['latency']])
+        family('requests_in_flight', 'gauge', 'Requests started and not yet finished.',
+               [_sample(f'{p}_requests_in_flight', count, endpoint=endpoint)
+                for endpoint, count in snapshot['in_flight'].items()])
+        family('cache_hits_total', 'counter', 'Requests answered from the response cache.',
+               [_sample(f'{p}_cache_hits_total', count, endpoint=endpoint)
+                for endpoint, count in snapshot['cache_hits'].items()])
+        family('token_renewals_total', 'counter', 'Logins and access token refreshes.',
+               [_sample(f'{p}_token_renewals_total', count, kind=kind) for kind, count in snapshot['token_renewals'].items()])
+        return '\n'.join(lines) + '\n'
+
+    def reset(self):
+        """Clears every counter and histogram; requests in flight stay counted."""
+        with self._lock:
+            self._series.clear()
+            self._statuses.clear()
+            self._retries.clear()
+            self._cache_hits.clear()
+            self._renewals.clear()
+
+    def report(self, callback):
+        callback(self.snapshot())
+
+    def start_reporting(self, callback, interval=60):
+        """Calls `callback(snapshot)` every `interval` seconds on a background timer."""
+        self.stop_reporting()
+        with self._lock:
+            self._reporting = (callback, interval)
+        self._schedule_report()
+
+    def stop_reporting(self):
+        with self._lock:
+            self._reporting = None
+            if self._report_timer is not None:
+                self._report_timer.cancel()
+                self._report_timer = None
+
+    def _schedule_report(self):
+        with self._lock:
+            if self._reporting is None:
+                return
+            self._report_timer = threading.Timer(self._reporting[1], self._report_tick)
+            self._report_timer.daemon = True
+            self._report_timer.start()
+
+    def _report_tick(self):
+        reporting = self._reporting
+        try:
+            if reporting is not None:
+                self.report(reporting[0])
+        finally:
+            self._schedule_report()
+
+
+def _body_size(body):
+    if isinstance(body, bytes):
+        return len(body)
+    if isinstance(body, str):
+        return len(body.encode('utf-8'))
+    return len(json.dumps(body, default=str).encode('utf-8'))
+
+
+def _format_bound(bound):
+    return '+Inf' if bound == float('inf') else repr(float(bound))
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _sample(name, value, **labels):
+    label_text = ','.join(f'{key}="{_escape(label)}"' for key, label in labels.items())
+    return f'{name}{{{label_text}}} {value}' if label_text else f'{name} {value}'
+
+
+def _histogram_lines(name, entry):
+    labels = {'endpoint': entry['endpoint'], 'method': entry['method']}
+    lines = [_sample(f'{name}_bucket', count, **labels, le=bound) for bound, count in entry['buckets'].items()]
+    lines.append(_sample(f'{name}_sum', entry['sum'], **labels))
+    lines.append(_sample(f'{name}_count', entry['count'], **labels))
+    return lines
@@ -0,0 +1,220 @@
+# models.py
+from collections.abc import Mapping
+
+from .waypoints import Waypoints
+
+
+class Model:
+    """
+    Typed, `__slots__`-based view of one API object.
+
+    Models are built from the already decoded response dicts, which the response
+    keeps, so they add to its memory rather than replace it. They give attribute
+    access with declared fields, not a smaller or faster decode.
+
+    `FIELDS` maps attribute names to the JSON keys they are read from; keys the model
+    does not declare are kept in `extra` (None when there are none), so `to_dict()`
+    gives back the original object. `NESTED` maps attributes holding objects (or
+    lists of objects) to the model they are built into.
+    """
+
+    __slots__ = ('extra',)
+
+    FIELDS = {}
+    NESTED = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._keys = frozenset(cls.FIELDS.values())
+
+    @classmethod
+    def from_dict(cls, data):
+        obj = cls.__new__(cls)
+        nested = cls.NESTED
+        for attr, key in cls.FIELDS.items():
+            value = data.get(key)
+            if value is not None and attr in nested:
+                model = nested[attr]
+                if isinstance(value, dict):
+                    value = model.from_dict(value)
+                elif isinstance(value, list):
+                    value = [model.from_dict(item) if isinstance(item, dict) else item for item in value]
+            setattr(obj, attr, value)
+        keys = cls._keys
+        obj.extra = {key: value for key, value in data.items() if key not in keys} or None
+        return obj
+
+    @classmethod
+    def from_list(cls, items):
+        return [cls.from_dict(item) for item in items if isinstance(item, Mapping)]
+
+    def to_dict(self):
+        data = {}
+        for attr, key in self.FIELDS.items():
+            value = getattr(self, attr)
+            if isinstance(value, Model):
+                value = value.to_dict()
+            elif isinstance(value, list):
+                value = [item.to_dict() if isinstance(item, Model) else item for item in value]
+            if value is not None:
+                data[key] = value
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        fields = ', '.join(f'{attr}={getattr(self, attr)!r}' for attr in self.FIELDS if getattr(self, attr) is not None)
+        return f'{type(self).__name__}({fields})'
+
+
+class TripScores(Model):
+    FIELDS = {
+        'safety': 'Safety',
+        'speeding': 'Speeding',
+        'acceleration': 'Acceleration',
+        'braking': 'Braking',
+        'cornering': 'Cornering',
+        'phone_usage': 'PhoneUsage',
+        'eco': 'Eco',
+        'eco_braking': 'EcoBraking',
+        'eco_fuel': 'EcoFuel',
+        'eco_tyres': 'EcoTyres',
+        'eco_depreciation': 'EcoDepreciation',
+    }
+    __slots__ = tuple(FIELDS)
+
+    safety: float
+    speeding: float
+    acceleration: float
+    braking: float
+    cornering: float
+    phone_usage: float
+    eco: float
+    eco_braking: float
+    eco_fuel: float
+    eco_tyres: float
+    eco_depreciation: float
+
+
+class TripStatistics(Model):
+    FIELDS = {
+        'mileage': 'Mileage',
+        'duration_minutes': 'DurationMinutes',
+        'average_speed': 'AverageSpeed',
+        'max_speed': 'MaxSpeed',
+        'accelerations_count': 'AccelerationsCount',
+        'brakings_count': 'BrakingsCount',
+        'cornerings_count': 'CorneringsCount',
+        'phone_usage_duration_minutes': 'PhoneUsageDurationMinutes',
+        'phone_usage_mileage': 'PhoneUsageMileageKm',
+        'speeding_duration_minutes': 'TotalSpeedingDurationMinutes',
+        'speeding_mileage': 'TotalSpeedingMileageKm',
+    }
+    __slots__ = tuple(FIELDS)
+
+    mileage: float
+    duration_minutes: float
+    average_speed: float
+    max_speed: float
+    accelerations_count: int
+    brakings_count: int
+    cornerings_count: int
+    phone_usage_duration_minutes: float
+    phone_usage_mileage: float
+    speeding_duration_minutes: float
+    speeding_mileage: float
+
+
+class TripData(Model):
+    FIELDS = {
+        'user_id': 'UserId',
+        'start_date': 'StartDate',
+        'end_date': 'EndDate',
+        'start_date_utc': 'StartDateUtc',
+        'end_date_utc': 'EndDateUtc',
+        'start_timestamp': 'StartDateTimestampSec',
+        'end_timestamp': 'EndDateTimestampSec',
+        'transport_type': 'TransportType',
+        'tags': 'Tags',
+        'addresses': 'Addresses',
+    }
+    __slots__ = tuple(FIELDS)
+
+    user_id: str
+    start_date: str
+    end_date: str
+    start_date_utc: str
+    end_date_utc: str
+    start_timestamp: int
+    end_timestamp: int
+    transport_type: dict
+    tags: list
+    addresses: dict
+
+
+class Trip(Model):
+    FIELDS = {
+        'id': 'Id',
+        'data': 'Data',
+        'statistics': 'Statistics',
+        'scores': 'Scores',
+        'events': 'Events',
+        'waypoints': 'Waypoints',
+    }
+    NESTED = {
+        'data': TripData,
+        'statistics': TripStatistics,
+        'scores': TripScores,
+    }
+    __slots__ = tuple(FIELDS)
+
+    id: str
+    data: TripData
+    statistics: TripStatistics
+    scores: TripScores
+    events: list
+    waypoints: Waypoints
+
+
+class StatisticsRow(Model):
+    """One row of a daily or accumulated statistics or score response."""
+
+    FIELDS = {
+        'user_id': 'UserId',
+        'report_date': 'ReportDate',
+        'calc_date': 'CalcDate',
+        'mileage_km': 'MileageKm',
+        'trips_count': 'TripsCount',
+        'driving_time': 'DrivingTime',
+        'average_speed_kmh': 'AverageSpeedKmh',
+        'max_speed_kmh': 'MaxSpeedKmh',
+        'safety_score': 'SafetyScore',
+        'eco_score': 'EcoScore',
+        'acceleration_score': 'AccelerationScore',
+        'braking_score': 'BrakingScore',
+        'cornering_score': 'CorneringScore',
+        'speeding_score': 'SpeedingScore',
+        'phone_usage_score': 'PhoneUsageScore',
+    }
+    __slots__ = tuple(FIELDS)
+
+    user_id: str
+    report_date: str
+    calc_date: str
+    mileage_km: float
+    trips_count: int
+    driving_time: float
+    average_speed_kmh: float
+    max_speed_kmh: float
+    safety_score: float
+    eco_score: float
+    acceleration_score: float
+    braking_score: float
+    cornering_score: float
+    speeding_score: float
+    phone_usage_score: float
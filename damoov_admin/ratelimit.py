@@ -0,0 +1,138 @@
+# ratelimit.py
+import datetime
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+
+class RateLimiter:
+    """
+    Token bucket shared by every request made through an auth client, with a rate
+    that adapts to the API (additive increase, multiplicative decrease).
+
+    Requests are let through at `rate` per second on average, with bursts of up to
+    `burst`. While the limiter is the bottleneck, successful responses raise the
+    rate, up to `max_rate`: until the first 429 it doubles about every second (slow
+    start), afterwards it grows by about `increase` per second. Each 429 multiplies it
+    by `decrease`, down to `min_rate`. 429s for requests that were sent before the
+    last decrease do not lower the rate again, so a burst of them counts once (when
+    the send time is unknown, at most one decrease per `cooldown` seconds). A `Retry-After`
+    pauses every request until it has passed. With `latency_target` set, a response
+    slower than the target also counts as a decrease signal.
+
+    Pass an instance to `TelematicsAuth(..., rate_limiter=RateLimiter(...))`;
+    `current_rate` shows the rate it has settled on.
+    """
+
+    def __init__(self, rate=10.0, burst=None, min_rate=0.5, max_rate=None, increase=2.0, decrease=0.7,
+                 cooldown=1.0, latency_target=None, clock=time.monotonic):
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1.0, rate))
+        self.min_rate = min_rate
+        self.max_rate = max_rate if max_rate is not None else float('inf')
+        self.increase = increase
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self.latency_target = latency_target
+        self.clock = clock
+
+        self.throttled = 0
+
+        self._tokens = self.burst
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._last_decrease = float('-inf')
+        self._slow_start = True
+        self._lock = threading.Lock()
+
+    @property
+    def current_rate(self):
+        return self.rate
+
+    def reserve(self):
+        """
+        Takes a token and returns 0, or returns the number of seconds until one may be
+        available without taking it. Callers sleep and ask again, so a rate change
+        applies to requests that are already waiting.
+        """
+        with self._lock:
+            now = self.clock()
+            self._refill(now)
+            delay = max(self._blocked_until - now, (1 - self._tokens) / self.rate)
+            if delay <= 0:
+                self._tokens -= 1
+                return 0.0
+            return delay
+
+    def acquire(self, timeout=None):
+        """Blocks until a request may be sent; returns False if that is more than `timeout` seconds away."""
+        give_up_at = None if timeout is None else self.clock() + timeout
+        while True:
+            delay = self.reserve()
+            if delay <= 0:
+                return True
+            if give_up_at is not None and self.clock() + delay > give_up_at:
+                return False
+            time.sleep(delay)
+
+    def on_success(self, latency=None):
+        with self._lock:
+            now = self.clock()
+            if self.latency_target is not None and latency is not None and latency > self.latency_target:
+                self._decrease(now, self.cooldown)
+            elif self._tokens < 1 and self.rate < self.max_rate:
+                # Only raise the rate while callers are actually waiting on it
+                self._refill(now)
+                step = 1.0 if self._slow_start else self.increase / self.rate
+                self.rate = min(self.max_rate, self.rate + step)
+
+    def on_throttle(self, retry_after=None, sent_at=None):
+        """
+        Records a 429 for a request sent at `sent_at` (in `clock` time); `retry_after`
+        (seconds) pauses every caller.
+        """
+        with self._lock:
+            now = self.clock()
+            self.throttled += 1
+            if sent_at is None or sent_at > self._last_decrease:
+                self._decrease(now, self.cooldown if sent_at is None else 0)
+            self._tokens = min(self._tokens, 0.0)
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'rate': self.rate,
+                'throttled': self.throttled,
+                'blocked_for': max(0.0, self._blocked_until - self.clock()),
+            }
+
+    def _refill(self, now):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _decrease(self, now, cooldown):
+        if now - self._last_decrease < cooldown:
+            return
+        self._refill(now)
+        self.rate = max(self.min_rate, self.rate * self.decrease)
+        self._last_decrease = now
+        self._slow_start = False
+
+
+def parse_retry_after(value):
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date), or None."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=datetime.timezone.utc)
+    return max(0.0, (when - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
@@ -0,0 +1,112 @@
+# retry.py
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+from requests.exceptions import ConnectionError
+
+
+class RetryPolicy:
+    """
+    When and how long to wait before sending a failed request again.
+
+    Idempotent requests (GET, PUT, DELETE and read-only POSTs) are retried on the
+    `statuses` listed and on connection errors and timeouts. Other requests are only
+    retried when the connection could not be opened, since nothing was sent. The
+    wait before retry n is a random time between 0 and `backoff * 2 ** (n - 1)`
+    seconds, capped at `max_backoff` ("full jitter"), so clients that failed together
+    do not retry together. `max_retries=0` turns retries off.
+    """
+
+    IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE')
+
+    def __init__(self, max_retries=3, backoff=0.5, max_backoff=30, statuses=(500, 502, 503, 504), rng=random.random):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.statuses = frozenset(statuses)
+        self.rng = rng
+
+    def is_idempotent(self, method):
+        return method.upper() in self.IDEMPOTENT_METHODS
+
+    def delay(self, attempt):
+        return self.rng() * min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+
+
+class CircuitBreaker:
+    """
+    Fails fast for a host that keeps failing.
+
+    After `failure_threshold` failures in a row (5xx responses, connection errors
+    or timeouts) the circuit for that host opens. For the next `recovery_time`
+    seconds, requests to the host raise `CircuitOpenError` without being sent. After
+    that one trial request is let through: if it succeeds the circuit closes, if it
+    fails it opens again. Each API host (user., api., ...) has its own circuit.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    def __init__(self, failure_threshold=5, recovery_time=30, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self.clock = clock
+        self._circuits = {}
+        self._lock = threading.Lock()
+
+    def before_request(self, url):
+        """Raises `CircuitOpenError` if requests to the host of `url` should not be sent now."""
+        host = urlsplit(url).netloc
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is None or circuit.state == self.CLOSED:
+                return
+            now = self.clock()
+            if circuit.state == self.OPEN and now - circuit.opened_at >= self.recovery_time:
+                # Let a single trial request through
+                circuit.state = self.HALF_OPEN
+                return
+            raise CircuitOpenError(host, max(0.0, circuit.opened_at + self.recovery_time - now))
+
+    def record(self, url, ok):
+        host = urlsplit(url).netloc
+        with self._lock:
+            circuit = self._circuits.setdefault(host, _Circuit())
+            if ok:
+                circuit.state = self.CLOSED
+                circuit.failures = 0
+                return
+            circuit.failures += 1
+            if circuit.state == self.HALF_OPEN or circuit.failures >= self.failure_threshold:
+                circuit.state = self.OPEN
+                circuit.opened_at = self.clock()
+
+    def state(self, host):
+        with self._lock:
+            circuit = self._circuits.get(host)
+            return circuit.state if circuit is not None else self.CLOSED
+
+    def reset(self):
+        with self._lock:
+            self._circuits.clear()
+
+
+class _Circuit:
+    __slots__ = ('state', 'failures', 'opened_at')
+
+    def __init__(self):
+        self.state = CircuitBreaker.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+
+
+class CircuitOpenError(ConnectionError):
+    """Raised instead of sending a request while the circuit for its host is open."""
+
+    def __init__(self, host, retry_in):
+        super().__init__(f"Circuit open for {host}; not sending requests for another {retry_in:.1f}s")
+        self.host = host
+        self.retry_in = retry_in
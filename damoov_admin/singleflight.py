@@ -0,0 +1,106 @@
+# singleflight.py
+import asyncio
+import threading
+
+from .deadline import DeadlineExceeded
+
+
+class _Call:
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Collapses identical reads that are in flight at the same time into one request.
+
+    The first caller for a key (method, URL with its query, payload, the client's
+    credentials and non-auth headers) sends the request. Callers arriving before it
+    finishes wait for it and get the same response, or the same exception, instead
+    of sending their own. Once it finishes, the next caller starts a new request.
+    With a `ResponseCache`, this keeps a burst of callers from refetching an entry
+    that just expired.
+
+    Only reads are coalesced: GETs and POSTs marked cacheable. Pass an instance to
+    `TelematicsAuth(..., single_flight=SingleFlight())` (or the async client). A
+    waiter's own `deadline` bounds how long it waits; the shared request runs under
+    the deadline of the caller that sent it.
+    """
+
+    def __init__(self):
+        self.leaders = 0
+        self.coalesced = 0
+        self._calls = {}
+        self._tasks = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, func, deadline=None):
+        """Returns `func()`, or the result of the identical call already running for `key`."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.leaders += 1
+            else:
+                self.coalesced += 1
+        if not leader:
+            if not call.done.wait(deadline.remaining() if deadline is not None else None):
+                raise DeadlineExceeded(f"Deadline of {deadline.seconds}s exceeded waiting for an identical request")
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def do_async(self, key, make_coroutine, deadline=None):
+        """
+        asyncio variant of `do`. The shared request runs as its own task, so a waiter
+        that is cancelled or gives up does not cancel it for the others.
+        """
+        loop = asyncio.get_running_loop()
+        # Tasks belong to one event loop; callers on another loop get their own
+        flight_key = (id(loop), key)
+        with self._lock:
+            task = self._tasks.get(flight_key)
+            if task is None:
+                task = self._tasks[flight_key] = loop.create_task(make_coroutine())
+                task.add_done_callback(lambda done: self._forget(flight_key, done))
+                self.leaders += 1
+            else:
+                self.coalesced += 1
+        done, _ = await asyncio.wait({task}, timeout=deadline.remaining() if deadline is not None else None)
+        if not done:
+            raise DeadlineExceeded(f"Deadline of {deadline.seconds}s exceeded waiting for an identical request")
+        return task.result()
+
+    def _forget(self, flight_key, task):
+        with self._lock:
+            if self._tasks.get(flight_key) is task:
+                del self._tasks[flight_key]
+        if not task.cancelled():
+            # Marks the exception as retrieved even if every waiter gave up
+            task.exception()
+
+    def stats(self):
+        with self._lock:
+            in_flight = len(self._calls) + len(self._tasks)
+        requests = self.leaders + self.coalesced
+        return {
+            'in_flight': in_flight,
+            'leaders': self.leaders,
+            'coalesced': self.coalesced,
+            'coalesce_rate': self.coalesced / requests if requests else 0.0,
+        }
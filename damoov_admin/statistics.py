@@ -1,10 +1,15 @@
 # statistics.py
 import requests
 from datetime import datetime, timedelta
+from functools import cached_property
 
 from .auth import TelematicsAuth
 from .core import TelematicsCore
-from .utility import handle_response, adjust_date_range
+from .utility import handle_response, adjust_date_range, split_date_range, is_error_data
+from .bulk import BulkResult, iter_bulk, in_bulk_worker
+from .codec import decode
+from .deadline import Deadline
+from .models import StatisticsRow
 from requests.exceptions import HTTPError
 import json
 
@@ -22,351 +27,284 @@ class BaseStatistics:
             'accept': 'application/json',
             'authorization': f'Bearer {self.auth_client.get_access_token()}'
         }
-        
-class StatisticsModule:
-    def __init__(self, core: TelematicsCore):
-        self.core = core  # Renamed self.code to self.core for clarity
-        
-    @property
-    def Statistics(self):
-        return Statistics(self.core.auth_client)
-
 
-
-class Statistics(BaseStatistics):
-    def user_daily_statistics(self, user_id, start_date, end_date, tag=None):
-        adjusted_values = adjust_date_range(start_date, end_date)
-        start_date, end_date, start_date_timestamp_sec, end_date_timestamp_sec = adjusted_values
-        url = f"{self.BASE_URL}/Statistics/daily?UserId={user_id}&StartDate={start_date}&EndDate={end_date}"
-        if tag:
-            url += f"&Tag={tag}"
+    def _get_statistics(self, url, deadline=None):
         try:
-            response = self.auth_client.get_with_retry(url, headers=self._get_headers())
-            return StatisticsResponse(response.json())
-        except HTTPError as http_err:
-            print(f'HTTP error occurred: {http_err}')  # Or handle it in some other way
-            e_response = handle_response(response, StatisticsResponse) # Pass EngagementResponse as an argument
-            return e_response
-        
-    def user_daily_ecoscore(self, user_id, start_date, end_date):
-        adjusted_values = adjust_date_range(start_date, end_date)
-        start_date, end_date, start_date_timestamp_sec, end_date_timestamp_sec = adjusted_values
-        url = f"{self.BASE_URL}/Scores/eco/daily?UserId={user_id}&StartDate={start_date}&EndDate={end_date}"
-        try:
-            response = self.auth_client.get_with_retry(url, headers=self._get_headers())
-            return StatisticsResponse(response.json())
+            response = self.auth_client.get_with_retry(url, headers=self._get_headers(), deadline=deadline)
+            return StatisticsResponse(decode(response))
         except HTTPError as http_err:
             print(f'HTTP error occurred: {http_err}')  # Or handle it in some other way
             e_response = handle_response(response, StatisticsResponse) # Pass EngagementResponse as an argument
             return e_response
 
-    def user_daily_safetyscore(self, user_id, start_date, end_date, tag=None):
-        adjusted_values = adjust_date_range(start_date, end_date)
-        start_date, end_date, start_date_timestamp_sec, end_date_timestamp_sec = adjusted_values
-        
-        url = f"{self.BASE_URL}/Scores/safety/daily?UserId={user_id}&StartDate={start_date}&EndDate={end_date}"
-        if tag:
-            url += f"&Tag={tag}"
-        try:
-            response = self.auth_client.get_with_retry(url, headers=self._get_headers())
-            return StatisticsResponse(response.json())
-        except HTTPError as http_err:
-            print(f'HTTP error occurred: {http_err}')  # Or handle it in some other way
-            e_response = handle_response(response, StatisticsResponse) # Pass EngagementResponse as an argument
-            return e_response
-    
-    def user_accumulated_statistics(self, user_id, start_date, end_date, tag=None):
-        url = f"{self.BASE_URL}/Statistics?UserId={user_id}&StartDate={start_date}&EndDate={end_date}"
-        if tag:
-            url += f"&Tag={tag}"
-        try:
-            response = self.auth_client.get_with_retry(url, headers=self._get_headers())
-            return StatisticsResponse(response.json())
-        except HTTPError as http_err:
-            print(f'HTTP error occurred: {http_err}')  # Or handle it in some other way
-            e_response = handle_response(response, StatisticsResponse) # Pass EngagementResponse as an argument
-            return e_response
+    def _get_entity_statistics(self, url, deadline=None):
+        # Company-wide endpoints go through the same pooled, retrying request path
+        return self._get_statistics(url, deadline)
 
-    def user_accumulated_ecoscore(self, user_id, start_date, end_date):
-        url = f"{self.BASE_URL}/Scores/eco?UserId={user_id}&StartDate={start_date}&EndDate={end_date}"
-        try:
-            response = self.auth_client.get_with_retry(url, headers=self._get_headers())
-            return StatisticsResponse(response.json())
-        except HTTPError as http_err:
-            print(f'HTTP error occurred: {http_err}')  # Or handle it in some other way
-            e_response = handle_response(response, StatisticsResponse) # Pass EngagementResponse as an argument
-            return e_response
-        
+    # Request building, shared with the asyncio client
 
-    def user_accumulated_safetyscore(self, user_id, start_date, end_date, tag=None):
-        url = f"{self.BASE_URL}/Scores/safety?UserId={user_id}&StartDate={start_date}&EndDate={end_date}"
-        if tag:
-            url += f"&Tag={tag}"
-        try:
-            response = self.auth_client.get_with_retry(url, headers=self._get_headers())
-            return StatisticsResponse(response.json())
-        except HTTPError as http_err:
-            print(f'HTTP error occurred: {http_err}')  # Or handle it in some other way
-            e_response = handle_response(response, StatisticsResponse) # Pass EngagementResponse as an argument
-            return e_response
-        
-    def entity_accumulated_ecoscore(self, start_date, end_date, tag=None, instance_id=None, app_id=None, company_id=None):
-        # Check that exactly one of instance_id, app_id, or company_id is provided
-        provided_params = [p for p in [instance_id, app_id, company_id] if p is not None]
-        
-        if len(provided_params) != 1:
-            raise ValueError("Exactly one of 'instance_id', 'app_id', or 'company_id' must be provided.")
-
-        url = f"{self.BASE_URL}/Scores/eco/consolidated?StartDate={start_date}&EndDate={end_date}"
+    def _user_url(self, path, user_id, tag=None):
+        """Returns `build_url(start_date, end_date)` for a per-user endpoint."""
+        def build_url(start_date, end_date):
+            url = f"{self.BASE_URL}/{path}?UserId={user_id}&StartDate={start_date}&EndDate={end_date}"
+            if tag:
+                url += f"&Tag={tag}"
+            return url
 
-        # Add the provided parameter to the URL
-        if instance_id:
-            url += f"&InstanceId={instance_id}"
-        elif app_id:
-            url += f"&AppId={app_id}"
-        elif company_id:
-            url += f"&CompanyId={company_id}"
+        return build_url
 
-        if tag:
-            url += f"&Tag={tag}"
-        
-        try:    
-            response = self.auth_client.session.get(url, headers=self._get_headers())
-            if response.status_code == 401:  # Access token expired
-                self.auth_client.handle_401()
-                response = self.auth_client.session.get(url, headers=self._get_headers())
-
-            response.raise_for_status()
-            return StatisticsResponse(response.json())
-        except HTTPError as http_err:
-            print(f'HTTP error occurred: {http_err}')  # Or handle it in some other way
-            e_response = handle_response(response, StatisticsResponse) # Pass EngagementResponse as an argument
-            return e_response
-        
-    
-    def entity_daily_ecoscore(self, start_date, end_date, tag=None, instance_id=None, app_id=None, company_id=None):
-        
-
-        adjusted_values = adjust_date_range(start_date, end_date)
-        start_date, end_date, start_date_timestamp_sec, end_date_timestamp_sec = adjusted_values
-
-        
+    def _entity_url(self, path, tag=None, instance_id=None, app_id=None, company_id=None):
+        """Returns `build_url(start_date, end_date)` for a company-wide endpoint."""
         # Check that exactly one of instance_id, app_id, or company_id is provided
         provided_params = [p for p in [instance_id, app_id, company_id] if p is not None]
         
         if len(provided_params) != 1:
             raise ValueError("Exactly one of 'instance_id', 'app_id', or 'company_id' must be provided.")
 
-        url = f"{self.BASE_URL}/Scores/eco/consolidated/daily?StartDate={start_date}&EndDate={end_date}"
-
-        # Add the provided parameter to the URL
-        if instance_id:
-            url += f"&InstanceId={instance_id}"
-        elif app_id:
-            url += f"&AppId={app_id}"
-        elif company_id:
-            url += f"&CompanyId={company_id}"
-
-        if tag:
-            url += f"&Tag={tag}"
-        try:
-            response = self.auth_client.session.get(url, headers=self._get_headers())
-            if response.status_code == 401:  # Access token expired
-                self.auth_client.handle_401()
-                response = self.auth_client.session.get(url, headers=self._get_headers())
-
-            response.raise_for_status()
-            return StatisticsResponse(response.json())
-        except HTTPError as http_err:
-            print(f'HTTP error occurred: {http_err}')  # Or handle it in some other way
-            e_response = handle_response(response, StatisticsResponse) # Pass EngagementResponse as an argument
-            return e_response
-    
-    def entity_daily_statistics(self, start_date, end_date, tag=None, instance_id=None, app_id=None, company_id=None):
+        def build_url(start_date, end_date):
+            url = f"{self.BASE_URL}/{path}?StartDate={start_date}&EndDate={end_date}"
+
+            # Add the provided parameter to the URL
+            if instance_id:
+                url += f"&InstanceId={instance_id}"
+            elif app_id:
+                url += f"&AppId={app_id}"
+            elif company_id:
+                url += f"&CompanyId={company_id}"
+
+            if tag:
+                url += f"&Tag={tag}"
+            return url
+
+        return build_url
+
+    def _entity_score_url(self, start_date, end_date, tag=None, instance_id=None, app_id=None, company_id=None):
+        # A consolidated score cannot be merged from windows, so longer ranges are still truncated to 14 days
+        start_date, end_date, _, _ = adjust_date_range(start_date, end_date)
+        return self._entity_url('Scores/safety/consolidated', tag, instance_id, app_id, company_id)(start_date, end_date)
+
+    def _lastupdates_url(self, user_id):
+        return f"{self.BASE_URL}/Statistics/dates?UserId={user_id}"
+
+    def _get_daily_statistics(self, build_url, start_date, end_date, fetch=None, deadline=None):
+        """
+        Fetches a daily endpoint over any date range: the range is split into windows of
+        at most 14 days, the windows are fetched concurrently and merged into one response.
+        On a bulk worker thread the windows are fetched one after another, so bulk runs
+        stay within `max_workers` threads instead of nesting a pool per call. Every window
+        shares the one `deadline`.
+        """
+        fetch = fetch or self._get_statistics
+        deadline = Deadline.of(deadline)
+        urls = [build_url(start, end) for start, end, _, _ in split_date_range(start_date, end_date)]
+        if len(urls) == 1:
+            return fetch(urls[0], deadline)
+        if in_bulk_worker():
+            return StatisticsResponse.merge([fetch(url, deadline) for url in urls])
+
+        max_workers = min(len(urls), self.auth_client.pool_maxsize)
+        results = {result.key: result for result in iter_bulk(lambda i: fetch(urls[i], deadline), range(len(urls)), max_workers)}
+        for i in range(len(urls)):
+            if not results[i].ok:
+                raise results[i].error
+        return StatisticsResponse.merge([results[i].response for i in range(len(urls))])
         
-
-        # Adjust date range if it exceeds 14 days
-        adjusted_values = adjust_date_range(start_date, end_date)
-        start_date, end_date, start_date_timestamp_sec, end_date_timestamp_sec = adjusted_values
-
-        # Check that exactly one of instance_id, app_id, or company_id is provided
-        provided_params = [p for p in [instance_id, app_id, company_id] if p is not None]
+class StatisticsModule:
+    def __init__(self, core: TelematicsCore):
+        self.core = core  # Renamed self.code to self.core for clarity
         
-        if len(provided_params) != 1:
-            raise ValueError("Exactly one of 'instance_id', 'app_id', or 'company_id' must be provided.")
-
-        url = f"{self.BASE_URL}/Statistics/consolidated/daily?StartDate={start_date}&EndDate={end_date}"
+    @cached_property
+    def Statistics(self):
+        # Built once and reused, so every access shares the same client
+        return Statistics(self.core.auth_client)
 
-        # Add the provided parameter to the URL
-        if instance_id:
-            url += f"&InstanceId={instance_id}"
-        elif app_id:
-            url += f"&AppId={app_id}"
-        elif company_id:
-            url += f"&CompanyId={company_id}"
 
-        if tag:
-            url += f"&Tag={tag}"
-        
-        try:    
-            response = self.auth_client.session.get(url, headers=self._get_headers())
-            if response.status_code == 401:  # Access token expired
-                self.auth_client.handle_401()
-                response = self.auth_client.session.get(url, headers=self._get_headers())
-
-            response.raise_for_status()
-            return StatisticsResponse(response.json())
-        except HTTPError as http_err:
-            print(f'HTTP error occurred: {http_err}')  # Or handle it in some other way
-            e_response = handle_response(response, StatisticsResponse) # Pass EngagementResponse as an argument
-            return e_response
-        
 
-    def entity_safety_score(self, start_date, end_date, tag=None, instance_id=None, app_id=None, company_id=None):
-       
-        # Adjust date range if it exceeds 14 days
-        adjusted_values = adjust_date_range(start_date, end_date)
-        start_date, end_date, start_date_timestamp_sec, end_date_timestamp_sec = adjusted_values        
-        
-        # Check that exactly one of instance_id, app_id, or company_id is provided
-        provided_params = [p for p in [instance_id, app_id, company_id] if p is not None]
+class Statistics(BaseStatistics):
+    # Methods that take a single user_id as their first argument and can be run in bulk
+    USER_METHODS = (
+        'user_daily_statistics',
+        'user_daily_ecoscore',
+        'user_daily_safetyscore',
+        'user_accumulated_statistics',
+        'user_accumulated_ecoscore',
+        'user_accumulated_safetyscore',
+        'lastupdates',
+        'uniquetags',
+    )
+
+    def user_daily_statistics(self, user_id, start_date, end_date, tag=None, deadline=None):
+        return self._get_daily_statistics(self._user_url('Statistics/daily', user_id, tag), start_date, end_date, deadline=deadline)
         
-        if len(provided_params) != 1:
-            raise ValueError("Exactly one of 'instance_id', 'app_id', or 'company_id' must be provided.")
+    def user_daily_ecoscore(self, user_id, start_date, end_date, deadline=None):
+        return self._get_daily_statistics(self._user_url('Scores/eco/daily', user_id), start_date, end_date, deadline=deadline)
 
-        url = f"{self.BASE_URL}/Scores/safety/consolidated?StartDate={start_date}&EndDate={end_date}"
-
-        # Add the provided parameter to the URL
-        if instance_id:
-            url += f"&InstanceId={instance_id}"
-        elif app_id:
-            url += f"&AppId={app_id}"
-        elif company_id:
-            url += f"&CompanyId={company_id}"
-
-        if tag:
-            url += f"&Tag={tag}"
-        try:    
-            response = self.auth_client.session.get(url, headers=self._get_headers())
-            if response.status_code == 401:  # Access token expired
-                self.auth_client.handle_401()
-                response = self.auth_client.session.get(url, headers=self._get_headers())
-
-            response.raise_for_status()
-            return StatisticsResponse(response.json())
-        except HTTPError as http_err:
-            print(f'HTTP error occurred: {http_err}')  # Or handle it in some other way
-            e_response = handle_response(response, StatisticsResponse) # Pass EngagementResponse as an argument
-            return e_response
+    def user_daily_safetyscore(self, user_id, start_date, end_date, tag=None, deadline=None):
+        return self._get_daily_statistics(self._user_url('Scores/safety/daily', user_id, tag), start_date, end_date, deadline=deadline)
+    
+    def user_accumulated_statistics(self, user_id, start_date, end_date, tag=None, deadline=None):
+        return self._get_statistics(self._user_url('Statistics', user_id, tag)(start_date, end_date), deadline)
 
-    def entity_accumulated_statistics(self, start_date, end_date, tag=None, instance_id=None, app_id=None, company_id=None):
-        # Check that exactly one of instance_id, app_id, or company_id is provided
-        provided_params = [p for p in [instance_id, app_id, company_id] if p is not None]
+    def user_accumulated_ecoscore(self, user_id, start_date, end_date, deadline=None):
+        return self._get_statistics(self._user_url('Scores/eco', user_id)(start_date, end_date), deadline)
         
-        if len(provided_params) != 1:
-            raise ValueError("Exactly one of 'instance_id', 'app_id', or 'company_id' must be provided.")
 
-        url = f"{self.BASE_URL}/Statistics/consolidated?StartDate={start_date}&EndDate={end_date}"
-
-        # Add the provided parameter to the URL
-        if instance_id:
-            url += f"&InstanceId={instance_id}"
-        elif app_id:
-            url += f"&AppId={app_id}"
-        elif company_id:
-            url += f"&CompanyId={company_id}"
-
-        if tag:
-            url += f"&Tag={tag}"
-        try:    
-            response = self.auth_client.session.get(url, headers=self._get_headers())
-            if response.status_code == 401:  # Access token expired
-                self.auth_client.handle_401()
-                response = self.auth_client.session.get(url, headers=self._get_headers())
-
-            response.raise_for_status()
-            return StatisticsResponse(response.json())
-        except HTTPError as http_err:
-            print(f'HTTP error occurred: {http_err}')  # Or handle it in some other way
-            e_response = handle_response(response, StatisticsResponse) # Pass EngagementResponse as an argument
-            return e_response
-
-    def entity_daily_safetyscore(self, start_date, end_date, tag=None, instance_id=None, app_id=None, company_id=None):
+    def user_accumulated_safetyscore(self, user_id, start_date, end_date, tag=None, deadline=None):
+        return self._get_statistics(self._user_url('Scores/safety', user_id, tag)(start_date, end_date), deadline)
         
-        adjusted_values = adjust_date_range(start_date, end_date)
-        start_date, end_date, start_date_timestamp_sec, end_date_timestamp_sec = adjusted_values
+    def entity_accumulated_ecoscore(self, start_date, end_date, tag=None, instance_id=None, app_id=None, company_id=None, deadline=None):
+        build_url = self._entity_url('Scores/eco/consolidated', tag, instance_id, app_id, company_id)
+        return self._get_entity_statistics(build_url(start_date, end_date), deadline)
         
-        print(start_date, end_date)
-
-        # Check that exactly one of instance_id, app_id, or company_id is provided
-        provided_params = [p for p in [instance_id, app_id, company_id] if p is not None]
+    
+    def entity_daily_ecoscore(self, start_date, end_date, tag=None, instance_id=None, app_id=None, company_id=None, deadline=None):
+        build_url = self._entity_url('Scores/eco/consolidated/daily', tag, instance_id, app_id, company_id)
+        return self._get_daily_statistics(build_url, start_date, end_date, self._get_entity_statistics, deadline=deadline)
+    
+    def entity_daily_statistics(self, start_date, end_date, tag=None, instance_id=None, app_id=None, company_id=None, deadline=None):
+        build_url = self._entity_url('Statistics/consolidated/daily', tag, instance_id, app_id, company_id)
+        return self._get_daily_statistics(build_url, start_date, end_date, self._get_entity_statistics, deadline=deadline)
         
-        if len(provided_params) != 1:
-            raise ValueError("Exactly one of 'instance_id', 'app_id', or 'company_id' must be provided.")
-
-        url = f"{self.BASE_URL}/Scores/safety/consolidated/daily?StartDate={start_date}&EndDate={end_date}"
-
-        # Add the provided parameter to the URL
-        if instance_id:
-            url += f"&InstanceId={instance_id}"
-        elif app_id:
-            url += f"&AppId={app_id}"
-        elif company_id:
-            url += f"&CompanyId={company_id}"
-
-        if tag:
-            url += f"&Tag={tag}"
-        try:    
-            response = self.auth_client.session.get(url, headers=self._get_headers())
-            if response.status_code == 401:  # Access token expired
-                self.auth_client.handle_401()
-                response = self.auth_client.session.get(url, headers=self._get_headers())
-
-            response.raise_for_status()
-            return StatisticsResponse(response.json())
-        except HTTPError as http_err:
-            print(f'HTTP error occurred: {http_err}')  # Or handle it in some other way
-            e_response = handle_response(response, StatisticsResponse) # Pass EngagementResponse as an argument
-            return e_response
 
-    def _adjust_date_range(self, start_date_obj, end_date_obj):
-        """Adjusts the date range to a maximum of 14 days."""
-        date_diff = (end_date_obj - start_date_obj).days
-        if date_diff > 14:
-            start_date_obj = end_date_obj - timedelta(days=14)
-        return start_date_obj, end_date_obj
-
-    def lastupdates(self, user_id):
-        url = f"{self.BASE_URL}/Statistics/dates?UserId={user_id}"
-        try:
-            response = self.auth_client.get_with_retry(url, headers=self._get_headers())
-            # return response.json()
-            return StatisticsResponse(response.json())
-        except HTTPError as http_err:
-            print(f'HTTP error occurred: {http_err}')  # Or handle it in some other way
-            e_response = handle_response(response, StatisticsResponse) # Pass EngagementResponse as an argument
-            return e_response
-
-
-    def uniquetags(self, user_id, start_date, end_date):
-        url = f"{self.BASE_URL}/Statistics/UniqueTags?UserId={user_id}&StartDate={start_date}&EndDate={end_date}"
-        try:
-            response = self.auth_client.get_with_retry(url, headers=self._get_headers())
-            # return response.json()
-            return StatisticsResponse(response.json())
-        except HTTPError as http_err:
-            print(f'HTTP error occurred: {http_err}')  # Or handle it in some other way
-            e_response = handle_response(response, StatisticsResponse) # Pass EngagementResponse as an argument
-            return e_response
+    def entity_safety_score(self, start_date, end_date, tag=None, instance_id=None, app_id=None, company_id=None, deadline=None):
+        return self._get_entity_statistics(
+            self._entity_score_url(start_date, end_date, tag, instance_id, app_id, company_id), deadline)
+
+    def entity_accumulated_statistics(self, start_date, end_date, tag=None, instance_id=None, app_id=None, company_id=None, deadline=None):
+        build_url = self._entity_url('Statistics/consolidated', tag, instance_id, app_id, company_id)
+        return self._get_entity_statistics(build_url(start_date, end_date), deadline)
+
+    def entity_daily_safetyscore(self, start_date, end_date, tag=None, instance_id=None, app_id=None, company_id=None, deadline=None):
+        build_url = self._entity_url('Scores/safety/consolidated/daily', tag, instance_id, app_id, company_id)
+        return self._get_daily_statistics(build_url, start_date, end_date, self._get_entity_statistics, deadline=deadline)
+
+    def lastupdates(self, user_id, deadline=None):
+        return self._get_statistics(self._lastupdates_url(user_id), deadline)
+
+
+    def uniquetags(self, user_id, start_date, end_date, deadline=None):
+        return self._get_statistics(self._user_url('Statistics/UniqueTags', user_id)(start_date, end_date), deadline)
+
+    def _resolve_user_method(self, method):
+        if callable(method):
+            return method
+        if method not in self.USER_METHODS:
+            raise ValueError(f"'{method}' is not a per-user method. Choose one of: {', '.join(self.USER_METHODS)}.")
+        return getattr(self, method)
+
+    def bulk_iter(self, method, user_ids, *args, max_workers=None, **kwargs):
+        """
+        Runs a per-user method for many users concurrently and yields a `BulkResult`
+        per user as soon as its call completes.
+
+        `method` is one of `USER_METHODS` (or a bound method); `*args`/`**kwargs` are
+        passed to every call after the user_id. Calls run on `max_workers` threads,
+        which defaults to the auth client's `pool_maxsize` so every worker reuses a
+        pooled connection. A failing user is reported in its result's `error`
+        instead of aborting the run: the exception raised, or a `StatisticsError`
+        when the API answered with an error body.
+        """
+        func = self._resolve_user_method(method)
+        max_workers = max_workers or self.auth_client.pool_maxsize
+        return self._iter_bulk(lambda user_id: func(user_id, *args, **kwargs), user_ids, max_workers)
+
+    def _iter_bulk(self, func, user_ids, max_workers):
+        for result in iter_bulk(func, user_ids, max_workers):
+            yield _check_statistics(result)
+
+    def bulk(self, method, user_ids, *args, max_workers=None, **kwargs):
+        """
+        Same as `bulk_iter`, but waits for every user and returns a dict of
+        user_id -> `BulkResult` in the order the user_ids were given.
+        """
+        results = {result.key: result for result in self.bulk_iter(method, user_ids, *args, max_workers=max_workers, **kwargs)}
+        return {user_id: results[user_id] for user_id in dict.fromkeys(user_ids)}
 
 class StatisticsResponse:
     def __init__(self, data):
         self.data = data if isinstance(data, dict) else {}  # Ensure self.data is always a dictionary
 
+    @classmethod
+    def merge(cls, responses):
+        """
+        Combines the responses of consecutive date windows into one, dropping the rows
+        repeated where windows meet. If any window failed, its response is returned as is.
+        """
+        for response in responses:
+            if is_error_data(response.data):
+                return response
+
+        rows = []
+        seen = set()
+        for response in responses:
+            for row in response.result:
+                key = _row_key(row)
+                if key in seen:
+                    continue
+                seen.add(key)
+                rows.append(row)
+
+        data = dict(responses[0].data)
+        data['Result'] = rows
+        return cls(data)
+
+    @classmethod
+    def concat_columns(cls, responses):
+        """
+        Concatenates many users' responses into one `ColumnTable` (requires NumPy).
+
+        `responses` is a dict of user_id -> response, such as the result of
+        `Statistics.bulk()` (values may be `BulkResult`s), or an iterable of
+        (user_id, response) pairs. Failed responses contribute no rows, but their
+        user still gets a slot in `table.users`.
+        """
+        from .columnar import ColumnTable
+
+        items = responses.items() if isinstance(responses, dict) else responses
+
+        def rows_by_user():
+            for user_id, response in items:
+                if hasattr(response, 'ok') and hasattr(response, 'error'):
+                    response = response.response if response.ok else None
+                if response is None or is_error_data(response.data):
+                    yield user_id, []
+                else:
+                    yield user_id, response._rows()
+
+        return ColumnTable.from_rows(rows_by_user())
+
     @property
     def result(self):
         return self.data.get('Result', []) if isinstance(self.data.get('Result', []), list) else []
 
+    def _rows(self):
+        # Daily endpoints return a list of rows, accumulated ones a single dict
+        result = self.data.get('Result')
+        if isinstance(result, dict):
+            return [result]
+        if isinstance(result, list):
+            return [row for row in result if isinstance(row, dict)]
+        return []
+
+    @cached_property
+    def rows(self):
+        """The result rows as typed `StatisticsRow` models, built from `data` on first access."""
+        return StatisticsRow.from_list(self._rows())
+
+    def to_columns(self):
+        """
+        The result rows as a dict of field name -> NumPy array (requires NumPy).
+        Dates become datetime64 arrays and numeric fields float arrays, with NaT/NaN
+        where a row has no value.
+        """
+        from .columnar import rows_to_columns
+        return rows_to_columns(self._rows())
+
+    def to_arrays(self):
+        """The result rows as one NumPy structured array, e.g. `arr['MileageKm'].sum()`."""
+        from .columnar import columns_to_records
+        return columns_to_records(self.to_columns())
+
 
     @property
     def status(self):
@@ -384,26 +322,31 @@ class StatisticsResponse:
     
     @property
     def latest_trip_date(self):
-        if isinstance(self.result, dict):
-            return self.result.get('LatestTripDate')
+        # 'result' only exposes list results, so read the dict returned by lastupdates directly
+        result = self.data.get('Result')
+        if isinstance(result, dict):
+            return result.get('LatestTripDate')
         return None
 
     @property
     def latest_scoring_date(self):
-        if isinstance(self.result, dict):
-            return self.result.get('LatestScoringDate')
+        result = self.data.get('Result')
+        if isinstance(result, dict):
+            return result.get('LatestScoringDate')
         return None
     
     @property
     def tags_count(self):
-        if isinstance(self.result, dict):
-            return self.result.get('UniqueTagsCount')
+        result = self.data.get('Result')
+        if isinstance(result, dict):
+            return result.get('UniqueTagsCount')
         return None
     
     @property
     def tags_list(self):
-        if isinstance(self.result, dict):
-            return self.result.get('UniqueTagsList', [])
+        result = self.data.get('Result')
+        if isinstance(result, dict):
+            return result.get('UniqueTagsList', [])
         return []
     
     @property
@@ -414,6 +357,27 @@ class StatisticsResponse:
     def __str__(self):
         return json.dumps(self.data, indent=4)
     
+
+def _check_statistics(result):
+    # The per-user methods return error bodies instead of raising; report them as failures.
+    # Other callables may return anything, so only statistics responses are checked.
+    if result.ok and isinstance(result.response, StatisticsResponse) and is_error_data(result.response.data):
+        data = getattr(result.response, 'data', None)
+        return BulkResult(result.key, response=result.response,
+                          error=StatisticsError(f"Statistics failed for {result.key}: {data}"))
+    return result
+
+
+class StatisticsError(Exception):
+    pass
+
+
+def _row_key(row):
+    # Daily rows are unique per entity and date; anything else is compared by content
+    if isinstance(row, dict) and (row.get('ReportDate') or row.get('CalcDate')):
+        return tuple(row.get(k) for k in ('UserId', 'InstanceId', 'AppId', 'CompanyId', 'ReportDate', 'CalcDate'))
+    return json.dumps(row, sort_keys=True)
+
     # Add at the bottom of statistics.py
 def DamoovAuth(email, password):
     auth_client = TelematicsAuth(email, password)
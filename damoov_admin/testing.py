@@ -0,0 +1,639 @@
+# testing.py
+import argparse
+import base64
+import json
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+# Path prefixes of the real API hosts, all served from one local address
+AUTH_PATH = '/v1/Auth'
+USERS_PATH = '/v1'
+LEADERBOARD_PATH = '/v1/Leaderboard'
+STATISTICS_PATH = '/indicators/admin/v2'
+TRIPS_PATH = '/trips/get/admin/v1'
+# Counters and settings of the mock itself
+CONTROL_PATH = '/_mock'
+
+_EPOCH = datetime(1970, 1, 1)
+
+_DAY_FIELDS = {
+    'statistics': ('ReportDate', ('MileageKm', 'DrivingTime', 'AverageSpeedKmh', 'MaxSpeedKmh', 'NightDrivingTime',
+                                  'RushHoursDrivingTime', 'PhoneUsageDurationMin', 'TotalSpeedingKm')),
+    'safety': ('CalcDate', ('SafetyScore', 'AccelerationScore', 'BrakingScore', 'CorneringScore', 'SpeedingScore',
+                            'PhoneUsageScore')),
+    'eco': ('CalcDate', ('EcoScore', 'EcoScoreBrakes', 'EcoScoreFuel', 'EcoScoreTyres', 'EcoScoreDepreciation')),
+}
+
+
+class MockAPI:
+    """
+    Local stand-in for the Damoov API, for tests and benchmarks that must not reach
+    the real service.
+
+    It answers the Auth, indicators, trips, user management and leaderboard
+    endpoints with deterministic, realistically shaped payloads from a threaded HTTP
+    server on `host:port` (port 0 picks a free one). Use it as a context manager and
+    point the SDK at it with `patch()`:
+
+        with MockAPI(latency=0.02, waypoints=500) as api, api.patch():
+            auth = TelematicsAuth('bench@example.com', 'secret')
+            Trips(auth).get_list_trips(user_id, '2024-01-01', '2024-03-01')
+
+    Knobs, all plain attributes that can be changed while the server runs:
+
+    - `latency` seconds added to every response, plus a random 0..`jitter`
+    - payload sizes: `trips_per_day` listed per user and day, `waypoints` and `events`
+      per trip detail, `leaderboard_size` entries
+    - faults: `error_rate` (503), `throttle_rate` (429 with `Retry-After: retry_after`)
+      and `unauthorized_rate` (401) are the probabilities of answering a non-auth
+      request with that status; `fail_next()` queues exact failures
+    - tokens are JWTs expiring after `token_ttl` seconds; expired or unknown tokens get
+      401 and `expire_tokens()` invalidates every token issued so far
+
+    `counts` holds the requests served per endpoint and `statuses` per status code.
+    Another process can read them from GET /_mock/stats, clear them with POST
+    /_mock/reset, and change settings with POST /_mock/config (a JSON object of
+    `KNOBS`), POST /_mock/fail (the arguments of `fail_next`) and POST /_mock/expire.
+    """
+
+    # Settings that configure() and the control endpoint may change
+    KNOBS = ('latency', 'jitter', 'trips_per_day', 'waypoints', 'events', 'leaderboard_size', 'error_rate',
+             'throttle_rate', 'unauthorized_rate', 'retry_after', 'token_ttl')
+    # Encoded trip detail bodies kept, so large waypoint payloads are only built once
+    MAX_CACHED_BODIES = 256
+
+    def __init__(self, host='127.0.0.1', port=0, latency=0.0, jitter=0.0, trips_per_day=2, waypoints=100, events=5,
+                 leaderboard_size=10, error_rate=0.0, throttle_rate=0.0, unauthorized_rate=0.0, retry_after=0,
+                 token_ttl=3600, seed=0):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.trips_per_day = trips_per_day
+        self.waypoints = waypoints
+        self.events = events
+        self.leaderboard_size = leaderboard_size
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.unauthorized_rate = unauthorized_rate
+        self.retry_after = retry_after
+        self.token_ttl = token_ttl
+        self.seed = seed
+
+        self.counts = Counter()
+        self.statuses = Counter()
+        self._random = random.Random(seed)
+        self._failures = []
+        self._tokens = {}
+        self._refresh_tokens = set()
+        self._bodies = OrderedDict()
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self):
+        if self._server is None:
+            raise RuntimeError("MockAPI is not running; call start() first.")
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self):
+        if self._server is None:
+            self._server = _Server((self.host, self.port), _Handler)
+            self._server.api = self
+            self._thread = threading.Thread(target=self._server.serve_forever, name='damoov-mock-api', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def patch(self, tokens_dir=None):
+        """Points every SDK module at this server; see `patch_urls`."""
+        return patch_urls(self.url, tokens_dir)
+
+    def fail_next(self, status, count=1, endpoint=None, retry_after=None):
+        """
+        Answers the next `count` requests (to `endpoint` only, if given: 'statistics',
+        'trips', 'trip_details', 'users', 'leaderboard', 'login' or 'refresh') with `status`.
+        """
+        with self._lock:
+            self._failures.append([endpoint, status, count, retry_after])
+
+    def expire_tokens(self):
+        """Invalidates every access token issued so far, as if they had all expired."""
+        with self._lock:
+            self._tokens.clear()
+
+    def reset_counts(self):
+        with self._lock:
+            self.counts.clear()
+            self.statuses.clear()
+
+    def config(self):
+        return {name: getattr(self, name) for name in self.KNOBS}
+
+    def configure(self, **knobs):
+        unknown = set(knobs) - set(self.KNOBS)
+        if unknown:
+            raise ValueError(f"Unknown MockAPI setting(s): {', '.join(sorted(unknown))}.")
+        for name, value in knobs.items():
+            setattr(self, name, value)
+
+    def handle(self, method, path, query, headers, body):
+        """Answers one request; returns (status, body bytes, extra headers)."""
+        if path.startswith(CONTROL_PATH + '/'):
+            status, payload = self._control(method, path[len(CONTROL_PATH) + 1:], body)
+            return status, json.dumps(payload).encode(), {}
+        delay = self.latency + (self._uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+        endpoint, handler = self._route(method, path)
+        with self._lock:
+            self.counts[endpoint] += 1
+        status, payload, extra = self._respond(endpoint, handler, path, query, headers, body)
+        with self._lock:
+            self.statuses[status] += 1
+        if not isinstance(payload, bytes):
+            payload = json.dumps(payload).encode()
+        return status, payload, extra
+
+    def _control(self, method, name, body):
+        """Lets a client in another process read counters and change settings, e.g. between benchmark runs."""
+        if name == 'stats' and method == 'GET':
+            with self._lock:
+                return 200, {'counts': dict(self.counts), 'statuses': {str(k): v for k, v in self.statuses.items()}}
+        if name == 'reset' and method == 'POST':
+            self.reset_counts()
+            return 200, {}
+        if name == 'expire' and method == 'POST':
+            self.expire_tokens()
+            return 200, {}
+        if name == 'config' and method == 'GET':
+            return 200, self.config()
+        if name == 'config' and method == 'POST':
+            try:
+                self.configure(**json.loads(body or b'{}'))
+            except (TypeError, ValueError) as exc:
+                return 400, {'error': str(exc)}
+            return 200, self.config()
+        if name == 'fail' and method == 'POST':
+            try:
+                self.fail_next(**json.loads(body or b'{}'))
+            except (TypeError, ValueError) as exc:
+                return 400, {'error': str(exc)}
+            return 200, {}
+        return 404, {'error': f'Unknown control endpoint {method} {name}'}
+
+    def _respond(self, endpoint, handler, path, query, headers, body):
+        failure = self._injected_failure(endpoint)
+        if failure is not None:
+            return failure
+        if handler is None:
+            return 404, _envelope(None, 404, 'Not Found'), {}
+        try:
+            payload = json.loads(body) if body else {}
+        except ValueError:
+            return 400, _envelope(None, 400, 'Request body is not valid JSON'), {}
+        return handler(path, query, headers, payload)
+
+    def _route(self, method, path):
+        if path.startswith(AUTH_PATH + '/'):
+            name = path[len(AUTH_PATH) + 1:]
+            if name == 'Login':
+                return 'login', self._login
+            if name == 'RefreshToken':
+                return 'refresh', self._refresh
+            return 'auth', None
+        if path == LEADERBOARD_PATH or path.startswith(LEADERBOARD_PATH + '/'):
+            return 'leaderboard', self._leaderboard if method == 'GET' else None
+        if path.startswith(STATISTICS_PATH + '/'):
+            return 'statistics', self._statistics if method == 'GET' else None
+        if path == TRIPS_PATH:
+            return 'trips', self._list_trips if method == 'POST' else None
+        if path.startswith(TRIPS_PATH + '/'):
+            return 'trip_details', self._trip_details if method == 'POST' else None
+        if path.startswith(USERS_PATH + '/'):
+            return 'users', {'POST': self._create_user, 'PUT': self._update_user,
+                             'DELETE': self._delete_user}.get(method)
+        return 'unknown', None
+
+    def _uniform(self, low, high):
+        with self._lock:
+            return self._random.uniform(low, high)
+
+    def _chance(self, rate):
+        return rate > 0 and self._uniform(0, 1) < rate
+
+    def _injected_failure(self, endpoint):
+        with self._lock:
+            for failure in self._failures:
+                target, status, count, retry_after = failure
+                if target is None or target == endpoint:
+                    failure[2] -= 1
+                    if failure[2] <= 0:
+                        self._failures.remove(failure)
+                    return _failure(status, retry_after if retry_after is not None else self.retry_after)
+        if endpoint in ('login', 'refresh'):
+            return None
+        if self._chance(self.unauthorized_rate):
+            return _failure(401)
+        if self._chance(self.throttle_rate):
+            return _failure(429, self.retry_after)
+        if self._chance(self.error_rate):
+            return _failure(503)
+        return None
+
+    # Auth
+
+    def _issue_tokens(self):
+        expires_at = time.time() + self.token_ttl
+        claims = {'sub': 'mock', 'exp': int(expires_at), 'jti': uuid.uuid4().hex}
+        access_token = '.'.join(_b64(part) for part in ({'alg': 'none', 'typ': 'JWT'}, claims)) + '.'
+        refresh_token = uuid.uuid4().hex
+        with self._lock:
+            self._tokens[access_token] = expires_at
+            self._refresh_tokens.add(refresh_token)
+        return 200, _envelope({'AccessToken': {'Token': access_token, 'ExpiresIn': self.token_ttl},
+                               'RefreshToken': refresh_token}), {}
+
+    def _login(self, path, query, headers, payload):
+        if not payload.get('LoginFields') or not payload.get('Password'):
+            return 401, _envelope(None, 401, 'Invalid credentials'), {}
+        return self._issue_tokens()
+
+    def _refresh(self, path, query, headers, payload):
+        with self._lock:
+            known = payload.get('RefreshToken') in self._refresh_tokens
+            if known:
+                self._refresh_tokens.discard(payload['RefreshToken'])
+        if not known:
+            return 401, _envelope(None, 401, 'Invalid refresh token'), {}
+        return self._issue_tokens()
+
+    def _authorized(self, headers):
+        value = headers.get('authorization') or ''
+        if not value.startswith('Bearer '):
+            return False
+        with self._lock:
+            expires_at = self._tokens.get(value[len('Bearer '):])
+        return expires_at is not None and time.time() < expires_at
+
+    # Indicators
+
+    def _statistics(self, path, query, headers, payload):
+        if not self._authorized(headers):
+            return 401, _envelope(None, 401, 'Unauthorized'), {}
+        route = path[len(STATISTICS_PATH) + 1:].split('/')
+        params = {key: values[0] for key, values in query.items()}
+        entity = params.get('UserId') or params.get('CompanyId') or params.get('InstanceId') or params.get('AppId') or 'all'
+        if route[-1] == 'dates':
+            return 200, _envelope({'LatestTripDate': '2024-01-05T10:00:00', 'LatestScoringDate': '2024-01-05T00:00:00'}), {}
+        if route[-1] == 'UniqueTags':
+            tags = [f'tag{i}' for i in range(3)]
+            return 200, _envelope({'UniqueTagsCount': len(tags), 'UniqueTagsList': tags}), {}
+        kind = 'statistics' if route[0] == 'Statistics' else route[1] if len(route) > 1 else None
+        if kind not in _DAY_FIELDS:
+            return 404, _envelope(None, 404, 'Not Found'), {}
+        try:
+            days = _days(params['StartDate'], params['EndDate'])
+        except (KeyError, ValueError):
+            return 400, _envelope(None, 400, 'StartDate and EndDate are required'), {}
+        rows = [self._day_row(kind, entity, day) for day in days]
+        if route[-1] == 'daily':
+            return 200, _envelope(rows), {}
+        return 200, _envelope(_accumulate(kind, rows)), {}
+
+    def _day_row(self, kind, entity, day):
+        date_field, fields = _DAY_FIELDS[kind]
+        rng = random.Random(f'{self.seed}:{kind}:{entity}:{day}')
+        row = {date_field: day.strftime('%Y-%m-%dT00:00:00')}
+        for field in fields:
+            row[field] = round(rng.uniform(40, 100) if kind != 'statistics' else rng.uniform(0, 120), 2)
+        if kind == 'statistics':
+            row['TripsCount'] = self.trips_per_day
+        return row
+
+    # Trips
+
+    def _list_trips(self, path, query, headers, payload):
+        if not self._authorized(headers):
+            return 401, _envelope(None, 401, 'Unauthorized'), {}
+        user_id = payload.get('Identifiers', {}).get('UserId') or 'user'
+        if payload.get('StartDate') and payload.get('EndDate'):
+            days = _days(payload['StartDate'], payload['EndDate'])
+        elif payload.get('StartDateTimestampSec') and payload.get('EndDateTimestampSec'):
+            days = _days(_EPOCH + timedelta(seconds=int(payload['StartDateTimestampSec'])),
+                         _EPOCH + timedelta(seconds=int(payload['EndDateTimestampSec'])))
+        else:
+            return 400, _envelope(None, 400, 'A date range is required'), {}
+        ids = [_trip_id(user_id, day, k) for day in days for k in range(self.trips_per_day)]
+        if str(payload.get('SortBy', '')).endswith('_Desc'):
+            ids.reverse()
+        paging = payload.get('Paging') or {}
+        count = int(paging.get('Count') or 50)
+        page = int(paging.get('Page') or 1)
+        chunk = ids[(page - 1) * count:page * count]
+        trips = [self._trip(trip_id, user_id, details=payload.get('IncludeDetails'),
+                            statistics=payload.get('IncludeStatistics'), scores=payload.get('IncludeScores'))
+                 for trip_id in chunk]
+        result = {'Trips': trips}
+        if paging.get('IncludePagingInfo'):
+            total_pages = -(-len(ids) // count)
+            result['PagingInfo'] = {'CurrentPage': page, 'TotalPages': total_pages, 'PageSize': count,
+                                    'TotalCount': len(ids), 'HasNextPage': page < total_pages}
+        return 200, _envelope(result), {}
+
+    def _trip_details(self, path, query, headers, payload):
+        if not self._authorized(headers):
+            return 401, _envelope(None, 401, 'Unauthorized'), {}
+        trip_id = path[len(TRIPS_PATH) + 1:]
+        user_id = payload.get('Identifiers', {}).get('UserId') or 'user'
+        flags = tuple(bool(payload.get(name)) for name in
+                      ('IncludeDetails', 'IncludeStatistics', 'IncludeScores', 'IncludeEvents', 'IncludeWaypoints'))
+        key = (trip_id, user_id, flags, self.waypoints, self.events)
+        with self._lock:
+            body = self._bodies.get(key)
+            if body is not None:
+                self._bodies.move_to_end(key)
+        if body is None:
+            trip = self._trip(trip_id, user_id, *flags)
+            body = json.dumps(_envelope({'Trip': trip})).encode()
+            with self._lock:
+                self._bodies[key] = body
+                if len(self._bodies) > self.MAX_CACHED_BODIES:
+                    self._bodies.popitem(last=False)
+        return 200, body, {}
+
+    def _trip(self, trip_id, user_id, details=False, statistics=False, scores=False, events=False, waypoints=False):
+        rng = random.Random(f'{self.seed}:{trip_id}')
+        start = _trip_start(trip_id) + timedelta(minutes=rng.randrange(0, 600))
+        duration = timedelta(seconds=max(self.waypoints, 1) + rng.randrange(0, 600))
+        trip = {'Id': trip_id, 'Data': {
+            'UserId': user_id,
+            'StartDate': start.isoformat(timespec='seconds'),
+            'EndDate': (start + duration).isoformat(timespec='seconds'),
+            'StartDateUtc': start.isoformat(timespec='seconds') + 'Z',
+            'EndDateUtc': (start + duration).isoformat(timespec='seconds') + 'Z',
+            'StartDateTimestampSec': int((start - _EPOCH).total_seconds()),
+            'EndDateTimestampSec': int((start + duration - _EPOCH).total_seconds()),
+            'TransportType': {'Current': 'OriginalDriver'},
+            'Tags': [],
+        }}
+        if details:
+            trip['Data']['Addresses'] = {'Start': {'Full': 'Start street 1'}, 'End': {'Full': 'End street 2'}}
+        if statistics:
+            trip['Statistics'] = {
+                'Mileage': round(rng.uniform(1, 60), 2),
+                'DurationMinutes': round(duration.total_seconds() / 60, 2),
+                'AverageSpeed': round(rng.uniform(20, 80), 2),
+                'MaxSpeed': round(rng.uniform(80, 140), 2),
+                'AccelerationsCount': rng.randrange(0, 10),
+                'BrakingsCount': rng.randrange(0, 10),
+                'CorneringsCount': rng.randrange(0, 10),
+            }
+        if scores:
+            trip['Scores'] = {name: round(rng.uniform(40, 100), 2) for name in
+                              ('Safety', 'Speeding', 'Acceleration', 'Braking', 'Cornering', 'PhoneUsage', 'Eco')}
+        if events:
+            trip['Events'] = [{'EventType': rng.choice(('Acceleration', 'Braking', 'Cornering', 'Speeding')),
+                               'Date': (start + timedelta(seconds=rng.randrange(0, int(duration.total_seconds()))))
+                               .isoformat(timespec='seconds'),
+                               'Latitude': round(rng.uniform(-60, 60), 6), 'Longitude': round(rng.uniform(-180, 180), 6),
+                               'Value': round(rng.uniform(0, 1), 3)}
+                              for _ in range(self.events)]
+        if waypoints:
+            trip['Waypoints'] = _waypoints(rng, start, self.waypoints)
+        return trip
+
+    # User management and leaderboard
+
+    def _create_user(self, path, query, headers, payload):
+        if path != USERS_PATH + '/registration/create':
+            return 404, _envelope(None, 404, 'Not Found'), {}
+        if not headers.get('InstanceId') or not headers.get('InstanceKey'):
+            return 401, _envelope(None, 401, 'InstanceId and InstanceKey are required'), {}
+        result = {'DeviceToken': str(uuid.uuid4())}
+        if payload.get('CreateAccessToken'):
+            result['AccessToken'] = {'Token': uuid.uuid4().hex}
+            result['RefreshToken'] = uuid.uuid4().hex
+        return 200, _envelope(result), {}
+
+    def _update_user(self, path, query, headers, payload):
+        if path != USERS_PATH + '/Management/users':
+            return 404, _envelope(None, 404, 'Not Found'), {}
+        if not self._authorized(headers):
+            return 401, _envelope(None, 401, 'Unauthorized'), {}
+        return 200, _envelope(dict(payload, DeviceToken=headers.get('UserDeviceToken'))), {}
+
+    def _delete_user(self, path, query, headers, payload):
+        if not path.startswith(USERS_PATH + '/Management/users/'):
+            return 404, _envelope(None, 404, 'Not Found'), {}
+        if not self._authorized(headers):
+            return 401, _envelope(None, 401, 'Unauthorized'), {}
+        return 200, _envelope({}), {}
+
+    def _leaderboard(self, path, query, headers, payload):
+        device_token = headers.get('DeviceToken')
+        if not device_token:
+            return 401, _envelope(None, 401, 'DeviceToken is required'), {}
+        rng = random.Random(f'{self.seed}:leaderboard')
+        users = [{'DeviceToken': str(uuid.UUID(int=rng.getrandbits(128))), 'Place': place,
+                  'Score': round(100 - place * rng.uniform(0.5, 2), 2), 'Nickname': f'driver{place}'}
+                 for place in range(1, self.leaderboard_size + 1)]
+        if path.endswith('/user'):
+            place = random.Random(f'{self.seed}:{device_token}').randrange(1, self.leaderboard_size + 1)
+            return 200, _envelope({'DeviceToken': device_token, 'Place': place, 'UsersNumber': len(users),
+                                   'Score': users[place - 1]['Score']}), {}
+        count = int(query.get('UsersCount', ['5'])[0])
+        return 200, _envelope({'Users': users[:count], 'UsersNumber': len(users)}), {}
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # Benchmarks open many connections at once
+    request_queue_size = 128
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Small responses would otherwise wait for the client's delayed ACK
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _handle(self):
+        url = urlsplit(self.path)
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        status, payload, extra = self.server.api.handle(self.command, url.path, parse_qs(url.query), self.headers, body)
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(payload)))
+        for name, value in extra.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+
+@contextmanager
+def patch_urls(base_url, tokens_dir=None):
+    """
+    Points the SDK's endpoint URLs (sync and async clients alike) at `base_url`, for
+    clients created inside the `with` block, and restores them on exit.
+
+    Tokens are stored in `tokens_dir`, or in a temporary directory removed on exit,
+    so mock tokens never overwrite the real ones in ~/.damoov-config.
+    """
+    from . import auth, engagement, statistics, trips, users
+
+    base_url = base_url.rstrip('/')
+    targets = [
+        (auth.BaseAuth, 'BASE_URL', base_url + AUTH_PATH),
+        (auth.BaseAuth, 'LOGIN_ENDPOINT', base_url + AUTH_PATH + '/Login'),
+        (auth.BaseAuth, 'REFRESH_ENDPOINT', base_url + AUTH_PATH + '/RefreshToken'),
+        (users.BaseUsers, 'BASE_URL', base_url + USERS_PATH),
+        (engagement.BaseEngament, 'LEADERBOARD_URL', base_url + LEADERBOARD_PATH),
+        (statistics.BaseStatistics, 'BASE_URL', base_url + STATISTICS_PATH),
+        (trips.BaseTrips, 'BASE_URL', base_url + TRIPS_PATH),
+    ]
+    temporary = tempfile.mkdtemp(prefix='damoov-mock-') if tokens_dir is None else None
+    targets.append((auth.BaseAuth, 'TOKENS_DIR', tokens_dir or temporary))
+    saved = [(cls, name, cls.__dict__[name]) for cls, name, _ in targets]
+    for cls, name, value in targets:
+        setattr(cls, name, value)
+    try:
+        yield base_url
+    finally:
+        for cls, name, value in saved:
+            setattr(cls, name, value)
+        if temporary is not None:
+            shutil.rmtree(temporary, ignore_errors=True)
+
+
+def _envelope(result, status=200, title=''):
+    return {'Result': result, 'Status': status, 'Title': title, 'Errors': []}
+
+
+def _failure(status, retry_after=None):
+    headers = {'Retry-After': str(retry_after)} if status == 429 and retry_after is not None else {}
+    return status, _envelope(None, status, f'Injected {status}'), headers
+
+
+def _b64(data):
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b'=').decode()
+
+
+def _parse_day(value):
+    if isinstance(value, datetime):
+        return value.replace(hour=0, minute=0, second=0, microsecond=0)
+    return datetime.fromisoformat(str(value)[:10])
+
+
+def _days(start, end):
+    start, end = _parse_day(start), _parse_day(end)
+    return [start + timedelta(days=i) for i in range((end - start).days + 1)]
+
+
+def _trip_id(user_id, day, index):
+    return f"{user_id}-{day:%Y%m%d}-{index}"
+
+
+def _trip_start(trip_id):
+    try:
+        return datetime.strptime(trip_id.rsplit('-', 2)[1], '%Y%m%d')
+    except (IndexError, ValueError):
+        return datetime(2024, 1, 1)
+
+
+def _accumulate(kind, rows):
+    date_field, fields = _DAY_FIELDS[kind]
+    result = {}
+    for field in fields:
+        values = [row[field] for row in rows]
+        total = sum(values)
+        # Scores average over the days, statistics add up
+        result[field] = round(total / len(values) if kind != 'statistics' and values else total, 2)
+    if kind == 'statistics':
+        result['TripsCount'] = sum(row['TripsCount'] for row in rows)
+    return result
+
+
+def _waypoints(rng, start, count):
+    lat, lon = rng.uniform(-60, 60), rng.uniform(-180, 180)
+    speed = rng.uniform(20, 60)
+    points = []
+    for i in range(count):
+        speed = min(140.0, max(0.0, speed + rng.uniform(-3, 3)))
+        # Roughly one second of travel at `speed` km/h
+        lat += speed / 3600 / 111.0 * rng.uniform(0.5, 1)
+        lon += speed / 3600 / 111.0 * rng.uniform(-0.5, 0.5)
+        points.append({
+            'PointDate': (start + timedelta(seconds=i)).isoformat(timespec='seconds'),
+            'Latitude': round(lat, 6),
+            'Longitude': round(lon, 6),
+            'Speed': round(speed, 2),
+            'Heading': rng.randrange(0, 360),
+            'Accuracy': round(rng.uniform(3, 15), 1),
+        })
+    return points
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the mock Damoov API until interrupted.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080, help="0 picks a free port")
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--trips-per-day', type=int, default=2)
+    parser.add_argument('--waypoints', type=int, default=100)
+    parser.add_argument('--events', type=int, default=5)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--throttle-rate', type=float, default=0.0)
+    parser.add_argument('--unauthorized-rate', type=float, default=0.0)
+    parser.add_argument('--retry-after', type=float, default=0)
+    parser.add_argument('--token-ttl', type=float, default=3600)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    api = MockAPI(args.host, args.port, latency=args.latency, jitter=args.jitter, trips_per_day=args.trips_per_day,
+                  waypoints=args.waypoints, events=args.events, error_rate=args.error_rate,
+                  throttle_rate=args.throttle_rate, unauthorized_rate=args.unauthorized_rate,
+                  retry_after=args.retry_after, token_ttl=args.token_ttl, seed=args.seed)
+    with api:
+        # The first line is read by scripts that start the server on port 0
+        print(api.url, flush=True)
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+        print(dict(api.counts), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
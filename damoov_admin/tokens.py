@@ -0,0 +1,124 @@
+# tokens.py
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class TokenStore:
+    """
+    Token file shared by every process and client using the same admin credentials.
+
+    Use `TokenStore.for_path(path)` to get the single store for a file within this
+    process. It keeps the last tokens it read or wrote in memory, so clients created
+    after the first one do not touch the disk. `locked()` takes an advisory lock on
+    `<path>.lock` that other processes respect. Writes go to a temporary file that
+    replaces the token file atomically, so readers never see a half-written file and
+    `read()` never waits for the lock.
+    """
+
+    _stores = {}
+    _stores_lock = threading.Lock()
+
+    def __init__(self, path):
+        self.path = path
+        self.lock_path = f"{path}.lock"
+        self.tokens = None
+
+        self._thread_lock = threading.RLock()
+        self._tokens_lock = threading.Lock()
+        self._lock_file = None
+        self._depth = 0
+
+    @classmethod
+    def for_path(cls, path):
+        with cls._stores_lock:
+            store = cls._stores.get(path)
+            if store is None:
+                store = cls._stores[path] = cls(path)
+            return store
+
+    def read(self, fresh=False):
+        """Returns the stored tokens, from memory unless `fresh` is set or nothing is loaded yet."""
+        if self.tokens is None or fresh:
+            try:
+                with open(self.path, 'r') as f:
+                    tokens = json.load(f)
+            except (OSError, ValueError):
+                # Missing or unreadable file: keep what we have
+                tokens = None
+            if tokens is not None:
+                with self._tokens_lock:
+                    self.tokens = tokens
+        with self._tokens_lock:
+            return dict(self.tokens) if self.tokens is not None else {}
+
+    def write(self, tokens):
+        with self.locked():
+            directory = os.path.dirname(self.path)
+            fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.token-', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(tokens, f)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, self.path)
+            except BaseException:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
+            with self._tokens_lock:
+                self.tokens = dict(tokens)
+
+    @contextmanager
+    def locked(self):
+        """Exclusive lock across threads and processes. Re-entrant within a thread."""
+        with self._thread_lock:
+            if self._depth == 0:
+                self._ensure_directory_exists()
+                self._lock_file = open(self.lock_path, 'a+')
+                _lock_file(self._lock_file)
+            self._depth += 1
+            try:
+                yield
+            finally:
+                self._depth -= 1
+                if self._depth == 0:
+                    _unlock_file(self._lock_file)
+                    self._lock_file.close()
+                    self._lock_file = None
+
+    def _ensure_directory_exists(self):
+        directory = os.path.dirname(self.path)
+        if not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+
+
+def _lock_file(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        return
+    # msvcrt only waits about 10 seconds per attempt
+    while True:
+        try:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            time.sleep(0.05)
+
+
+def _unlock_file(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        return
+    f.seek(0)
+    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
@@ -0,0 +1,68 @@
+# transport.py
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+
+
+class Transport:
+    """
+    Pooled HTTP transport that every module sends its requests through, via the
+    auth client.
+
+    One `requests.Session` keeps connections open (keep-alive) and reuses them across
+    calls and modules. Each host gets its own pool of `pool_maxsize` connections.
+    `host_pool_sizes` overrides the size per host, e.g.
+    {'api.telematicssdk.com': 32, 'leaderboard.telematicssdk.com': 4}. With `pool_block`,
+    threads wait for a free connection instead of opening one that is not kept.
+    With `compress`, responses are requested gzip/deflate-compressed (and brotli/zstd
+    when their decoders are installed). `timeout` is the (connect, read) timeout in
+    seconds for requests that do not pass their own. `stats()` shows per host how
+    many requests reused an open connection.
+    """
+
+    # Hosts whose pools are kept per adapter; beyond this the least recently used pool is closed
+    MAX_HOSTS = 16
+
+    def __init__(self, pool_maxsize=10, host_pool_sizes=None, pool_block=False, compress=True, timeout=(5, 60)):
+        self.pool_maxsize = pool_maxsize
+        self.host_pool_sizes = dict(host_pool_sizes or {})
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        self.session.headers['Connection'] = 'keep-alive'
+        self.session.headers['Accept-Encoding'] = ACCEPT_ENCODING if compress else 'identity'
+
+        self._adapters = []
+        self._mount(('https://', 'http://'), pool_maxsize, pool_block)
+        for host, size in self.host_pool_sizes.items():
+            # Longer prefixes win, so these take precedence over the default adapter
+            self._mount((f'https://{host}/', f'http://{host}/'), size, pool_block)
+
+    def _mount(self, prefixes, pool_maxsize, pool_block):
+        adapter = HTTPAdapter(pool_connections=self.MAX_HOSTS, pool_maxsize=pool_maxsize, pool_block=pool_block)
+        for prefix in prefixes:
+            self.session.mount(prefix, adapter)
+        self._adapters.append(adapter)
+
+    def request(self, method, url, timeout=None, **kwargs):
+        return self.session.request(method, url, timeout=timeout if timeout is not None else self.timeout, **kwargs)
+
+    def stats(self):
+        """Per host: requests sent, connections opened, and how many requests reused a connection."""
+        hosts = {}
+        for adapter in self._adapters:
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                entry = hosts.setdefault(pool.host, {'requests': 0, 'connections': 0})
+                entry['requests'] += pool.num_requests
+                entry['connections'] += pool.num_connections
+        for entry in hosts.values():
+            entry['reused'] = max(0, entry['requests'] - entry['connections'])
+            entry['reuse_rate'] = entry['reused'] / entry['requests'] if entry['requests'] else 0.0
+        return hosts
+
+    def close(self):
+        self.session.close()
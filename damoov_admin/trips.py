@@ -1,27 +1,22 @@
 # trips.py
 
 import requests
+import threading
 from datetime import datetime, timedelta
+from functools import cached_property
 
 from .auth import TelematicsAuth
 from .core import TelematicsCore
-from .utility import handle_response, adjust_date_range
-from sentry_sdk import capture_exception
-import sentry_sdk
+from .utility import handle_response, split_date_range, is_error_data
+from .bulk import BulkResult, iter_bulk, in_bulk_worker, read_ahead_iter
+from .deadline import Deadline
+from .codec import decode
+from .models import Trip
+from .waypoints import Waypoints
 import json
 from requests.exceptions import HTTPError
 
 
-sentry_sdk.init(
-    dsn="https://c75b486e9aac4eea913b9ac998e21b53@o303533.ingest.sentry.io/4505555960004609",
-
-    # Set traces_sample_rate to 1.0 to capture 100%
-    # of transactions for performance monitoring.
-    # We recommend adjusting this value in production.
-    traces_sample_rate=1.0,
-)
-
-
 class BaseTrips:
     BASE_URL = "https://api.telematicssdk.com/trips/get/admin/v1"
 
@@ -34,12 +29,24 @@ class BaseTrips:
             'authorization': f'Bearer {self.auth_client.get_access_token()}'
         }
 
+    def _post_trip(self, url, payload, deadline=None, compact_waypoints=False):
+        try:
+            response = self.auth_client.post_with_retry(url, headers=self._get_headers(), json=payload, cacheable=True, deadline=deadline)
+            data = handle_response(response)
+            if data is not None:
+                return TripsResponse(data, compact_waypoints)
+            return None
+        except HTTPError as http_err:
+            print(f'HTTP error occurred: {http_err}')  # Or handle it in some other way
+            e_response = handle_response(response, TripsResponse) # Pass EngagementResponse as an argument
+            return e_response
+
 
 class TripsModule:
     def __init__(self, core: TelematicsCore):
         self.core = core  # Ensuring naming consistency
 
-    @property
+    @cached_property
     def trips(self):
         return Trips(self.core.auth_client)
 
@@ -55,17 +62,72 @@ class Trips(BaseTrips):
                         tags_excluded=None, tags_excluded_operator=None, 
                         locale="EN", unit_system="Si", 
                         vehicles=None, sort_by="StartDateUtc_Desc", 
-                        limit=None):
+                        limit=None, page_concurrency=None, deadline=None, lazy=False):
         """
         Retrieves trip details for a specific user.
+
+        Without `limit`, every page is fetched. With `page_concurrency=N` (N > 1), the
+        page count is read from the first page's PagingInfo and the remaining pages are
+        fetched N at a time, then reassembled in sort order. `deadline` (seconds) bounds
+        the whole call, every page, retry and token refresh included; running out raises
+        `DeadlineExceeded`.
+
+        With `lazy=True`, the trips in the response are `LazyTrip` handles: reading their
+        `events`, `waypoints`, `scores`, `statistics` or `details` fetches (and keeps)
+        the trip's details on first access. Use `prefetch()` to fetch them for many
+        trips at once.
         
         :return: Trip details in JSON format.
         """
-        
-        # Validate the unit_system input
-        if unit_system not in ["Si", "Imperial"]:
-            print("[NOTIFICATION] Invalid unit_system provided. Please choose either 'Si' or 'Imperial'. Defaulting to 'Si'.")
-            unit_system = "Si"  # defaulting to Si
+        url, payloads = self._build_list_payloads(
+            user_id, start_date, end_date, start_date_timestamp_sec, end_date_timestamp_sec,
+            include_details, include_statistics, include_scores, include_related,
+            tags_included, tags_included_operator, tags_excluded, tags_excluded_operator,
+            locale, unit_system, vehicles, sort_by)
+
+        deadline = Deadline.of(deadline)
+        if len(payloads) == 1:
+            response = self._fetch_trip_details(url, payloads[0], limit, page_concurrency, deadline)
+        else:
+            response = self._fetch_trip_windows(url, payloads, limit, page_concurrency, deadline)
+        if not lazy:
+            return response
+        loaded = _listed_parts(include_details, include_statistics, include_scores)
+        return _make_lazy(response, LazyTrip, self, user_id, loaded, payloads[0]["Locale"], payloads[0]["UnitSystem"])
+
+    def iter_trips(self, user_id, 
+                   start_date=None, end_date=None, 
+                   start_date_timestamp_sec=None, end_date_timestamp_sec=None,
+                   include_details=False, include_statistics=False, 
+                   include_scores=False, include_related=False, 
+                   tags_included=None, tags_included_operator=None,
+                   tags_excluded=None, tags_excluded_operator=None, 
+                   locale="EN", unit_system="Si", 
+                   vehicles=None, sort_by="StartDateUtc_Desc", 
+                   page_size=50, read_ahead=0, deadline=None):
+        """
+        Streams a user's trips one at a time, fetching `page_size` trips per request.
+
+        Accepts the same filters as `get_list_trips`, but only the current page is held
+        in memory. With `read_ahead=N`, up to N further pages are fetched in the background
+        while the caller processes the current one. A failed page raises `HTTPError`.
+        `deadline` (seconds) bounds fetching all pages, counted from this call.
+
+        :return: Iterator of trip dicts.
+        """
+        url, payloads = self._build_list_payloads(
+            user_id, start_date, end_date, start_date_timestamp_sec, end_date_timestamp_sec,
+            include_details, include_statistics, include_scores, include_related,
+            tags_included, tags_included_operator, tags_excluded, tags_excluded_operator,
+            locale, unit_system, vehicles, sort_by)
+        return self._iter_trips(url, payloads, page_size, read_ahead, Deadline.of(deadline))
+
+    def _build_list_payloads(self, user_id, start_date, end_date, start_date_timestamp_sec, end_date_timestamp_sec,
+                             include_details, include_statistics, include_scores, include_related,
+                             tags_included, tags_included_operator, tags_excluded, tags_excluded_operator,
+                             locale, unit_system, vehicles, sort_by):
+        """Builds the list-trips request body, one per date window of at most 14 days."""
+        unit_system = _check_unit_system(unit_system)
             
         url = f"{self.BASE_URL}"
         
@@ -81,17 +143,6 @@ class Trips(BaseTrips):
             "UnitSystem": unit_system
         }
 
-        # Using a separate method to adjust the date range
-        adjusted_values = adjust_date_range(start_date, end_date, start_date_timestamp_sec, end_date_timestamp_sec)
-        start_date, end_date, start_date_timestamp_sec, end_date_timestamp_sec = adjusted_values
-
-        if start_date and end_date:
-            payload["StartDate"] = start_date
-            payload["EndDate"] = end_date
-        elif start_date_timestamp_sec and end_date_timestamp_sec:
-            payload["StartDateTimestampSec"] = start_date_timestamp_sec
-            payload["EndDateTimestampSec"] = end_date_timestamp_sec
-
         # Ensure tags_included is a list
         if tags_included is not None and not isinstance(tags_included, list):
             tags_included = [tags_included]
@@ -108,23 +159,45 @@ class Trips(BaseTrips):
         self._add_to_payload_if_exists(payload, "Vehicles", vehicles)
         self._add_to_payload_if_exists(payload, "SortBy", sort_by)
 
-        return self._fetch_trip_details(url, payload, limit)
+        # Ranges longer than 14 days are split into windows
+        windows = split_date_range(start_date, end_date, start_date_timestamp_sec, end_date_timestamp_sec)
+        payloads = []
+        for start_date, end_date, start_date_timestamp_sec, end_date_timestamp_sec in windows:
+            window_payload = dict(payload)
+            if start_date and end_date:
+                window_payload["StartDate"] = start_date
+                window_payload["EndDate"] = end_date
+            elif start_date_timestamp_sec and end_date_timestamp_sec:
+                window_payload["StartDateTimestampSec"] = start_date_timestamp_sec
+                window_payload["EndDateTimestampSec"] = end_date_timestamp_sec
+            payloads.append(window_payload)
+
+        # Newest window first when sorting descending, so the merged list stays in order
+        if sort_by and sort_by.endswith("_Desc"):
+            payloads.reverse()
+        return url, payloads
     
     def get_trip_details(self, trip_id, user_id, 
                        include_details=False, include_statistics=False, 
                        include_scores=False, include_waypoints=False,
                        include_events=False, include_related=True, 
-                       locale="EN", unit_system="Si"):
+                       locale="EN", unit_system="Si", deadline=None, compact_waypoints=False):
         """
         Retrieves specific trip details by its ID.
+
+        With `compact_waypoints=True` the waypoint dicts in the response data are
+        replaced by the compact `Waypoints` columns so they can be freed early.
         
         :return: Trip details in JSON format.
         """
-        
-        # Validate the unit_system input
-        if unit_system not in ["Si", "Imperial"]:
-            print("[NOTIFICATION] Invalid unit_system provided. Please choose either 'Si' or 'Imperial'. Defaulting to 'Si'.")
-            unit_system = "Si"  # defaulting to Si
+        url, payload = self._build_details_payload(trip_id, user_id, include_details, include_statistics, include_scores,
+                                                   include_waypoints, include_events, include_related, locale, unit_system)
+        return self._post_trip(url, payload, Deadline.of(deadline), compact_waypoints)
+
+    def _build_details_payload(self, trip_id, user_id, include_details, include_statistics, include_scores,
+                               include_waypoints, include_events, include_related, locale, unit_system):
+        """Builds the URL and request body of a trip details request."""
+        unit_system = _check_unit_system(unit_system)
             
         url = f"{self.BASE_URL}/{trip_id}"
         
@@ -141,27 +214,82 @@ class Trips(BaseTrips):
             "Locale": locale,
             "UnitSystem": unit_system
         }
-        try:
-            response = self.auth_client.post_with_retry(url, headers=self._get_headers(), json=payload)
-            data = handle_response(response)
-            if data is not None:
-                return TripsResponse(data)
-            return None
-        except HTTPError as http_err:
-            print(f'HTTP error occurred: {http_err}')  # Or handle it in some other way
-            e_response = handle_response(response, TripsResponse) # Pass EngagementResponse as an argument
-            return e_response    
+        return url, payload
+
+    def get_trip_details_many(self, trip_ids, user_id,
+                              include_details=False, include_statistics=False,
+                              include_scores=False, include_waypoints=False,
+                              include_events=False, include_related=True,
+                              locale="EN", unit_system="Si", max_workers=None, deadline=None,
+                              compact_waypoints=False):
+        """
+        Fetches the details of many trips of one user concurrently.
+
+        Duplicate trip_ids are fetched once. At most `max_workers` requests run at a
+        time (defaults to the auth client's `pool_maxsize`). A `BulkResult` is yielded
+        per trip as soon as its details arrive, with the trip_id as `key` and the
+        `TripsResponse` as `response`. A trip that failed has `error` set, either to
+        the exception raised or to a `TripDetailsError` when the API answered with an
+        error body; the other trips are unaffected. `deadline` (seconds) bounds the
+        whole batch. `compact_waypoints` is passed to each `get_trip_details` call.
+
+        :return: Iterator of `BulkResult`.
+        """
+        unit_system = _check_unit_system(unit_system)
+        deadline = Deadline.of(deadline)
+
+        def fetch(trip_id):
+            return self.get_trip_details(trip_id, user_id, include_details, include_statistics, include_scores,
+                                         include_waypoints, include_events, include_related, locale, unit_system,
+                                         deadline=deadline, compact_waypoints=compact_waypoints)
+
+        return self._iter_trip_details(fetch, trip_ids, max_workers)
+
+    def _iter_trip_details(self, fetch, trip_ids, max_workers=None):
+        max_workers = max_workers or self.auth_client.pool_maxsize
+        for result in iter_bulk(fetch, trip_ids, max_workers):
+            yield _check_trip_details(result)
+
+    def prefetch(self, trips, *parts, max_workers=None, deadline=None, compact_waypoints=False):
+        """
+        Fetches the details of many `LazyTrip` handles at once, e.g.
+        `trips_client.prefetch(response.trips[:20], 'scores', 'events')`.
+
+        `parts` are any of 'details', 'statistics', 'scores', 'events' and 'waypoints'
+        (all of them by default); handles that already hold them are skipped. Requests
+        run concurrently as in `get_trip_details_many`. With `compact_waypoints=True`
+        the handles keep the compact `Waypoints` columns instead of the waypoint dicts.
 
-    def _fetch_trip_details(self, url, payload, limit=None):
+        :return: List of `BulkResult` for the trips that failed (empty if none did).
+        """
+        return self._prefetch(_prefetch_groups(trips, parts), max_workers, Deadline.of(deadline), compact_waypoints)
+
+    def _prefetch(self, groups, max_workers=None, deadline=None, compact_waypoints=False):
+        failed = []
+        for (user_id, locale, unit_system, parts), handles in groups.items():
+            for result in self.get_trip_details_many(list(handles), user_id, locale=locale, unit_system=unit_system,
+                                                     max_workers=max_workers, deadline=deadline,
+                                                     compact_waypoints=compact_waypoints, **_include_flags(parts)):
+                if result.ok:
+                    for handle in handles[result.key]:
+                        handle._apply(result.response, parts)
+                else:
+                    failed.append(result)
+        return failed
+
+    def _fetch_trip_details(self, url, payload, limit=None, page_concurrency=None, deadline=None):
         try:
             if limit:
                 payload["Paging"] = {"Count": limit, "IncludePagingInfo": False}
-                response = self.auth_client.post_with_retry(url, headers=self._get_headers(), json=payload)
+                response = self.auth_client.post_with_retry(url, headers=self._get_headers(), json=payload, cacheable=True, deadline=deadline)
                 data = handle_response(response)
                 if data is not None:
                     return TripsResponse(data)
                 return None
 
+            if page_concurrency and page_concurrency > 1:
+                return self._fetch_pages_concurrently(url, payload, page_concurrency, deadline=deadline)
+
             # Handle pagination if limit is not set
             payload["Paging"] = {"Count": 50, "IncludePagingInfo": True}
             all_trips = []
@@ -169,9 +297,9 @@ class Trips(BaseTrips):
 
             while True:
                 payload["Paging"]["Page"] = current_page
-                response = self.auth_client.post_with_retry(url, headers=self._get_headers(), json=payload)
+                response = self.auth_client.post_with_retry(url, headers=self._get_headers(), json=payload, cacheable=True, deadline=deadline)
                 response.raise_for_status()  # Will raise an error for 4xx and 5xx responses.
-                trips_response = TripsResponse(response.json())
+                trips_response = TripsResponse(decode(response))
 
                 all_trips.extend(trips_response.trips)
 
@@ -191,13 +319,328 @@ class Trips(BaseTrips):
 
         
 
+    def _fetch_pages_concurrently(self, url, payload, page_concurrency, page_size=50, deadline=None):
+        try:
+            first_page = self._fetch_trip_page(url, payload, 1, page_size, deadline)
+            total_pages = _total_pages(first_page.paging_info, page_size)
+            if total_pages is None:
+                # Page count not reported; walk the remaining pages one by one
+                pages = [first_page]
+                if len(first_page.trips) == page_size and first_page.paging_info.get('HasNextPage'):
+                    pages.extend(page for page in self._iter_pages(url, [payload], page_size, first_page=2, deadline=deadline) if page is not None)
+            else:
+                def fetch(page):
+                    return self._fetch_trip_page(url, payload, page, page_size, deadline)
+
+                pages = [first_page]
+                if in_bulk_worker():
+                    # Already on a pool thread; fetch the pages here rather than nesting a pool
+                    pages.extend(fetch(page) for page in range(2, total_pages + 1))
+                else:
+                    results = {result.key: result for result in iter_bulk(fetch, range(2, total_pages + 1), page_concurrency)}
+                    for page in range(2, total_pages + 1):
+                        if not results[page].ok:
+                            raise results[page].error
+                        pages.append(results[page].response)
+
+            return _join_pages(pages)
+
+        except HTTPError as http_err:
+            print(f'HTTP error occurred: {http_err}')  # Or handle it in some other way
+            e_response = handle_response(http_err.response, TripsResponse)
+            return e_response
+
+    def _fetch_trip_page(self, url, payload, page, page_size, deadline=None):
+        payload = dict(payload)
+        payload["Paging"] = {"Count": page_size, "IncludePagingInfo": True, "Page": page}
+        response = self.auth_client.post_with_retry(url, headers=self._get_headers(), json=payload, cacheable=True, deadline=deadline)
+        response.raise_for_status()
+        return TripsResponse(decode(response))
+
+    def _iter_pages(self, url, payloads, page_size, first_page=1, deadline=None):
+        for payload in payloads:
+            page = first_page
+            while True:
+                trips_response = self._fetch_trip_page(url, payload, page, page_size, deadline)
+                yield trips_response
+
+                if len(trips_response.trips) < page_size or not trips_response.paging_info.get('HasNextPage'):
+                    break
+                page += 1
+            # Marks the end of a date window
+            yield None
+
+    def _iter_trips(self, url, payloads, page_size, read_ahead, deadline=None):
+        pages = self._iter_pages(url, payloads, page_size, deadline=deadline)
+        if read_ahead:
+            pages = read_ahead_iter(pages, read_ahead)
+
+        boundary_filter = _WindowBoundaryFilter(enabled=len(payloads) > 1)
+        for trips_response in pages:
+            yield from boundary_filter.filter(trips_response)
+
+    def _fetch_trip_windows(self, url, payloads, limit=None, page_concurrency=None, deadline=None):
+        def fetch(i):
+            return self._fetch_trip_details(url, payloads[i], limit, page_concurrency, deadline)
+
+        if in_bulk_worker():
+            return TripsResponse.merge([fetch(i) for i in range(len(payloads))], limit)
+        max_workers = min(len(payloads), self.auth_client.pool_maxsize)
+        results = {result.key: result for result in iter_bulk(fetch, range(len(payloads)), max_workers)}
+        for i in range(len(payloads)):
+            if not results[i].ok:
+                raise results[i].error
+        return TripsResponse.merge([results[i].response for i in range(len(payloads))], limit)
+
     def _add_to_payload_if_exists(self, payload, key, value):
         if value:
             payload[key] = value
 
+def _check_unit_system(unit_system):
+    # Validate the unit_system input
+    if unit_system not in ["Si", "Imperial"]:
+        print("[NOTIFICATION] Invalid unit_system provided. Please choose either 'Si' or 'Imperial'. Defaulting to 'Si'.")
+        return "Si"  # defaulting to Si
+    return unit_system
+
+
+def _listed_parts(include_details, include_statistics, include_scores):
+    # Parts the listing already carries need no follow-up request
+    return [part for part, included in (('details', include_details), ('statistics', include_statistics),
+                                        ('scores', include_scores)) if included]
+
+
+def _check_trip_details(result):
+    # get_trip_details returns error bodies instead of raising; report them as failures
+    if result.ok and (result.response is None or is_error_data(result.response.data)):
+        data = getattr(result.response, 'data', None)
+        return BulkResult(result.key, response=result.response,
+                          error=TripDetailsError(f"Trip details failed for {result.key}: {data}"))
+    return result
+
+
+class TripDetailsError(Exception):
+    pass
+
+
+# Lazily fetched parts of a trip and the key each one is stored under
+_LAZY_PARTS = {
+    'details': 'Data',
+    'statistics': 'Statistics',
+    'scores': 'Scores',
+    'events': 'Events',
+    'waypoints': 'Waypoints',
+}
+
+
+class LazyTrip(dict):
+    """
+    A listed trip whose details are fetched from `get_trip_details` the first time
+    they are read, then kept.
+
+    It is the trip dict from the listing (`trip['Id']`, `trip.get('Data')`, `json.dumps`),
+    with fetched parts merged in. The `details`, `statistics`, `scores`, `events` and
+    `waypoints` properties fetch what is missing; each part is only requested once.
+    `hydrate(*parts)` fetches parts up front. A failed fetch raises `TripDetailsError`.
+    """
+
+    def __init__(self, summary, trips, user_id, loaded=(), locale="EN", unit_system="Si"):
+        super().__init__(summary)
+        self.summary = summary
+        self.user_id = user_id
+        self.locale = locale
+        self.unit_system = unit_system
+        self._trips = trips
+        self._loaded = set(loaded)
+        self._lock = threading.Lock()
+        self._waypoints = None
+
+    def __repr__(self):
+        return f"LazyTrip({self.id!r}, loaded={sorted(self._loaded)})"
+
+    @property
+    def id(self):
+        return self.summary.get('Id')
+
+    def is_loaded(self, part):
+        return part in self._loaded
+
+    @property
+    def details(self):
+        return self._part('details', {})
+
+    @property
+    def statistics(self):
+        return self._part('statistics', {})
+
+    @property
+    def scores(self):
+        return self._part('scores', {})
+
+    @property
+    def events(self):
+        events = self._part('events', [])
+        return events if isinstance(events, list) else []
+
+    @property
+    def waypoints(self):
+        waypoints = self._part('waypoints', None)
+        if self._waypoints is None:
+            self._waypoints = _compact_waypoints(waypoints)
+        return self._waypoints
+
+    def _part(self, part, default):
+        if part not in self._loaded:
+            self.hydrate(part)
+        value = self.get(_LAZY_PARTS[part])
+        return default if value is None else value
+
+    def _missing(self, parts):
+        return tuple(part for part in (parts or _LAZY_PARTS) if part not in self._loaded)
+
+    def hydrate(self, *parts, compact_waypoints=False):
+        """
+        Fetches the given parts (all of them by default) unless they are already loaded.
+        With `compact_waypoints=True` the handle keeps the waypoints as `Waypoints` columns.
+        """
+        with self._lock:
+            missing = self._missing(parts)
+            if missing:
+                response = self._trips.get_trip_details(self.id, self.user_id, locale=self.locale,
+                                                        unit_system=self.unit_system,
+                                                        compact_waypoints=compact_waypoints, **_include_flags(missing))
+                self._apply(response, missing)
+        return self
+
+    def _apply(self, response, parts):
+        if response is None or is_error_data(response.data):
+            raise TripDetailsError(f"Trip details failed for {self.id}: {getattr(response, 'data', response)}")
+        self.update(response._trip)
+        if 'waypoints' in parts:
+            self._waypoints = None
+        self._loaded.update(parts)
+
+
+def _include_flags(parts):
+    return {f'include_{part}': part in parts for part in _LAZY_PARTS}
+
+
+def _prefetch_groups(trips, parts):
+    # One batch per user, locale, unit system and set of missing parts; handles are grouped by trip id
+    groups = {}
+    for trip in trips:
+        if not isinstance(trip, LazyTrip):
+            continue
+        missing = trip._missing(parts)
+        if missing:
+            key = (trip.user_id, trip.locale, trip.unit_system, missing)
+            groups.setdefault(key, {}).setdefault(trip.id, []).append(trip)
+    return groups
+
+
+def _make_lazy(response, trip_class, trips, user_id, loaded, locale, unit_system):
+    if response is None or is_error_data(response.data):
+        return response
+    listed = response.result.get('Trips')
+    if isinstance(listed, list):
+        response.result['Trips'] = [trip_class(trip, trips, user_id, loaded, locale, unit_system)
+                                    for trip in listed if isinstance(trip, dict)]
+    return response
+
+
+def _total_pages(paging_info, page_size):
+    """Page count from a PagingInfo block, or None if it reports neither pages nor a total."""
+    if not paging_info.get('HasNextPage', True):
+        return 1
+    if paging_info.get('TotalPages'):
+        return int(paging_info['TotalPages'])
+    if paging_info.get('TotalCount') is not None:
+        return max(1, -(-int(paging_info['TotalCount']) // page_size))
+    return None
+
+def _join_pages(pages):
+    """Concatenates the trips of consecutive pages into the first page's response."""
+    all_trips = []
+    for page in pages:
+        all_trips.extend(page.trips)
+
+    trips_response = pages[0]
+    trips_response.data['Result']['Trips'] = all_trips
+    trips_response.data['Result']['PagingInfo'] = pages[-1].paging_info
+    return trips_response
+
+class _WindowBoundaryFilter:
+    """
+    Drops trips repeated where two date windows meet while streaming pages. Only trips
+    on the shared boundary day can repeat, so the previous window's ids are all it keeps.
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.previous_ids = set()
+        self.current_ids = set()
+
+    def filter(self, trips_response):
+        # None marks the end of a date window
+        if trips_response is None:
+            self.previous_ids, self.current_ids = self.current_ids, set()
+            return []
+        if not self.enabled:
+            return trips_response.trips
+
+        trips = []
+        for trip in trips_response.trips:
+            trip_id = trip.get('Id') if isinstance(trip, dict) else None
+            if trip_id is not None:
+                if trip_id in self.current_ids:
+                    continue
+                self.current_ids.add(trip_id)
+                if trip_id in self.previous_ids:
+                    continue
+            trips.append(trip)
+        return trips
+
 class TripsResponse:
-    def __init__(self, data):
+    def __init__(self, data, compact_waypoints=False):
         self.data = data if isinstance(data, dict) else {}
+        if compact_waypoints:
+            # Opt-in: swap the waypoint dicts in `data` for the compact columns so the dicts can be freed
+            waypoints = self.waypoints
+            if waypoints:
+                self._trip['Waypoints'] = waypoints
+
+    @classmethod
+    def merge(cls, responses, limit=None):
+        """
+        Concatenates the trip lists of consecutive date windows, in the given order,
+        dropping trips repeated where windows meet and keeping at most `limit` trips.
+        If any window failed, its response is returned as is.
+        """
+        for response in responses:
+            if response is None or is_error_data(response.data):
+                return response
+
+        trips = []
+        seen = set()
+        for response in responses:
+            for trip in response.trips:
+                trip_id = trip.get('Id') if isinstance(trip, dict) else None
+                if trip_id is not None:
+                    if trip_id in seen:
+                        continue
+                    seen.add(trip_id)
+                trips.append(trip)
+
+        if limit:
+            trips = trips[:limit]
+
+        data = dict(responses[0].data)
+        result = dict(responses[0].result)
+        result['Trips'] = trips
+        # Paging info described a single window's pages
+        result.pop('PagingInfo', None)
+        data['Result'] = result
+        return cls(data)
 
     @property
     def result(self):
@@ -210,16 +653,20 @@ class TripsResponse:
         trips = self.result.get('Trips', [])
         return trips if isinstance(trips, list) else []
 
+    @cached_property
+    def _trip(self):
+        # Looked up once; the properties below all read from the detailed trip
+        trip = self.result.get('Trip', {})
+        return trip if isinstance(trip, dict) else {}
+
     @property
     def statistics(self):
-        # Similar safeguard as in 'trips'
-        trip = self.result.get('Trip', {})
-        return trip.get('Statistics', {}) if isinstance(trip, dict) else {}
+        return self._trip.get('Statistics', {})
 
     @property
     def details(self):
         # Since 'Data' is nested within 'Trip', the same pattern applies here
-        return self.result.get('Trip', {}).get('Data', {})
+        return self._trip.get('Data', {})
 
     @property
     def transporttype(self):
@@ -229,19 +676,33 @@ class TripsResponse:
     @property
     def scores(self):
         # Assuming 'Scores' is always a dictionary or should be an empty one if not present
-        return self.result.get('Trip', {}).get('Scores', {})
+        return self._trip.get('Scores', {})
 
     @property
     def events(self):
         # Assuming 'Events' is always a list or should be an empty one if not present
-        events = self.result.get('Trip', {}).get('Events', [])
+        events = self._trip.get('Events', [])
         return events if isinstance(events, list) else []
 
-    @property
+    @cached_property
     def waypoints(self):
-        # Assuming 'Waypoints' is always a list or should be an empty one if not present
-        waypoints = self.result.get('Trip', {}).get('Waypoints', [])
-        return waypoints if isinstance(waypoints, list) else []
+        """The trip's waypoints as a compact `Waypoints` container (behaves like a list of dicts), built on first access."""
+        return _compact_waypoints(self._trip.get('Waypoints'))
+
+    @cached_property
+    def trip_model(self):
+        """The detailed trip as a typed `Trip` model (built from `data` on first access), or None if there is none."""
+        if not self._trip:
+            return None
+        model = Trip.from_dict(self._trip)
+        if self._trip.get('Waypoints') is not None:
+            model.waypoints = self.waypoints
+        return model
+
+    @cached_property
+    def trip_models(self):
+        """The listed trips as typed `Trip` models, built from `trips` on first access."""
+        return Trip.from_list(self.trips)
 
     @property
     def paging_info(self):
@@ -269,8 +730,21 @@ class TripsResponse:
         return self.data
 
     def __str__(self):
-        return json.dumps(self.data, indent=4)
+        return json.dumps(self.data, indent=4, default=_to_json)
+
+
+def _compact_waypoints(waypoints):
+    if isinstance(waypoints, Waypoints):
+        return waypoints
+    if isinstance(waypoints, list):
+        return Waypoints.from_dicts([point for point in waypoints if isinstance(point, dict)])
+    return Waypoints.from_dicts([])
+
 
+def _to_json(value):
+    if isinstance(value, Waypoints):
+        return value.to_list()
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
 
 
     # Add at the bottom of statistics.py
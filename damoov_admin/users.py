@@ -1,10 +1,12 @@
 # users.py
 import requests
 from datetime import datetime, timedelta
+from functools import cached_property
 
 from .auth import TelematicsAuth
 from .core import TelematicsCore
 from .utility import handle_response
+from .codec import decode
 import json
 from requests.exceptions import HTTPError
 
@@ -26,7 +28,7 @@ class UsersModule:
     def __init__(self, core: TelematicsCore):
         self.core = core  # Renamed self.code to self.core for clarity
         
-    @property
+    @cached_property
     def Users(self):
         return Users(self.core.auth_client)
 
@@ -42,7 +44,8 @@ class Users(BaseUsers):
                     Phone=None,
                     Email=None,
                     ClientId=None,
-                    CreateAccessToken= False
+                    CreateAccessToken= False,
+                    deadline=None
                     ):
         
         # Parameter validation
@@ -57,23 +60,12 @@ class Users(BaseUsers):
             'content-type': 'application/json'
         }
         
-        payload={}
+        payload = self._build_user_payload(ClientId, FirstName, LastName, Nickname, Phone, Email)
         payload["CreateAccessToken"] = CreateAccessToken
         
-        if ClientId:
-            payload["UserFields"] = {"ClientId": ClientId}
-            
-            
-        self._add_to_payload_if_exists(payload, "FirstName", FirstName)
-        self._add_to_payload_if_exists(payload, "LastName", LastName)
-        self._add_to_payload_if_exists(payload, "Nickname", Nickname)
-        self._add_to_payload_if_exists(payload, "Phone", Phone)
-        self._add_to_payload_if_exists(payload, "Email", Email)
-
-        
         url = f"{self.BASE_URL}/registration/create"
         try:
-            response = self.auth_client.post_with_retry(url, headers=headers, data=json.dumps(payload))
+            response = self.auth_client.post_with_retry(url, headers=headers, data=json.dumps(payload), deadline=deadline)
             
             processed_response = handle_response(response)
             return UsersResponse(processed_response)
@@ -90,7 +82,8 @@ class Users(BaseUsers):
                     LastName=None,
                     Nickname=None,
                     Phone=None,
-                    Email=None
+                    Email=None,
+                    deadline=None
                     ):
         
         headers = {
@@ -100,20 +93,11 @@ class Users(BaseUsers):
             'content-type': 'application/json'
         }
 
-        payload = {}
-
-        if ClientId:
-            payload["UserFields"] = {"ClientId": ClientId}
-
-        self._add_to_payload_if_exists(payload, "FirstName", FirstName)
-        self._add_to_payload_if_exists(payload, "LastName", LastName)
-        self._add_to_payload_if_exists(payload, "Nickname", Nickname)
-        self._add_to_payload_if_exists(payload, "Phone", Phone)
-        self._add_to_payload_if_exists(payload, "Email", Email)
+        payload = self._build_user_payload(ClientId, FirstName, LastName, Nickname, Phone, Email)
 
         url = f"{self.BASE_URL}/Management/users"
         try:
-            response = self.auth_client.put_with_retry(url, headers=headers, data=json.dumps(payload))
+            response = self.auth_client.put_with_retry(url, headers=headers, data=json.dumps(payload), deadline=deadline)
             processed_response = handle_response(response)
             return UsersResponse(response)
         except HTTPError as http_err:
@@ -121,7 +105,7 @@ class Users(BaseUsers):
             handle_response(response)
             return response
 
-    def delete_user(self, userid):
+    def delete_user(self, userid, deadline=None):
         headers = {
             'accept': 'application/json',
             'Authorization': f'Bearer {self.auth_client.get_access_token()}'
@@ -129,7 +113,7 @@ class Users(BaseUsers):
         
         url = f"{self.BASE_URL}/Management/users/{userid}"
         try:
-            response = self.auth_client.delete_with_retry(url, headers=headers)
+            response = self.auth_client.delete_with_retry(url, headers=headers, deadline=deadline)
             return UsersResponse(response)
         except HTTPError as http_err:
             print(f'HTTP error occurred: {http_err}')  # Or handle it in some other way
@@ -137,6 +121,19 @@ class Users(BaseUsers):
             return response
         
 
+    def _build_user_payload(self, ClientId, FirstName, LastName, Nickname, Phone, Email):
+        payload = {}
+
+        if ClientId:
+            payload["UserFields"] = {"ClientId": ClientId}
+
+        self._add_to_payload_if_exists(payload, "FirstName", FirstName)
+        self._add_to_payload_if_exists(payload, "LastName", LastName)
+        self._add_to_payload_if_exists(payload, "Nickname", Nickname)
+        self._add_to_payload_if_exists(payload, "Phone", Phone)
+        self._add_to_payload_if_exists(payload, "Email", Email)
+        return payload
+
     def _add_to_payload_if_exists(self, payload, key, value):
         if value:
             payload[key] = value
@@ -152,7 +149,7 @@ class UsersResponse:
         # If it's something else (like a response object), try to parse its JSON content
         else:
             try:
-                self.data = input_data.json()
+                self.data = decode(input_data)
             except (ValueError, AttributeError):
                 self.data = {}  # Handle cases where the response isn't JSON or input_data has no json() method
 
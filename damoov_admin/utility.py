@@ -6,6 +6,7 @@ import datetime
 
 from functools import wraps
 from requests.exceptions import HTTPError
+from .codec import decode
 
 def handle_response(response, response_class=dict):
     if not response:
@@ -13,7 +14,7 @@ def handle_response(response, response_class=dict):
         
     if response.status_code == 200:
         # If it's a 200 OK response
-        data = response.json()
+        data = decode(response)
         return data
     elif response.status_code == 204:
         print("No content received from server. Please check your input.")
@@ -50,6 +51,13 @@ def handle_response(response, response_class=dict):
             "Status": "Error",
             "Title": "Bad Request"
         })
+    elif response.status_code == 429:
+        print("Too many requests. The API is still throttling after retrying; lower the request rate.")
+        return response_class({
+            "Result": [],
+            "Status": "Error",
+            "Title": "Too Many Requests"
+        })
     elif response.status_code == 500:
         print("Internal server error. Please try again later.")
         return response_class({
@@ -107,4 +115,58 @@ def adjust_date_range(start_date=None, end_date=None, start_timestamp=None, end_
         return None, None, adjusted_start_timestamp, adjusted_end_timestamp
 
     # Handle case where neither date nor timestamp ranges are provided
-    return None, None, None, None
\ No newline at end of file
+    return None, None, None, None
+
+
+def _parse_date(value):
+    try:
+        return datetime.datetime.strptime(value, '%Y-%m-%d')
+    except ValueError:
+        return datetime.datetime.strptime(value, '%Y-%m-%dT%H:%M:%S')
+
+
+def split_date_range(start_date=None, end_date=None, start_timestamp=None, end_timestamp=None, max_days=14):
+    """
+    Splits a date range into consecutive windows of at most `max_days` days.
+
+    Returns a list of (start_date, end_date, start_timestamp, end_timestamp) tuples in
+    the same shape as `adjust_date_range`. Each window starts where the previous one
+    ends, so no day is lost whether the API treats the end date as inclusive or not;
+    callers drop the records repeated at the boundaries when merging.
+    """
+    if start_date and end_date:
+        dt_start = _parse_date(start_date)
+        dt_end = _parse_date(end_date)
+        step = datetime.timedelta(days=max_days)
+
+        windows = []
+        window_start = dt_start
+        while True:
+            window_end = min(window_start + step, dt_end)
+            windows.append((window_start.strftime('%Y-%m-%d'), window_end.strftime('%Y-%m-%d'), None, None))
+            if window_end >= dt_end:
+                return windows
+            window_start = window_end
+
+    elif start_timestamp and end_timestamp:
+        step = max_days * 86400
+
+        windows = []
+        window_start = int(start_timestamp)
+        while True:
+            window_end = min(window_start + step, int(end_timestamp))
+            windows.append((None, None, window_start, window_end))
+            if window_end >= int(end_timestamp):
+                return windows
+            window_start = window_end
+
+    # Handle case where neither date nor timestamp ranges are provided
+    return [(None, None, None, None)]
+
+
+def is_error_data(data):
+    """True for error bodies, both the API's own and the ones built by `handle_response`."""
+    if not isinstance(data, dict) or 'error' in data:
+        return True
+    status = data.get('Status')
+    return status == 'Error' or (isinstance(status, int) and status >= 400)
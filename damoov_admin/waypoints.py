@@ -0,0 +1,205 @@
+# waypoints.py
+import math
+import re
+import sys
+from array import array
+from operator import itemgetter
+from datetime import datetime, timedelta
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+# Timestamp layouts that format back to the same string, longest first
+_DATE_FORMATS = (
+    (re.compile(r'\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d\.\d{6}'), 'microseconds'),
+    (re.compile(r'\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d\.\d{3}'), 'milliseconds'),
+    (re.compile(r'\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d'), 'seconds'),
+)
+_OFFSET = re.compile(r'[+-]\d\d:\d\d')
+
+# Column kinds
+_INT = 'int'
+_FLOAT = 'float'
+_BOOL = 'bool'
+_DATE = 'date'
+_OBJECT = 'object'
+
+
+class Waypoints:
+    """
+    A trip's waypoints stored column by column in contiguous typed arrays.
+
+    Numeric fields are kept in `array('d')` / `array('q')`, and ISO timestamps as
+    int64 microseconds, instead of one dict per point. That takes roughly a tenth of
+    the memory. Fields that cannot be stored compactly (free text, nested objects)
+    keep their values in a list.
+
+    Indexing and iterating build the original dicts on demand, so code written for a
+    list of dicts keeps working. Slicing returns a view over the same arrays without
+    copying. `column(name)` returns a field's values as a memoryview, and `to_numpy(name)`
+    as a NumPy array sharing that memory.
+    """
+
+    __slots__ = ('_columns', '_range')
+
+    def __init__(self, columns, index_range=None):
+        # columns: field name -> (kind, storage, extra), where extra is the date format (suffix, timespec)
+        self._columns = columns
+        if index_range is None:
+            lengths = {len(storage) for _, storage, _ in columns.values()}
+            index_range = range(lengths.pop() if lengths else 0)
+        self._range = index_range
+
+    @classmethod
+    def from_dicts(cls, points):
+        names = {}
+        for point in points:
+            for name in point:
+                names[name] = None
+        columns = {}
+        for name in names:
+            try:
+                values = list(map(itemgetter(name), points))
+            except KeyError:
+                values = [point.get(name) for point in points]
+            columns[name] = _encode(values)
+        return cls(columns)
+
+    @property
+    def fields(self):
+        return list(self._columns)
+
+    @property
+    def date_fields(self):
+        """Fields stored as timestamps."""
+        return [name for name, (kind, _, _) in self._columns.items() if kind == _DATE]
+
+    def __len__(self):
+        return len(self._range)
+
+    def __bool__(self):
+        return len(self._range) > 0
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return Waypoints(self._columns, self._range[index])
+        position = self._range[index]
+        return {name: _decode_value(kind, storage[position], extra)
+                for name, (kind, storage, extra) in self._columns.items()}
+
+    def __iter__(self):
+        for i in range(len(self._range)):
+            yield self[i]
+
+    def __eq__(self, other):
+        if isinstance(other, Waypoints):
+            other = other.to_list()
+        if isinstance(other, list):
+            return self.to_list() == other
+        return NotImplemented
+
+    def __repr__(self):
+        return f"Waypoints({len(self)} points, fields={self.fields})"
+
+    def to_list(self):
+        return list(self)
+
+    def column(self, name):
+        """
+        The values of one field. Numeric and date fields come back as a memoryview
+        over the underlying array (dates in microseconds since 1970-01-01 in the
+        timestamps' own timezone); other fields as a list.
+        """
+        kind, storage, extra = self._columns[name]
+        start, stop, step = self._range.start, self._range.stop, self._range.step
+        if kind == _OBJECT:
+            return storage[start:stop:step] if stop >= 0 else storage[start::step]
+        view = memoryview(storage)
+        return view[start:stop:step] if stop >= 0 else view[start::step]
+
+    def to_numpy(self, name):
+        """A field as a NumPy array sharing the waypoints' memory (dates as datetime64[us])."""
+        import numpy as np
+
+        kind, storage, extra = self._columns[name]
+        if kind == _OBJECT:
+            return np.array(self.column(name), dtype=object)
+        values = np.frombuffer(storage, dtype={_INT: np.int64, _FLOAT: np.float64, _BOOL: np.int8, _DATE: np.int64}[kind])
+        values = values[self._range.start:self._range.stop if self._range.stop >= 0 else None:self._range.step]
+        if kind == _DATE:
+            return values.view('datetime64[us]')
+        if kind == _BOOL:
+            return values.view(np.bool_)
+        return values
+
+    @property
+    def nbytes(self):
+        """Approximate memory held by the underlying columns."""
+        total = 0
+        for kind, storage, _ in self._columns.values():
+            if kind == _OBJECT:
+                total += 8 * len(storage) + sum(_object_size(value) for value in storage)
+            else:
+                total += storage.itemsize * len(storage)
+        return total
+
+
+def _object_size(value):
+    return sys.getsizeof(value) if value is not None else 0
+
+
+def _encode(values):
+    types = set(map(type, values))
+    if types <= {int, float, type(None)}:
+        if types == {int}:
+            try:
+                return _INT, array('q', values), None
+            except OverflowError:
+                return _OBJECT, list(values), None
+        if type(None) in types:
+            # JSON has no NaN, so NaN marks a missing value
+            values = [math.nan if value is None else value for value in values]
+        return _FLOAT, array('d', values), None
+    if types == {bool}:
+        return _BOOL, array('b', values), None
+    if types == {str}:
+        encoded = _encode_dates(values)
+        if encoded is not None:
+            return encoded
+    return _OBJECT, list(values), None
+
+
+def _encode_dates(values):
+    """Stores ISO timestamps as microseconds if all of them share one exact format."""
+    first = values[0]
+    for pattern, timespec in _DATE_FORMATS:
+        match = pattern.match(first)
+        if match is not None:
+            break
+    else:
+        return None
+    size = match.end()
+    suffix = first[size:]
+    if not (suffix in ('', 'Z') or _OFFSET.fullmatch(suffix)):
+        return None
+    if set(map(len, values)) != {len(first)} or not all(map(pattern.match, values)):
+        return None
+    if suffix and set(value[size:] for value in values) != {suffix}:
+        return None
+    if suffix:
+        values = [value[:size] for value in values]
+    try:
+        micros = array('q', [(parsed - _EPOCH) // _MICROSECOND for parsed in map(datetime.fromisoformat, values)])
+    except ValueError:
+        return None
+    return _DATE, micros, (suffix, timespec)
+
+
+def _decode_value(kind, value, extra):
+    if kind == _FLOAT:
+        return None if value != value else value
+    if kind == _DATE:
+        suffix, timespec = extra
+        return (_EPOCH + value * _MICROSECOND).isoformat(timespec=timespec) + suffix
+    if kind == _BOOL:
+        return bool(value)
+    return value
@@ -11,8 +11,13 @@ setup(
     packages=find_packages(),
     install_requires=[
         "requests",
-        "sentry_sdk"
     ],
+    extras_require={
+        "async": ["aiohttp"],
+        "sentry": ["sentry_sdk"],
+        "numpy": ["numpy"],
+        "fast": ["orjson"],
+    },
     author="Damoov",
     author_email="admin@damoov.com",
     description="SDK for Damoov's APIs",
@@ -0,0 +1,30 @@
+# tests/conftest.py
+import pytest
+
+from damoov_admin.auth import TelematicsAuth
+from damoov_admin.retry import RetryPolicy
+from damoov_admin.testing import MockAPI, patch_urls
+
+START, END = '2024-01-01', '2024-01-14'
+LONG_END = '2024-03-31'
+
+
+@pytest.fixture
+def api():
+    with MockAPI() as api, patch_urls(api.url):
+        yield api
+
+
+@pytest.fixture
+def auth(api):
+    auth = TelematicsAuth('test@example.com', 'secret', retry_policy=RetryPolicy(backoff=0.001, max_backoff=0.01))
+    yield auth
+    auth.transport.close()
+
+
+@pytest.fixture
+def logged_in(api, auth):
+    """The auth client after its first login, with the mock's counters cleared."""
+    auth.get_access_token()
+    api.reset_counts()
+    return auth
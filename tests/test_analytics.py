@@ -0,0 +1,97 @@
+# tests/test_analytics.py
+import math
+
+import numpy as np
+import pytest
+
+from damoov_admin import analytics
+from damoov_admin.trips import TripsResponse
+from damoov_admin.waypoints import Waypoints
+
+# 0.01 degrees of longitude along the equator
+STEP_KM = analytics.EARTH_RADIUS_KM * math.radians(0.01)
+
+
+def point(seconds, lon, speed, lat=0.0):
+    return {'Latitude': lat, 'Longitude': lon, 'Speed': speed,
+            'PointDate': f'2024-01-01T08:{seconds // 60:02d}:{seconds % 60:02d}'}
+
+
+# Drives two steps east in two minutes, then waits three minutes
+TRIP = [point(0, 0.0, 0.0), point(60, 0.01, 50.0), point(120, 0.02, 120.0), point(180, 0.02, 0.0),
+        point(300, 0.02, 1.0)]
+
+
+def test_track_from_dicts_waypoints_and_responses():
+    from_dicts = analytics.track(TRIP)
+    from_waypoints = analytics.track(Waypoints.from_dicts(TRIP))
+    from_response = analytics.track(TripsResponse({'Result': {'Trip': {'Waypoints': TRIP}}}))
+
+    for trip in (from_dicts, from_waypoints, from_response):
+        assert trip.time.tolist() == [trip.time[0] + offset for offset in (0, 60, 120, 180, 300)]
+        assert trip.lon.tolist() == [0.0, 0.01, 0.02, 0.02, 0.02]
+        assert trip.speed.tolist() == [0.0, 50.0, 120.0, 0.0, 1.0]
+    assert from_dicts.duration == 300
+    assert len(analytics.track([])) == 0
+    with pytest.raises(ValueError):
+        analytics.track([{'Latitude': 0.0, 'Longitude': 0.0}])
+
+
+def test_distances_and_derived_speeds():
+    assert analytics.haversine(0, 0, 0, 0.01) == pytest.approx(STEP_KM)
+    assert analytics.segment_distances(TRIP) == pytest.approx([STEP_KM, STEP_KM, 0, 0])
+    assert analytics.distance(TRIP) == pytest.approx(2 * STEP_KM)
+    assert analytics.derived_speeds(TRIP) == pytest.approx([STEP_KM * 60, STEP_KM * 60, 0, 0])
+    assert analytics.bounding_box(TRIP) == (0.0, 0.0, 0.0, 0.02)
+
+
+def test_speeding_and_idle_segments():
+    assert analytics.speeding_segments(TRIP, limit=100, min_duration=0) == [(2, 2)]
+    assert analytics.speeding_segments(TRIP, limit=40, min_duration=60) == [(1, 2)]
+    assert analytics.speeding_segments(TRIP, limit=40, min_duration=61) == []
+    assert analytics.idle_segments(TRIP, max_speed=2, min_duration=60) == [(3, 4)]
+
+
+def test_segments_without_a_speed_field_use_derived_speeds():
+    no_speed = [{key: value for key, value in p.items() if key != 'Speed'} for p in TRIP]
+
+    assert analytics.idle_segments(no_speed, max_speed=2, min_duration=60) == [(2, 4)]
+
+
+def test_resample_interpolates_positions_and_speeds():
+    trip = analytics.resample(TRIP, interval=30)
+
+    assert len(trip) == 11
+    assert trip.lon[1] == pytest.approx(0.005)
+    assert trip.speed[1] == pytest.approx(25.0)
+    assert trip.lon[-1] == 0.02
+
+
+def test_simplify_drops_points_within_tolerance():
+    # The middle point is about 1.1 km north of the straight line
+    detour = [point(0, 0.0, 10.0), point(60, 0.01, 10.0, lat=0.01), point(120, 0.02, 10.0)]
+
+    assert analytics.simplify(detour, tolerance=1.0).tolist() == [0, 1, 2]
+    assert analytics.simplify(detour, tolerance=1.2).tolist() == [0, 2]
+    # Every point of TRIP lies on the line between its ends
+    assert analytics.simplify(TRIP, tolerance=0.001).tolist() == [0, 4]
+
+
+def test_summarize_matches_the_hand_computed_trip():
+    shorter = TRIP[:3]
+
+    summary = analytics.summarize([TRIP, [], shorter], speed_limit=100)
+
+    assert summary['distance_km'][0] == pytest.approx(2 * STEP_KM)
+    assert summary['duration_s'][0] == 300
+    assert summary['max_speed'][0] == 120
+    assert summary['mean_speed'][0] == pytest.approx(171 / 5)
+    # Idle from 0 to 60 s and from 180 to 300 s; speeding from 120 to 180 s
+    assert summary['idle_s'][0] == 180
+    assert summary['speeding_s'][0] == 60
+    assert (summary['min_lon'][0], summary['max_lon'][0]) == (0.0, 0.02)
+    assert all(np.isnan(values[1]) for values in summary.values())
+    # The gap between the first trip's end and the next trip's start is not counted
+    assert summary['distance_km'][2] == pytest.approx(2 * STEP_KM)
+    assert summary['duration_s'][2] == 120
+    assert summary['idle_s'][2] == 60
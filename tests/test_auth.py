@@ -0,0 +1,68 @@
+# tests/test_auth.py
+import logging
+import threading
+import time
+
+from requests.exceptions import ConnectionError
+
+from damoov_admin.auth import TelematicsAuth
+
+
+def failing_auth(monkeypatch):
+    auth = TelematicsAuth('test@example.com', 'secret')
+
+    def get_access_token():
+        raise ConnectionError('API unreachable')
+
+    monkeypatch.setattr(auth, 'get_access_token', get_access_token)
+    return auth
+
+
+def test_failed_background_refresh_backs_off_and_logs(monkeypatch, caplog, capsys):
+    auth = failing_auth(monkeypatch)
+
+    with caplog.at_level(logging.DEBUG, logger='damoov_admin.auth'):
+        backoffs = []
+        for _ in range(6):
+            auth._auto_refresh_tick()
+            backoffs.append(round(auth._refresh_retry_at - time.time()))
+
+    assert backoffs == [15, 30, 60, 120, 240, 300]
+    assert [record.levelno for record in caplog.records] == [logging.WARNING] + [logging.DEBUG] * 5
+    assert 'API unreachable' in caplog.records[0].getMessage()
+    assert capsys.readouterr().out == ''
+
+
+def test_successful_background_refresh_resets_the_backoff(monkeypatch, caplog):
+    auth = failing_auth(monkeypatch)
+    auth._auto_refresh_tick()
+    monkeypatch.setattr(auth, 'get_access_token', lambda: 'token')
+
+    auth._auto_refresh_tick()
+    monkeypatch.setattr(auth, 'get_access_token', failing_auth(monkeypatch).get_access_token)
+    caplog.clear()
+    with caplog.at_level(logging.WARNING, logger='damoov_admin.auth'):
+        auth._auto_refresh_tick()
+
+    assert auth._auto_refresh_failures == 1
+    assert len(caplog.records) == 1
+
+
+def test_expiring_token_is_refreshed_once_for_all_threads(api):
+    api.configure(token_ttl=30)
+    auth = TelematicsAuth('test@example.com', 'secret')
+    first = auth.get_access_token()
+    api.configure(token_ttl=3600)
+    api.reset_counts()
+
+    # The 30s token is inside the 60s refresh margin, so the next call refreshes it
+    tokens = []
+    threads = [threading.Thread(target=lambda: tokens.append(auth.get_access_token())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert api.counts['refresh'] == 1
+    assert api.counts['login'] == 0
+    assert len(set(tokens)) == 1 and tokens[0] != first
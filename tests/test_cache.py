@@ -0,0 +1,114 @@
+# tests/test_cache.py
+import datetime
+
+import pytest
+
+from damoov_admin.auth import TelematicsAuth
+from damoov_admin.cache import ResponseCache
+from damoov_admin.retry import RetryPolicy
+from damoov_admin.statistics import Statistics
+
+from conftest import START, END
+
+URL = 'https://api.example.com/indicators/admin/v2/Statistics'
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_entries_expire_after_their_ttl():
+    clock = FakeClock()
+    cache = ResponseCache(ttl=10, clock=clock)
+    cache.set('a', 1)
+    cache.set('b', 2, ttl=30)
+
+    clock.now += 9.9
+    assert cache.get('a') == 1
+    clock.now += 0.1
+    assert cache.get('a') is None
+    assert cache.get('b') == 2
+    assert len(cache) == 1
+
+
+def test_zero_ttl_is_not_stored():
+    cache = ResponseCache()
+    cache.set('a', 1, ttl=0)
+
+    assert cache.get('a') is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResponseCache(maxsize=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+
+    assert cache.get('b') is None
+    assert (cache.get('a'), cache.get('c')) == (1, 3)
+    assert cache.stats()['evictions'] == 1
+
+
+def test_stats_count_hits_and_misses():
+    cache = ResponseCache()
+    cache.set('a', 1)
+    cache.get('a')
+    cache.get('a')
+    cache.get('b')
+
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['size']) == (2, 1, 1)
+    assert stats['hit_rate'] == pytest.approx(2 / 3)
+
+
+def test_key_ignores_parameter_and_field_order():
+    make_key = ResponseCache.make_key
+
+    assert make_key('GET', URL + '?b=2&a=1') == make_key('GET', URL + '?a=1&b=2')
+    assert make_key('POST', URL, {'x': 1, 'y': 2}) == make_key('POST', URL, {'y': 2, 'x': 1})
+    assert make_key('GET', URL + '?a=1', identity='one') != make_key('GET', URL + '?a=1', identity='two')
+    assert make_key('GET', URL + '?a=1') != make_key('POST', URL + '?a=1')
+
+
+def test_longest_endpoint_match_and_closed_periods_set_the_ttl():
+    cache = ResponseCache(ttl=60, endpoint_ttls={'Statistics': 120, 'Statistics/dates': 600}, closed_ttl=3600)
+    today = datetime.datetime.now(datetime.timezone.utc).date()
+
+    assert cache.ttl_for(URL + f'?EndDate={today}') == 120
+    assert cache.ttl_for(URL + f'/dates?EndDate={today}') == 600
+    assert cache.ttl_for(URL + '?EndDate=2024-01-14') == 3600
+    assert cache.ttl_for(URL.replace('Statistics', 'Trips'), {'EndDate': '2024-01-14T00:00:00'}) == 3600
+    assert cache.ttl_for(URL.replace('Statistics', 'Trips'), {'EndDateTimestampSec': 1705190400}) == 3600
+    assert cache.ttl_for(URL + '?EndDate=not-a-date') == 120
+
+
+def test_repeated_reads_are_served_from_the_cache(api):
+    cache = ResponseCache()
+    auth = TelematicsAuth('test@example.com', 'secret', cache=cache)
+    statistics = Statistics(auth)
+
+    first = statistics.user_accumulated_statistics('user1', START, END)
+    second = statistics.user_accumulated_statistics('user1', START, END)
+
+    assert api.counts['statistics'] == 1
+    assert second.data == first.data
+    assert cache.stats()['hits'] == 1
+    auth.transport.close()
+
+
+def test_failed_reads_are_not_cached(api):
+    cache = ResponseCache()
+    auth = TelematicsAuth('test@example.com', 'secret', cache=cache, retry_policy=RetryPolicy(max_retries=0))
+    api.fail_next(500, endpoint='statistics')
+
+    Statistics(auth).user_accumulated_statistics('user1', START, END)
+    Statistics(auth).user_accumulated_statistics('user1', START, END)
+
+    assert api.counts['statistics'] == 2
+    auth.transport.close()
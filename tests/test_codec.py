@@ -0,0 +1,112 @@
+# tests/test_codec.py
+import json
+import sys
+
+import pytest
+
+from damoov_admin import codec
+from damoov_admin.models import StatisticsRow, Trip
+from damoov_admin.statistics import StatisticsResponse
+from damoov_admin.trips import TripsResponse
+from damoov_admin.waypoints import Waypoints
+
+TRIP = {
+    'Id': 'trip-1',
+    'Data': {'UserId': 'user1', 'StartDate': '2024-01-01T08:00:00', 'Tags': ['work'], 'Unlisted': 1},
+    'Statistics': {'Mileage': 12.5, 'DurationMinutes': 20, 'MaxSpeed': 88.0},
+    'Scores': {'Safety': 91.0, 'Eco': 77.5},
+    'Events': [{'Type': 'Braking'}],
+    'Waypoints': [{'Latitude': 52.0, 'Longitude': 4.0, 'Speed': 10.0, 'PointDate': '2024-01-01T08:00:00'}],
+    'Custom': {'a': 1},
+}
+
+
+class FakeResponse:
+    def __init__(self, content):
+        self.content = content
+
+    def json(self):
+        return json.loads(self.content.decode('latin-1'))
+
+
+@pytest.fixture(autouse=True)
+def restore_backend():
+    saved = codec._backend, codec._loads
+    yield
+    codec._backend, codec._loads = saved
+
+
+def test_default_backend_is_the_first_installed():
+    codec._backend = codec._loads = None
+    installed = []
+    for name in codec.BACKENDS:
+        try:
+            codec._load(name)
+            installed.append(name)
+        except ImportError:
+            pass
+
+    assert codec.backend() == installed[0]
+
+
+def test_custom_and_named_backends():
+    calls = []
+
+    def tracing_loads(data):
+        calls.append(data)
+        return json.loads(data)
+
+    assert codec.use_backend(tracing_loads) == 'tracing_loads'
+    assert codec.loads(b'{"a": 1}') == {'a': 1}
+    assert calls == [b'{"a": 1}']
+    assert codec.use_backend('json') == 'json'
+    with pytest.raises(ValueError):
+        codec.use_backend('yaml')
+
+
+def test_missing_named_backend_raises(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'msgspec', None)
+
+    with pytest.raises(ImportError):
+        codec.use_backend('msgspec')
+
+
+@pytest.mark.parametrize('name', codec.BACKENDS)
+def test_backends_decode_alike(name):
+    try:
+        codec.use_backend(name)
+    except ImportError:
+        pytest.skip(f'{name} is not installed')
+    body = json.dumps({'Result': TRIP}).encode()
+
+    assert codec.decode(FakeResponse(body)) == {'Result': TRIP}
+    # Not UTF-8: falls back to the response's own decoding
+    assert codec.decode(FakeResponse('{"Title": "caf\xe9"}'.encode('latin-1'))) == {'Title': 'caf\xe9'}
+
+
+def test_trip_model_fields_nesting_and_round_trip():
+    model = Trip.from_dict(TRIP)
+
+    assert model.id == 'trip-1'
+    assert model.data.user_id == 'user1' and model.data.tags == ['work']
+    assert model.statistics.mileage == 12.5 and model.statistics.brakings_count is None
+    assert model.scores.eco == 77.5
+    assert model.extra == {'Custom': {'a': 1}}
+    assert model.data.extra == {'Unlisted': 1}
+    assert model.to_dict() == TRIP
+    assert Trip.from_dict(TRIP) == model
+    with pytest.raises(AttributeError):
+        model.not_a_field = 1
+
+
+def test_response_models_are_built_from_the_response_data():
+    details = TripsResponse({'Result': {'Trip': TRIP}})
+    listing = TripsResponse({'Result': {'Trips': [TRIP, 'not a trip', dict(TRIP, Id='trip-2')]}})
+    daily = StatisticsResponse({'Result': [{'ReportDate': '2024-01-01', 'MileageKm': 3.5, 'TripsCount': 2}]})
+
+    assert isinstance(details.trip_model.waypoints, Waypoints)
+    assert details.trip_model is details.trip_model
+    assert [trip.id for trip in listing.trip_models] == ['trip-1', 'trip-2']
+    assert daily.rows == [StatisticsRow.from_dict(daily.result[0])]
+    assert daily.rows[0].mileage_km == 3.5
+    assert TripsResponse({'Result': {}}).trip_model is None
@@ -0,0 +1,67 @@
+# tests/test_columnar.py
+import numpy as np
+
+from damoov_admin.columnar import ColumnTable, columns_to_records, rows_to_columns
+from damoov_admin.statistics import Statistics, StatisticsResponse
+
+from conftest import START, END
+
+ROWS = [
+    {'ReportDate': '2024-01-01T00:00:00', 'MileageKm': 10.5, 'TripsCount': 2, 'Tag': 'work'},
+    {'ReportDate': '2024-01-02T00:00:00', 'MileageKm': None, 'TripsCount': 1},
+    {'ReportDate': '2024-01-03T01:00:00+01:00', 'MileageKm': 4.0, 'TripsCount': 0, 'Tag': None, 'Note': 'x'},
+]
+
+
+def test_rows_become_typed_columns():
+    columns = rows_to_columns(ROWS)
+
+    assert list(columns) == ['ReportDate', 'MileageKm', 'TripsCount', 'Tag', 'Note']
+    assert columns['ReportDate'].dtype == np.dtype('datetime64[ms]')
+    # Timezone offsets are converted to UTC
+    assert columns['ReportDate'][2] == np.datetime64('2024-01-03T00:00:00')
+    assert columns['MileageKm'].dtype == np.float64 and np.isnan(columns['MileageKm'][1])
+    assert columns['TripsCount'].tolist() == [2.0, 1.0, 0.0]
+    assert columns['Tag'].dtype == object and columns['Tag'].tolist() == ['work', None, None]
+
+
+def test_unparseable_dates_stay_objects():
+    columns = rows_to_columns([{'StartDate': 'yesterday'}, {'StartDate': None}])
+
+    assert columns['StartDate'].dtype == object
+    assert rows_to_columns([{'StartDate': None}])['StartDate'].dtype == np.float64
+
+
+def test_columns_pack_into_a_structured_array():
+    records = columns_to_records(rows_to_columns(ROWS[:2]))
+
+    assert records['TripsCount'].sum() == 3
+    assert records[0]['Tag'] == 'work'
+    assert len(columns_to_records({})) == 0
+
+
+def test_table_aggregates_per_user():
+    table = ColumnTable.from_rows([('user1', ROWS), ('user2', []), ('user3', ROWS[:1])])
+
+    assert table.users.tolist() == ['user1', 'user2', 'user3']
+    assert len(table) == 4 and 'MileageKm' in table
+    assert table.sum('MileageKm').tolist() == [14.5, 0.0, 10.5]
+    assert table.count('MileageKm').tolist() == [2, 0, 1]
+    mean = table.mean('MileageKm')
+    assert mean[0] == 7.25 and np.isnan(mean[1]) and mean[2] == 10.5
+
+
+def test_responses_to_columns_and_bulk_tables(api, logged_in):
+    statistics = Statistics(logged_in)
+    response = statistics.user_daily_statistics('user1', START, END)
+    results = statistics.bulk('user_daily_statistics', ['user1', 'user2'], START, END)
+    results['missing'] = StatisticsResponse({'Status': 404, 'Result': None})
+
+    columns = response.to_columns()
+    table = StatisticsResponse.concat_columns(results)
+
+    assert len(columns['ReportDate']) == 14
+    assert response.to_arrays()['MileageKm'].sum() == np.nansum(columns['MileageKm'])
+    assert table.users.tolist() == ['user1', 'user2', 'missing']
+    assert table.count('MileageKm').tolist()[2] == 0
+    assert table.sum('MileageKm')[0] == np.nansum(columns['MileageKm'])
@@ -0,0 +1,104 @@
+# tests/test_deadline.py
+import asyncio
+import inspect
+
+import pytest
+
+from damoov_admin.deadline import Deadline, DeadlineExceeded
+from damoov_admin.engagement import Engagement
+from damoov_admin.statistics import Statistics
+from damoov_admin.trips import Trips
+from damoov_admin.users import Users
+
+from conftest import START, END, LONG_END
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def public_methods(cls):
+    return [name for name, member in inspect.getmembers(cls, inspect.isfunction)
+            if not name.startswith('_') and member.__module__ == cls.__module__]
+
+
+def test_of_accepts_seconds_deadlines_and_none():
+    deadline = Deadline(5)
+
+    assert Deadline.of(None) is None
+    assert Deadline.of(deadline) is deadline
+    assert Deadline.of(2).seconds == 2
+
+
+def test_remaining_check_and_cap():
+    clock = FakeClock()
+    deadline = Deadline(10, clock=clock)
+
+    assert deadline.cap((5, 60)) == (5, 10)
+    assert deadline.cap(None) == 10
+    clock.now += 8
+    assert deadline.remaining() == 2
+    assert deadline.cap(30) == 2
+    with pytest.raises(DeadlineExceeded):
+        deadline.check(wait=3)
+    clock.now += 2
+    assert deadline.remaining() == 0
+    with pytest.raises(DeadlineExceeded):
+        deadline.cap((5, 60))
+
+
+@pytest.mark.parametrize('cls', [Statistics, Trips, Users, Engagement])
+def test_every_public_method_takes_a_deadline(cls):
+    missing = [name for name in public_methods(cls)
+               if not name.startswith('bulk') and 'deadline' not in inspect.signature(getattr(cls, name)).parameters]
+
+    assert missing == []
+
+
+def test_windows_share_one_deadline(api, logged_in):
+    api.configure(latency=0.1)
+    statistics = Statistics(logged_in)
+
+    # Within bulk, the seven windows are fetched one after another: 0.7s in total
+    result, = statistics.bulk('user_daily_statistics', ['user1'], START, LONG_END, deadline=0.35).values()
+
+    assert isinstance(result.error, DeadlineExceeded)
+    assert len(statistics.user_daily_statistics('user1', START, LONG_END, deadline=5).result) == 91
+
+
+def test_statistics_deadline_bounds_retries(api, logged_in):
+    api.configure(latency=0.1)
+    api.fail_next(503, count=10, endpoint='statistics')
+
+    with pytest.raises(DeadlineExceeded):
+        Statistics(logged_in).user_accumulated_statistics('user1', START, END, deadline=0.25)
+    assert api.statuses[503] <= 3
+
+
+def test_engagement_and_users_take_a_deadline(api, logged_in):
+    api.configure(latency=0.2)
+
+    with pytest.raises(DeadlineExceeded):
+        Engagement(logged_in).get_general_leaderboard('user1', deadline=0.05)
+    with pytest.raises(DeadlineExceeded):
+        Users(logged_in).delete_user('user1', deadline=0.05)
+
+
+def test_async_statistics_deadline_and_scalar_transport_timeout(api):
+    pytest.importorskip('aiohttp')
+    from damoov_admin.aio import AsyncStatistics, AsyncTelematicsAuth, AsyncTransport
+
+    async def fetch():
+        async with AsyncTelematicsAuth('test@example.com', 'secret', transport=AsyncTransport(timeout=5)) as auth:
+            statistics = AsyncStatistics(auth)
+            response = await statistics.user_daily_statistics('user1', START, LONG_END, deadline=5)
+            api.configure(latency=0.2)
+            with pytest.raises(DeadlineExceeded):
+                await statistics.user_daily_statistics('user1', START, LONG_END, deadline=0.1)
+            return response
+
+    assert len(asyncio.run(fetch()).result) == 91
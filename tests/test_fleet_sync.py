@@ -0,0 +1,80 @@
+# tests/test_fleet_sync.py
+import pytest
+
+from damoov_admin.fleet_sync import FleetSync, SyncError, WatermarkStore
+
+USERS = ['user1', 'user2', 'user3']
+# The mock API reports LatestTripDate 2024-01-05T10:00:00 and LatestScoringDate 2024-01-05T00:00:00
+LATEST = ('2024-01-05T10:00:00', '2024-01-05T00:00:00')
+
+
+@pytest.fixture
+def store():
+    store = WatermarkStore(':memory:')
+    yield store
+    store.close()
+
+
+def test_store_round_trips_watermarks(store):
+    assert store.get('user1') == (None, None)
+
+    store.set('user1', '2024-01-01', None)
+    store.set('user1', '2024-01-02', '2024-01-03')
+
+    assert store.get_many(['user1', 'user2']) == {'user1': ('2024-01-02', '2024-01-03'), 'user2': (None, None)}
+
+
+def test_window_starts_at_the_watermarks_day(logged_in, store):
+    sync = FleetSync(logged_in, store, initial_days=7)
+
+    assert sync._window(None, '2024-01-05T10:00:00') == ('2023-12-29', '2024-01-06')
+    assert sync._window('2024-01-03T23:00:00', '2024-01-05T10:00:00') == ('2024-01-03', '2024-01-06')
+    assert sync._window('2024-01-05T10:00:00', '2024-01-05T12:00:00+02:00') is None
+    assert sync._window('2024-01-05T10:00:00', None) is None
+
+
+def test_first_run_fetches_everything_and_second_run_nothing(api, logged_in, store):
+    sync = FleetSync(logged_in, store, initial_days=7)
+
+    updates = {update.user_id: update for update in sync.run(USERS)}
+
+    assert sorted(updates) == USERS
+    update = updates['user1']
+    assert update.ok and update.trips_window == ('2023-12-29', '2024-01-06')
+    assert len(update.statistics.result) == 9
+    assert update.trips is not None and update.safety_scores is not None and update.eco_scores is not None
+    assert sync.report == {'checked': 3, 'changed': 3, 'unchanged': 0, 'failed': 0}
+    assert store.get('user2') == LATEST
+
+    api.reset_counts()
+    assert list(sync.run(USERS)) == []
+    assert sync.report['unchanged'] == 3
+    assert set(api.counts) == {'statistics'} and api.counts['statistics'] == 3
+
+
+def test_watermark_advances_only_after_the_update_was_consumed(logged_in, store):
+    sync = FleetSync(logged_in, store, fetch=('statistics',))
+    run = sync.run(USERS)
+
+    first = next(run)
+    assert store.get(first.user_id) == (None, None)
+    second = next(run)
+    assert store.get(first.user_id) == LATEST
+    assert store.get(second.user_id) == (None, None)
+    run.close()
+
+    # The update that was handed out but not finished is fetched again, with the one never reached
+    refetched = sorted(update.user_id for update in sync.run(USERS))
+    assert refetched == sorted(set(USERS) - {first.user_id})
+    assert store.get(second.user_id) == LATEST
+
+
+def test_failed_users_are_reported_and_keep_their_watermark(api, logged_in, store):
+    api.fail_next(500, count=100, endpoint='statistics')
+    sync = FleetSync(logged_in, store)
+
+    update, = sync.run(['user1'])
+
+    assert not update.ok and isinstance(update.error, SyncError)
+    assert sync.report['failed'] == 1
+    assert store.get('user1') == (None, None)
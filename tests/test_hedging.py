@@ -0,0 +1,152 @@
+# tests/test_hedging.py
+import threading
+import time
+
+from damoov_admin.auth import TelematicsAuth
+from damoov_admin.hedging import HedgePolicy
+
+URL = 'https://api.example.com/indicators/admin/v2/Scores/safety?UserId=1'
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, name=None):
+        self.status_code = status_code
+        self.name = name
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class ScriptedTransport:
+    """Answers requests after the delays in `delays`, in order; later requests reuse the last delay."""
+
+    pool_maxsize = 1
+    session = None
+
+    def __init__(self, *delays):
+        self.delays = list(delays)
+        self.sent = []
+        self.threads = []
+        self._lock = threading.Lock()
+
+    def request(self, method, url, **kwargs):
+        with self._lock:
+            index = len(self.sent)
+            delay = self.delays[min(index, len(self.delays) - 1)]
+            response = FakeResponse(name=index)
+            self.sent.append(response)
+            self.threads.append(threading.current_thread())
+        time.sleep(delay)
+        return response
+
+    def close(self):
+        pass
+
+
+def warmed_up(policy, latency=0.01):
+    for _ in range(policy.min_samples):
+        policy.record(URL, latency)
+    return policy
+
+
+def test_no_delay_until_enough_samples():
+    policy = HedgePolicy(min_samples=3, min_delay=0)
+
+    assert policy.delay_for(URL) is None
+    for latency in (0.3, 0.1, 0.2):
+        policy.record(URL, latency)
+
+    assert policy.delay_for(URL) == 0.3
+
+
+def test_delay_is_the_percentile_of_recent_latencies():
+    policy = HedgePolicy(percentile=50, min_samples=4, window=4, min_delay=0)
+    for latency in (9.0, 1.0, 2.0, 3.0, 4.0):
+        policy.record(URL, latency)
+
+    # The oldest sample fell out of the window
+    assert policy.delay_for(URL) == 3.0
+    assert policy.delay_for(URL.replace('safety', 'eco')) is None
+
+
+def test_budget_caps_hedges():
+    policy = HedgePolicy(budget=0.25, min_samples=1)
+    for _ in range(8):
+        policy.delay_for(URL)
+
+    assert [policy.acquire_hedge() for _ in range(3)] == [True, True, False]
+    policy.release_hedge()
+    assert policy.stats()['hedges'] == 1
+
+
+def test_max_in_flight_caps_outstanding_hedges():
+    policy = HedgePolicy(budget=1.0, min_samples=1, max_in_flight=1)
+    for _ in range(4):
+        policy.delay_for(URL)
+
+    assert policy.acquire_hedge()
+    assert not policy.acquire_hedge()
+    policy.finish_hedge()
+    assert policy.acquire_hedge()
+    assert policy.stats()['in_flight'] == 1
+
+
+def test_endpoints_limit_hedging():
+    policy = HedgePolicy(endpoints=('/Scores/safety?',))
+
+    assert policy.applies_to(URL)
+    assert not policy.applies_to(URL.replace('safety', 'eco'))
+
+
+def test_slow_first_copy_is_hedged_and_closed():
+    policy = warmed_up(HedgePolicy(budget=1.0, min_samples=5, min_delay=0))
+    transport = ScriptedTransport(0.5, 0.01)
+    auth = TelematicsAuth('test@example.com', 'secret', transport=transport, hedge_policy=policy)
+
+    response = auth._send('GET', URL, hedge=True)
+
+    assert response.name == 1
+    assert policy.stats()['hedge_wins'] == 1
+    deadline = time.monotonic() + 2
+    while policy.stats()['in_flight'] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert transport.sent[0].closed
+    assert policy.stats()['in_flight'] == 0
+
+
+def test_fast_first_copy_is_not_hedged():
+    policy = warmed_up(HedgePolicy(budget=1.0, min_samples=5, min_delay=0), latency=0.2)
+    transport = ScriptedTransport(0.01)
+    auth = TelematicsAuth('test@example.com', 'secret', transport=transport, hedge_policy=policy)
+
+    assert auth._send('GET', URL, hedge=True).name == 0
+    assert len(transport.sent) == 1
+    assert policy.stats()['hedges'] == 0
+
+
+def test_busy_workers_send_on_the_callers_thread():
+    # pool_maxsize=1 gives two hedge workers for eight callers
+    callers = 8
+    policy = warmed_up(HedgePolicy(budget=1.0, min_samples=5, min_delay=0, max_in_flight=100), latency=0.05)
+    transport = ScriptedTransport(0.1)
+    auth = TelematicsAuth('test@example.com', 'secret', transport=transport, hedge_policy=policy)
+    queued = []
+    barrier = threading.Barrier(callers)
+
+    def call():
+        barrier.wait()
+        auth._send('GET', URL, hedge=True)
+        queued.append(auth._hedge_executor._work_queue.qsize())
+
+    threads = [threading.Thread(target=call) for _ in range(callers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    workers = [thread for thread in transport.threads if thread.name.startswith('damoov-hedge')]
+    assert len(transport.threads) - len(workers) >= callers - 2
+    assert len(workers) <= 2 + policy.stats()['hedges']
+    assert policy.stats()['hedges'] <= 1
+    assert max(queued) == 0
@@ -0,0 +1,128 @@
+# tests/test_metrics.py
+import json
+import threading
+
+from damoov_admin.auth import TelematicsAuth
+from damoov_admin.metrics import MetricsRegistry
+from damoov_admin.retry import RetryPolicy
+from damoov_admin.statistics import Statistics
+
+from conftest import START, END
+
+URL = 'https://api.example.com/trips/get/admin/v1/3f2a9c4e-1b2d-4c5e-8f90-a1b2c3d4e5f6'
+ENDPOINT = '/trips/get/admin/v1/{id}'
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeResponse:
+    def __init__(self, status_code, content=b''):
+        self.status_code = status_code
+        self.content = content
+
+
+def timed(metrics, clock, seconds, method='GET', **outcome):
+    request = metrics.start(method, URL)
+    clock.now += seconds
+    metrics.finish(request, **outcome)
+
+
+def test_latency_histogram_statuses_and_bytes():
+    clock = FakeClock()
+    metrics = MetricsRegistry(buckets=(0.1, 1.0), clock=clock)
+
+    timed(metrics, clock, 0.05, response=FakeResponse(200, b'abcd'))
+    timed(metrics, clock, 0.5, response=FakeResponse(200, b'ab'))
+    timed(metrics, clock, 3.0, method='POST', error=TimeoutError(), body={'a': 1})
+
+    snapshot = metrics.snapshot()
+    get, post = sorted(snapshot['latency'], key=lambda entry: entry['method'])
+    assert get['endpoint'] == ENDPOINT
+    assert get['buckets'] == {'0.1': 1, '1.0': 2, '+Inf': 2}
+    assert (get['count'], get['bytes_received']) == (2, 6)
+    assert abs(get['sum'] - 0.55) < 1e-9
+    assert post['buckets'] == {'0.1': 0, '1.0': 0, '+Inf': 1}
+    assert post['bytes_sent'] == len(b'{"a": 1}')
+    assert sorted((entry['status'], entry['count']) for entry in snapshot['responses']) == [('200', 2), ('error', 1)]
+    assert snapshot['in_flight'] == {ENDPOINT: 0}
+    json.dumps(snapshot)
+
+
+def test_retries_cache_hits_renewals_and_in_flight():
+    metrics = MetricsRegistry()
+    request = metrics.start('GET', URL)
+    metrics.retry(request, 'throttled')
+    metrics.retry(request, 'throttled')
+    metrics.token_renewal('refresh')
+
+    assert metrics.snapshot()['in_flight'] == {ENDPOINT: 1}
+    metrics.finish(metrics.start('GET', URL), FakeResponse(200), cached=True)
+    snapshot = metrics.snapshot()
+    assert snapshot['retries'] == [{'endpoint': ENDPOINT, 'reason': 'throttled', 'count': 2}]
+    assert snapshot['cache_hits'] == {ENDPOINT: 1}
+    assert snapshot['token_renewals'] == {'refresh': 1}
+    assert snapshot['latency'] == []
+
+    metrics.reset()
+    assert metrics.snapshot()['retries'] == []
+    assert metrics.snapshot()['in_flight'] == {ENDPOINT: 1}
+
+
+def test_disabled_registry_records_nothing():
+    metrics = MetricsRegistry()
+    metrics.enabled = False
+
+    request = metrics.start('GET', URL)
+    metrics.finish(request, FakeResponse(200))
+    metrics.token_renewal('login')
+
+    assert request is None
+    assert metrics.snapshot()['in_flight'] == {} and metrics.snapshot()['token_renewals'] == {}
+
+
+def test_prometheus_text_format():
+    clock = FakeClock()
+    metrics = MetricsRegistry(buckets=(0.1,), prefix='app', clock=clock)
+    timed(metrics, clock, 0.05, response=FakeResponse(503))
+
+    text = metrics.prometheus()
+
+    assert '# TYPE app_request_duration_seconds histogram' in text
+    assert f'app_request_duration_seconds_bucket{{endpoint="{ENDPOINT}",method="GET",le="+Inf"}} 1' in text
+    assert f'app_responses_total{{endpoint="{ENDPOINT}",method="GET",status="503"}} 1' in text
+    assert text.endswith('\n')
+
+
+def test_start_reporting_calls_back_until_stopped():
+    metrics = MetricsRegistry()
+    reported = threading.Event()
+
+    metrics.start_reporting(lambda snapshot: reported.set(), interval=0.01)
+    try:
+        assert reported.wait(2)
+    finally:
+        metrics.stop_reporting()
+    assert metrics._report_timer is None
+
+
+def test_auth_client_records_requests_and_retries(api):
+    metrics = MetricsRegistry()
+    auth = TelematicsAuth('test@example.com', 'secret', metrics=metrics,
+                          retry_policy=RetryPolicy(backoff=0.001, max_backoff=0.01))
+    api.fail_next(503, endpoint='statistics')
+
+    Statistics(auth).user_accumulated_statistics('user1', START, END)
+
+    snapshot = metrics.snapshot()
+    assert snapshot['token_renewals'] == {'login': 1}
+    assert {'endpoint': '/indicators/admin/v2/Statistics', 'method': 'GET', 'status': '200', 'count': 1} \
+        in snapshot['responses']
+    assert snapshot['retries'] == [{'endpoint': '/indicators/admin/v2/Statistics', 'reason': 'status', 'count': 1}]
+    assert all(count == 0 for count in snapshot['in_flight'].values())
+    auth.transport.close()
@@ -0,0 +1,137 @@
+# tests/test_mock_api.py
+"""End-to-end tests of the core request paths against `damoov_admin.testing.MockAPI`."""
+import asyncio
+import json
+
+import pytest
+
+from damoov_admin.statistics import Statistics, StatisticsError
+from damoov_admin.trips import Trips
+from damoov_admin.waypoints import Waypoints
+
+from conftest import START, END, LONG_END
+
+
+def test_long_range_is_split_into_windows_and_merged(api, logged_in):
+    response = Statistics(logged_in).user_daily_statistics('user1', START, LONG_END)
+
+    assert api.counts['statistics'] == 7
+    dates = [row['ReportDate'] for row in response.result]
+    assert len(dates) == 91
+    assert len(set(dates)) == len(dates)
+
+
+def test_long_trip_listing_is_split_into_windows(api, logged_in):
+    response = Trips(logged_in).get_list_trips('user1', START, LONG_END)
+
+    assert api.counts['trips'] == 7
+    ids = [trip['Id'] for trip in response.trips]
+    assert len(ids) == 91 * api.trips_per_day
+    assert len(set(ids)) == len(ids)
+
+
+def test_concurrent_pages_match_sequential_paging(api, logged_in):
+    api.configure(trips_per_day=10)
+    trips = Trips(logged_in)
+
+    sequential = trips.get_list_trips('user1', START, END)
+    concurrent = trips.get_list_trips('user1', START, END, page_concurrency=3)
+
+    assert [trip['Id'] for trip in concurrent.trips] == [trip['Id'] for trip in sequential.trips]
+    assert len(sequential.trips) == 14 * 10
+    assert api.counts['trips'] == 2 * 3
+
+
+def test_expired_token_is_refreshed_exactly_once(api, logged_in):
+    api.expire_tokens()
+
+    response = Statistics(logged_in).user_accumulated_statistics('user1', START, END)
+
+    assert response.data['Result']['TripsCount'] == 14 * api.trips_per_day
+    assert api.statuses[401] == 1
+    assert api.counts['refresh'] == 1
+    assert api.counts['login'] == 0
+    assert api.counts['statistics'] == 2
+
+
+@pytest.mark.parametrize('status', [429, 503])
+def test_throttled_and_unavailable_responses_are_retried(api, logged_in, status):
+    api.fail_next(status, endpoint='statistics')
+
+    response = Statistics(logged_in).user_daily_statistics('user1', START, END)
+
+    assert len(response.result) == 14
+    assert api.statuses[status] == 1
+    assert api.counts['statistics'] == 2
+
+
+def test_bulk_reports_error_bodies_as_failures(api, logged_in):
+    api.fail_next(400, endpoint='statistics')
+
+    results = Statistics(logged_in).bulk('user_daily_statistics', ['user1', 'user2', 'user3'], START, END,
+                                         max_workers=1)
+
+    failed = [result for result in results.values() if not result.ok]
+    assert len(failed) == 1
+    assert isinstance(failed[0].error, StatisticsError)
+    assert all(len(result.response.result) == 14 for result in results.values() if result.ok)
+
+
+def test_bulk_does_not_nest_window_pools(api, logged_in):
+    users = [f'user{i}' for i in range(6)]
+
+    results = Statistics(logged_in).bulk('user_daily_statistics', users, START, LONG_END, max_workers=3)
+
+    assert all(result.ok for result in results.values())
+    assert api.counts['statistics'] == len(users) * 7
+
+
+def test_trip_details_stay_json_serializable(api, logged_in):
+    trips = Trips(logged_in)
+    trip_id = trips.get_list_trips('user1', START, END).trips[0]['Id']
+
+    details = trips.get_trip_details(trip_id, 'user1', include_waypoints=True, include_events=True)
+
+    raw = json.loads(json.dumps(details.full_response))
+    assert isinstance(details.waypoints, Waypoints)
+    assert details.waypoints.to_list() == raw['Result']['Trip']['Waypoints']
+    assert len(details.waypoints) == api.waypoints
+
+
+def test_trip_details_many_reports_each_trip(api, logged_in):
+    trips = Trips(logged_in)
+    trip_ids = [trip['Id'] for trip in trips.get_list_trips('user1', START, END).trips][:5]
+    api.reset_counts()
+
+    results = list(trips.get_trip_details_many(trip_ids + trip_ids[:2], 'user1', include_scores=True))
+
+    assert sorted(result.key for result in results) == sorted(trip_ids)
+    assert all(result.ok for result in results)
+    assert api.counts['trip_details'] == len(trip_ids)
+
+
+def test_async_clients_match_sync_results(api, auth):
+    pytest.importorskip('aiohttp')
+    from damoov_admin.aio import AsyncStatistics, AsyncTelematicsAuth, AsyncTrips
+
+    statistics = Statistics(auth).user_daily_statistics('user1', START, LONG_END)
+    trips = Trips(auth).get_list_trips('user1', START, LONG_END)
+
+    async def fetch():
+        async with AsyncTelematicsAuth('test@example.com', 'secret') as async_auth:
+            return await asyncio.gather(
+                AsyncStatistics(async_auth).user_daily_statistics('user1', START, LONG_END),
+                AsyncTrips(async_auth).get_list_trips('user1', START, LONG_END),
+            )
+
+    async_statistics, async_trips = asyncio.run(fetch())
+    assert async_statistics.result == statistics.result
+    assert [trip['Id'] for trip in async_trips.trips] == [trip['Id'] for trip in trips.trips]
+
+
+def test_entity_safety_score_truncates_long_ranges(api, logged_in, capsys):
+    response = Statistics(logged_in).entity_safety_score(START, LONG_END, company_id='company1')
+
+    assert not response.data['Errors']
+    assert 'exceeded the 14-day limit' in capsys.readouterr().out
+    assert api.counts['statistics'] == 1
@@ -0,0 +1,41 @@
+# tests/test_package.py
+import subprocess
+import sys
+
+import pytest
+
+import damoov_admin
+
+
+def run_fresh(code):
+    """Runs `code` in a new interpreter, so nothing is imported beforehand."""
+    return subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout.split()
+
+
+def test_bare_import_loads_no_submodules_or_requests():
+    loaded = run_fresh(
+        "import sys, damoov_admin\n"
+        "print(*sorted(name for name in sys.modules if name.startswith(('damoov_admin.', 'requests'))))"
+    )
+
+    assert loaded == []
+
+
+@pytest.mark.parametrize('name', damoov_admin._SUBMODULES)
+def test_submodules_are_attributes_after_a_bare_import(name):
+    module, = run_fresh(f"import damoov_admin\nprint(damoov_admin.{name}.__name__)")
+
+    assert module == f'damoov_admin.{name}'
+
+
+@pytest.mark.parametrize('name', damoov_admin._LAZY_ATTRIBUTES)
+def test_public_classes_resolve_lazily(name):
+    cls = getattr(damoov_admin, name)
+
+    assert cls.__module__ == f'damoov_admin.{damoov_admin._LAZY_ATTRIBUTES[name]}'
+    assert name in dir(damoov_admin)
+
+
+def test_unknown_attributes_raise():
+    with pytest.raises(AttributeError):
+        damoov_admin.does_not_exist
@@ -0,0 +1,143 @@
+# tests/test_ratelimit.py
+import email.utils
+import time
+
+import pytest
+
+from damoov_admin.auth import TelematicsAuth
+from damoov_admin.ratelimit import RateLimiter, parse_retry_after
+from damoov_admin.retry import RetryPolicy
+from damoov_admin.statistics import Statistics
+
+from conftest import START, END
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def drain(limiter):
+    while limiter.reserve() == 0:
+        pass
+
+
+def test_bucket_allows_a_burst_then_paces_requests():
+    clock = FakeClock()
+    limiter = RateLimiter(rate=4, burst=2, clock=clock)
+
+    assert [limiter.reserve() for _ in range(2)] == [0, 0]
+    assert limiter.reserve() == pytest.approx(0.25)
+    clock.now += 0.25
+    assert limiter.reserve() == 0
+
+
+def test_throttle_multiplies_the_rate_down_once_per_burst():
+    clock = FakeClock()
+    limiter = RateLimiter(rate=10, decrease=0.5, min_rate=2, clock=clock)
+    sent_at = clock.now
+    clock.now += 1
+
+    limiter.on_throttle(sent_at=sent_at)
+    # Sent before the decrease above: part of the same burst
+    limiter.on_throttle(sent_at=sent_at)
+    assert limiter.current_rate == 5
+    assert limiter.stats()['throttled'] == 2
+
+    for _ in range(3):
+        clock.now += 1
+        limiter.on_throttle(sent_at=clock.now)
+    assert limiter.current_rate == 2
+
+
+def test_throttle_without_send_time_waits_for_the_cooldown():
+    clock = FakeClock()
+    limiter = RateLimiter(rate=10, decrease=0.5, cooldown=1.0, clock=clock)
+
+    limiter.on_throttle()
+    limiter.on_throttle()
+    assert limiter.current_rate == 5
+    clock.now += 1
+    limiter.on_throttle()
+    assert limiter.current_rate == 2.5
+
+
+def test_retry_after_pauses_every_caller():
+    clock = FakeClock()
+    limiter = RateLimiter(rate=100, clock=clock)
+
+    limiter.on_throttle(retry_after=3)
+    assert limiter.reserve() == pytest.approx(3)
+    assert limiter.stats()['blocked_for'] == pytest.approx(3)
+    clock.now += 3
+    assert limiter.reserve() == 0
+
+
+def test_rate_grows_only_while_callers_wait():
+    clock = FakeClock()
+    limiter = RateLimiter(rate=4, burst=4, increase=2.0, decrease=0.5, max_rate=6, clock=clock)
+
+    limiter.on_success()
+    assert limiter.current_rate == 4
+
+    # Slow start: +1 per success while the bucket is empty
+    drain(limiter)
+    limiter.on_success()
+    assert limiter.current_rate == 5
+
+    # After a 429: about +increase per second, i.e. increase / rate per success
+    limiter.on_throttle()
+    drain(limiter)
+    limiter.on_success()
+    assert limiter.current_rate == pytest.approx(2.5 + 2 / 2.5)
+    for _ in range(20):
+        drain(limiter)
+        limiter.on_success()
+    assert limiter.current_rate == 6
+
+
+def test_slow_responses_count_as_decrease_signals():
+    limiter = RateLimiter(rate=10, decrease=0.5, latency_target=0.2, clock=FakeClock())
+
+    limiter.on_success(latency=0.1)
+    assert limiter.current_rate == 10
+    limiter.on_success(latency=0.5)
+    assert limiter.current_rate == 5
+
+
+def test_acquire_gives_up_past_its_timeout():
+    limiter = RateLimiter(rate=1, burst=1)
+
+    assert limiter.acquire(timeout=0)
+    assert not limiter.acquire(timeout=0.1)
+
+
+def test_parse_retry_after():
+    in_a_minute = email.utils.formatdate(time.time() + 60, usegmt=True)
+
+    assert parse_retry_after('2') == 2.0
+    assert parse_retry_after('-5') == 0.0
+    assert 58 <= parse_retry_after(in_a_minute) <= 60
+    assert parse_retry_after('') is None
+    assert parse_retry_after('soon') is None
+
+
+def test_429_from_the_api_lowers_the_rate_and_is_retried(api):
+    limiter = RateLimiter(rate=50, decrease=0.5)
+    auth = TelematicsAuth('test@example.com', 'secret', rate_limiter=limiter,
+                          retry_policy=RetryPolicy(backoff=0.001, max_backoff=0.01))
+    auth.get_access_token()
+    api.fail_next(429, endpoint='statistics', retry_after=0.2)
+
+    started = time.monotonic()
+    response = Statistics(auth).user_accumulated_statistics('user1', START, END)
+
+    assert response.data['Status'] == 200
+    assert api.counts['statistics'] == 2
+    assert time.monotonic() - started >= 0.2
+    assert limiter.stats()['throttled'] == 1
+    assert limiter.current_rate < 50
+    auth.transport.close()
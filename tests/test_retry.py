@@ -0,0 +1,109 @@
+# tests/test_retry.py
+import pytest
+
+from damoov_admin.auth import TelematicsAuth
+from damoov_admin.retry import CircuitBreaker, CircuitOpenError, RetryPolicy
+from damoov_admin.statistics import Statistics
+
+from conftest import START, END
+
+URL = 'https://api.example.com/indicators/admin/v2/Statistics'
+OTHER_HOST_URL = 'https://user.example.com/v1/Management/users'
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_delays_are_full_jitter_capped_at_max_backoff():
+    highest = RetryPolicy(backoff=0.5, max_backoff=3, rng=lambda: 1.0)
+    lowest = RetryPolicy(backoff=0.5, max_backoff=3, rng=lambda: 0.0)
+
+    assert [highest.delay(attempt) for attempt in range(1, 6)] == [0.5, 1, 2, 3, 3]
+    assert lowest.delay(4) == 0
+
+
+def test_idempotent_methods():
+    policy = RetryPolicy()
+
+    assert policy.is_idempotent('get') and policy.is_idempotent('DELETE')
+    assert not policy.is_idempotent('POST')
+
+
+def test_auth_retries_only_what_is_safe_to_send_again():
+    auth = TelematicsAuth('test@example.com', 'secret', retry_policy=RetryPolicy(max_retries=2, rng=lambda: 1.0))
+
+    assert auth._retry_delay(1, idempotent=True, status=503) == 0.5
+    assert auth._retry_delay(3, idempotent=True, status=503) is None
+    assert auth._retry_delay(1, idempotent=True, status=404) is None
+    assert auth._retry_delay(1, idempotent=False, status=503) is None
+    assert auth._retry_delay(1, idempotent=False) is None
+    assert auth._retry_delay(1, idempotent=False, connect_failed=True) == 0.5
+
+
+def test_circuit_opens_after_the_threshold_and_fails_fast():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=3, recovery_time=10, clock=clock)
+    for _ in range(2):
+        breaker.record(URL, ok=False)
+    breaker.before_request(URL)
+
+    breaker.record(URL, ok=False)
+    clock.now += 4
+    with pytest.raises(CircuitOpenError) as raised:
+        breaker.before_request(URL)
+    assert raised.value.retry_in == 6
+    assert breaker.state('api.example.com') == CircuitBreaker.OPEN
+    # Each host has its own circuit
+    breaker.before_request(OTHER_HOST_URL)
+
+
+def test_success_resets_the_failure_count():
+    breaker = CircuitBreaker(failure_threshold=2, clock=FakeClock())
+    breaker.record(URL, ok=False)
+    breaker.record(URL, ok=True)
+    breaker.record(URL, ok=False)
+
+    assert breaker.state('api.example.com') == CircuitBreaker.CLOSED
+
+
+@pytest.mark.parametrize('trial_ok, state', [(True, CircuitBreaker.CLOSED), (False, CircuitBreaker.OPEN)])
+def test_half_open_trial_closes_or_reopens_the_circuit(trial_ok, state):
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, recovery_time=10, clock=clock)
+    breaker.record(URL, ok=False)
+    clock.now += 10
+
+    breaker.before_request(URL)
+    assert breaker.state('api.example.com') == CircuitBreaker.HALF_OPEN
+    # Only one trial request at a time
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(URL)
+
+    breaker.record(URL, ok=trial_ok)
+    assert breaker.state('api.example.com') == state
+
+
+def test_open_circuit_stops_requests_to_the_api(api):
+    breaker = CircuitBreaker(failure_threshold=2, recovery_time=60)
+    auth = TelematicsAuth('test@example.com', 'secret', circuit_breaker=breaker,
+                          retry_policy=RetryPolicy(max_retries=1, backoff=0.001))
+    auth.get_access_token()
+    api.fail_next(503, count=2, endpoint='statistics')
+    statistics = Statistics(auth)
+
+    statistics.user_accumulated_statistics('user1', START, END)
+    with pytest.raises(CircuitOpenError):
+        statistics.user_accumulated_statistics('user1', START, END)
+
+    assert api.counts['statistics'] == 2
+    breaker.reset()
+    api.reset_counts()
+    api.fail_next(503, count=1, endpoint='statistics')
+    assert statistics.user_accumulated_statistics('user1', START, END).data['Status'] == 200
+    assert api.counts['statistics'] == 2
+    auth.transport.close()
@@ -0,0 +1,126 @@
+# tests/test_singleflight.py
+import asyncio
+import threading
+
+import pytest
+
+from damoov_admin.auth import TelematicsAuth
+from damoov_admin.deadline import Deadline, DeadlineExceeded
+from damoov_admin.singleflight import SingleFlight
+from damoov_admin.statistics import Statistics
+
+from conftest import START, END
+
+
+def run_together(count, target):
+    barrier = threading.Barrier(count)
+    results = []
+
+    def call():
+        barrier.wait()
+        try:
+            results.append(target())
+        except Exception as exc:
+            results.append(exc)
+
+    threads = [threading.Thread(target=call) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def slow(result, calls, started=None, release=None):
+    def func():
+        calls.append(1)
+        if started is not None:
+            started.set()
+        release.wait(2)
+        if isinstance(result, Exception):
+            raise result
+        return result
+    return func
+
+
+def test_concurrent_callers_share_one_call():
+    flight = SingleFlight()
+    calls = []
+    release = threading.Event()
+    threading.Timer(0.2, release.set).start()
+
+    results = run_together(5, lambda: flight.do('key', slow('value', calls, release=release)))
+
+    assert results == ['value'] * 5
+    assert len(calls) == 1
+    assert flight.stats() == {'in_flight': 0, 'leaders': 1, 'coalesced': 4, 'coalesce_rate': 0.8}
+
+
+def test_waiters_get_the_leaders_exception():
+    flight = SingleFlight()
+    calls = []
+    release = threading.Event()
+    threading.Timer(0.2, release.set).start()
+
+    results = run_together(3, lambda: flight.do('key', slow(ValueError('boom'), calls, release=release)))
+
+    assert len(calls) == 1
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+def test_finished_calls_are_not_reused():
+    flight = SingleFlight()
+
+    assert flight.do('key', lambda: 1) == 1
+    assert flight.do('key', lambda: 2) == 2
+    assert flight.stats()['leaders'] == 2
+
+
+def test_waiter_gives_up_at_its_deadline():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    leader = threading.Thread(target=flight.do, args=('key', slow('value', [], started, release)))
+    leader.start()
+    started.wait(2)
+
+    with pytest.raises(DeadlineExceeded):
+        flight.do('key', lambda: 'own', deadline=Deadline(0.05))
+    release.set()
+    leader.join()
+
+
+def test_async_waiters_share_one_task():
+    flight = SingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return 'value'
+
+    async def main():
+        slow_waiter = flight.do_async('key', fetch, deadline=Deadline(0.001))
+        results = await asyncio.gather(*(flight.do_async('key', fetch) for _ in range(4)), slow_waiter,
+                                       return_exceptions=True)
+        return results
+
+    results = asyncio.run(main())
+
+    assert results[:4] == ['value'] * 4
+    assert isinstance(results[4], DeadlineExceeded)
+    assert len(calls) == 1
+    assert flight.stats()['in_flight'] == 0
+
+
+def test_identical_reads_reach_the_api_once(api):
+    api.configure(latency=0.2)
+    auth = TelematicsAuth('test@example.com', 'secret', single_flight=SingleFlight())
+    auth.get_access_token()
+    api.reset_counts()
+    statistics = Statistics(auth)
+
+    results = run_together(6, lambda: statistics.user_accumulated_statistics('user1', START, END))
+
+    assert api.counts['statistics'] == 1
+    assert len({str(result.data) for result in results}) == 1
+    auth.transport.close()
@@ -0,0 +1,103 @@
+# tests/test_tokens.py
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+from damoov_admin.testing import MockAPI, patch_urls
+from damoov_admin.tokens import TokenStore
+
+fcntl = pytest.importorskip('fcntl')
+
+
+@pytest.fixture
+def store(tmp_path):
+    return TokenStore(str(tmp_path / 'token.json'))
+
+
+def hold_lock(path, seconds):
+    """Holds the token file lock from a separate open file, like another process would."""
+    acquired = threading.Event()
+
+    def hold():
+        with open(path, 'a+') as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            acquired.set()
+            time.sleep(seconds)
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    thread = threading.Thread(target=hold)
+    thread.start()
+    acquired.wait()
+    return thread
+
+
+def test_for_path_returns_one_store_per_file(tmp_path):
+    path = str(tmp_path / 'token.json')
+
+    assert TokenStore.for_path(path) is TokenStore.for_path(path)
+    assert TokenStore.for_path(path) is not TokenStore.for_path(path + '2')
+
+
+def test_write_then_read_round_trips(store):
+    assert store.read() == {}
+
+    store.write({'access_token': 'a', 'refresh_token': 'r'})
+
+    assert store.read() == {'access_token': 'a', 'refresh_token': 'r'}
+    assert TokenStore(store.path).read() == {'access_token': 'a', 'refresh_token': 'r'}
+    assert not [name for name in os.listdir(os.path.dirname(store.path)) if name.endswith('.tmp')]
+
+
+def test_fresh_read_picks_up_another_writer(store):
+    store.write({'access_token': 'old'})
+    TokenStore(store.path).write({'access_token': 'new'})
+
+    assert store.read() == {'access_token': 'old'}
+    assert store.read(fresh=True) == {'access_token': 'new'}
+
+
+def test_write_waits_for_the_lock_but_read_does_not(store):
+    store.write({'access_token': 'old'})
+    holder = hold_lock(store.lock_path, 0.5)
+    writer = threading.Thread(target=store.write, args=({'access_token': 'new'},))
+    writer.start()
+
+    started = time.monotonic()
+    assert store.read(fresh=True) == {'access_token': 'old'}
+    assert time.monotonic() - started < 0.2
+
+    writer.join()
+    holder.join()
+    assert store.read(fresh=True) == {'access_token': 'new'}
+
+
+def test_async_login_does_not_block_the_loop_on_the_lock():
+    pytest.importorskip('aiohttp')
+    from damoov_admin.aio import AsyncTelematicsAuth
+
+    async def login_while_locked():
+        async with AsyncTelematicsAuth('test@example.com', 'secret') as auth:
+            ticks = 0
+
+            async def tick():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.05)
+                    ticks += 1
+
+            ticker = asyncio.ensure_future(tick())
+            holder = hold_lock(auth.token_store.lock_path, 1)
+            token = await auth.get_access_token()
+            ticker.cancel()
+            holder.join()
+            return token, ticks, auth.token_store.read(fresh=True)
+
+    with MockAPI() as api, patch_urls(api.url):
+        token, ticks, stored = asyncio.run(login_while_locked())
+
+    assert token
+    assert ticks >= 10
+    assert stored['access_token'] == token
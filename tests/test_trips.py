@@ -0,0 +1,76 @@
+# tests/test_trips.py
+import json
+
+import pytest
+
+from damoov_admin.trips import LazyTrip, TripDetailsError, Trips, TripsResponse
+
+from conftest import START, END, LONG_END
+
+
+def test_lazy_listing_over_a_long_range_keeps_every_trip(api, logged_in):
+    trips = Trips(logged_in)
+    eager = trips.get_list_trips('user1', START, LONG_END)
+
+    lazy = trips.get_list_trips('user1', START, LONG_END, lazy=True)
+
+    assert all(isinstance(trip, LazyTrip) for trip in lazy.trips)
+    assert [trip['Id'] for trip in lazy.trips] == [trip['Id'] for trip in eager.trips]
+    assert json.loads(json.dumps(lazy.full_response)) == json.loads(json.dumps(eager.full_response))
+
+
+def test_merging_lazy_responses_keeps_lazy_trips(api, logged_in):
+    trips = Trips(logged_in)
+    first = trips.get_list_trips('user1', '2024-01-01', '2024-01-10', lazy=True)
+    second = trips.get_list_trips('user1', '2024-01-10', '2024-01-20', lazy=True)
+
+    merged = TripsResponse.merge([first, second])
+
+    ids = [trip['Id'] for trip in merged.trips]
+    assert len(ids) == len(set(ids)) == 20 * api.trips_per_day
+    assert all(isinstance(trip, LazyTrip) for trip in merged.trips)
+
+
+def test_lazy_trip_fetches_each_part_once(api, logged_in):
+    trip = Trips(logged_in).get_list_trips('user1', START, END, lazy=True).trips[0]
+    api.reset_counts()
+
+    events = trip.events
+    assert trip.events is events
+    assert len(trip.waypoints) == api.waypoints
+    trip.hydrate('events', 'waypoints')
+
+    assert api.counts['trip_details'] == 2
+    assert trip['Events'] == events
+    assert json.loads(json.dumps(trip))['Id'] == trip.id
+
+
+def test_listed_parts_are_not_fetched_again(api, logged_in):
+    trip = Trips(logged_in).get_list_trips('user1', START, END, include_scores=True, lazy=True).trips[0]
+    api.reset_counts()
+
+    assert trip.is_loaded('scores')
+    trip.scores
+
+    assert api.counts['trip_details'] == 0
+
+
+def test_prefetch_batches_missing_parts(api, logged_in):
+    trips = Trips(logged_in)
+    listing = trips.get_list_trips('user1', START, END, lazy=True)
+    api.reset_counts()
+
+    failed = trips.prefetch(listing.trips[:6] + listing.trips[:2], 'scores', max_workers=3)
+
+    assert failed == []
+    assert api.counts['trip_details'] == 6
+    assert all(trip.is_loaded('scores') for trip in listing.trips[:6])
+
+
+def test_failed_hydration_raises(api, logged_in):
+    trip = Trips(logged_in).get_list_trips('user1', START, END, lazy=True).trips[0]
+    api.fail_next(400, endpoint='trip_details')
+
+    with pytest.raises(TripDetailsError):
+        trip.hydrate('events')
+    assert not trip.is_loaded('events')
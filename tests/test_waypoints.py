@@ -0,0 +1,87 @@
+# tests/test_waypoints.py
+import sys
+import tracemalloc
+
+from damoov_admin.trips import Trips
+from damoov_admin.waypoints import Waypoints
+
+from conftest import START, END
+
+POINTS = [
+    {'Latitude': 52.1, 'Longitude': 4.3, 'Speed': 12.5, 'Heading': 90, 'PointDate': '2024-01-01T08:00:00'},
+    {'Latitude': 52.2, 'Longitude': 4.4, 'Speed': 0.0, 'Heading': 180, 'PointDate': '2024-01-01T08:00:01'},
+    {'Latitude': 52.3, 'Longitude': 4.5, 'Speed': 30.25, 'Heading': 270, 'PointDate': '2024-01-01T08:00:02',
+     'Note': {'stop': True}},
+]
+
+
+def test_round_trips_points_with_mixed_fields():
+    waypoints = Waypoints.from_dicts(POINTS)
+
+    assert len(waypoints) == 3
+    assert waypoints.fields == ['Latitude', 'Longitude', 'Speed', 'Heading', 'PointDate', 'Note']
+    assert waypoints.date_fields == ['PointDate']
+    assert waypoints[1]['PointDate'] == '2024-01-01T08:00:01'
+    assert waypoints[0]['Note'] is None
+    assert waypoints.to_list() == [dict(point, Note=point.get('Note')) for point in POINTS]
+
+
+def test_columns_and_slices_share_storage():
+    waypoints = Waypoints.from_dicts(POINTS)
+    tail = waypoints[1:]
+
+    assert list(waypoints.column('Speed')) == [12.5, 0.0, 30.25]
+    assert list(tail.column('Heading')) == [180, 270]
+    assert tail.column('Speed').obj is waypoints.column('Speed').obj
+    assert waypoints[::-1][0]['Latitude'] == 52.3
+    assert tail == waypoints.to_list()[1:]
+
+
+def test_timestamps_in_mixed_layouts_are_kept_as_given():
+    points = [{'PointDate': '2024-01-01T08:00:00'}, {'PointDate': '2024-01-01T08:00:01.250+02:00'}]
+    waypoints = Waypoints.from_dicts(points)
+
+    assert waypoints.to_list() == points
+
+
+def test_takes_far_less_memory_than_dicts():
+    points = [{'Latitude': 52 + i * 1e-5, 'Longitude': 4 + i * 1e-5, 'Speed': float(i % 90),
+               'PointDate': f'2024-01-01T08:{i // 60 % 60:02d}:{i % 60:02d}'} for i in range(5000)]
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    waypoints = Waypoints.from_dicts(points)
+    compact = sum(stat.size_diff for stat in tracemalloc.take_snapshot().compare_to(before, 'filename'))
+    tracemalloc.stop()
+    as_dicts = sum(sys.getsizeof(point) + sum(sys.getsizeof(value) for value in point.values()) for point in points)
+
+    assert len(waypoints) == 5000
+    assert compact * 4 < as_dicts
+
+
+def test_trip_details_many_keeps_compact_waypoints(api, logged_in):
+    trips = Trips(logged_in)
+    trip_ids = [trip['Id'] for trip in trips.get_list_trips('user1', START, END).trips][:3]
+
+    results = list(trips.get_trip_details_many(trip_ids, 'user1', include_waypoints=True, compact_waypoints=True))
+
+    assert all(result.ok for result in results)
+    for result in results:
+        stored = result.response.full_response['Result']['Trip']['Waypoints']
+        assert isinstance(stored, Waypoints)
+        assert result.response.waypoints is stored
+        assert len(stored) == api.waypoints
+
+
+def test_prefetch_and_hydrate_keep_compact_waypoints(api, logged_in):
+    trips = Trips(logged_in)
+    listing = trips.get_list_trips('user1', START, END, lazy=True)
+    first, second = listing.trips[:2]
+
+    assert trips.prefetch([first], 'waypoints', compact_waypoints=True) == []
+    second.hydrate('waypoints', compact_waypoints=True)
+
+    for trip in (first, second):
+        assert isinstance(trip['Waypoints'], Waypoints)
+        assert trip.waypoints is trip['Waypoints']
+    assert str(listing)